@@ -0,0 +1,43 @@
+"""add config notify
+
+Revision ID: 5e1d2c7a9b40
+Revises: 3bac77c8dade
+Create Date: 2026-10-19 10:12:41.902311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1d2c7a9b40'
+down_revision: Union[str, None] = '3bac77c8dade'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # the app caches the service account and LISTENs on config_changed
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_config_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('config_changed', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER config_changed
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON config
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_config_changed()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS config_changed ON config")
+    op.execute("DROP FUNCTION IF EXISTS notify_config_changed()")
@@ -20,4 +20,18 @@ FORBIDDEN_HOUSE = "Access to the specified house is not allowed."
 CONTRACT_DURATION_ERROR = "Contract duration must be at least 1 month"
 ERROR_CREATING_PAYMENT_INSTALLMENT = "Error creating payment installment"
 INSPECTION_NOT_FOUND = "Inspection not found"
-ERROR_UPLOADING_FILE = "Error uploading file"
\ No newline at end of file
+ERROR_UPLOADING_FILE = "Error uploading file"
+DOCUMENT_JOB_NOT_FOUND = "Document job not found"
+DOCUMENT_JOB_NOT_READY = "Document is not ready yet"
+DOCUMENT_CONTRACT_ID_REQUIRED = "contract_id is required for contract documents"
+INVALID_INSPECTION_PHOTO = "Inspection photo is not a valid image"
+RENDERER_WARMING_UP = "PDF renderer is still warming up"
+STORAGE_UPLOAD_TIMEOUT = "Timed out uploading file to storage"
+FILE_NOT_FOUND = "File not found"
+INVALID_PHOTO = "Photo is not a valid image"
+INVALID_UPLOAD_TOKEN = "Upload token is not valid for this file"
+UPLOAD_NOT_FOUND = "Nothing was uploaded with this upload token"
+INVALID_UPLOAD = "Uploaded file does not match the upload token"
+UPLOAD_TOO_LARGE = "Uploaded file is too large"
+UNKNOWN_FIELDS = "Unknown fields requested"
+INVALID_METRICS_TOKEN = "Metrics token is missing or invalid"
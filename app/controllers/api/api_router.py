@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from app.controllers.api import api_messages
 from app.controllers.api.endpoints import (
     auth,
+    health,
     templates,
     users,
     properties,
@@ -15,11 +16,19 @@ from app.controllers.api.endpoints import (
     inspection,
     dashboard,
     report,
+    documents,
+    files,
 )
 
 auth_router = APIRouter()
 auth_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 
+health_router = APIRouter()
+health_router.include_router(health.router, tags=["health"])
+
+files_router = APIRouter()
+files_router.include_router(files.router, tags=["files"])
+
 api_router = APIRouter(
     responses={
         401: {
@@ -57,3 +66,4 @@ api_router.include_router(guarantor.router, tags=["guarantor"])
 api_router.include_router(inspection.router, tags=["inspection"])
 api_router.include_router(dashboard.router, tags=["dashboard"])
 api_router.include_router(report.router, tags=["report"])
+api_router.include_router(documents.router, tags=["documents"])
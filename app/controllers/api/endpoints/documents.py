@@ -0,0 +1,133 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+import app.controllers.api.api_messages as api_messages
+from app.controllers.api import deps
+from app.models.models import Contract, DocumentJob
+from app.models.models import Owner as User
+from app.rendering.jobs import get_document_job_runner
+from app.schemas.map_responses import map_document_job_to_response
+from app.schemas.requests import DocumentJobCreateRequest, DocumentKind
+from app.schemas.responses import DocumentJobResponse, PDFResponse
+
+
+router = APIRouter()
+
+
+@router.post(
+    "/documents/{kind}",
+    response_model=DocumentJobResponse,
+    description="Queue a document to be rendered in the background. "
+    "Poll the returned job until its status is `done`, then download the file. "
+    "Finished jobs and their files are deleted after a week.",
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_document_job(
+    kind: DocumentKind,
+    job_request: DocumentJobCreateRequest | None = None,
+    current_user: User = Depends(deps.get_current_user),
+    session: AsyncSession = Depends(deps.get_session),
+) -> DocumentJobResponse:
+    parametros: dict = {}
+
+    if kind == DocumentKind.contract:
+        if job_request is None or job_request.contract_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=api_messages.DOCUMENT_CONTRACT_ID_REQUIRED,
+            )
+
+        contract = await session.scalar(
+            select(Contract.id).where(
+                Contract.id == job_request.contract_id,
+                Contract.user_id == current_user.user_id,
+            )
+        )
+        if contract is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=api_messages.CONTRACT_NOT_FOUND,
+            )
+        parametros["contract_id"] = job_request.contract_id
+
+    job = DocumentJob(
+        tipo=kind.value,
+        status="pending",
+        parametros=parametros,
+        user_id=current_user.user_id,
+    )
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+
+    get_document_job_runner().submit(job.id)
+
+    return map_document_job_to_response(job)
+
+
+@router.get(
+    "/documents/jobs/{job_id}",
+    response_model=DocumentJobResponse,
+    description="Get the status of a document job",
+    status_code=status.HTTP_200_OK,
+)
+async def get_document_job(
+    job_id: UUID,
+    current_user: User = Depends(deps.get_current_user),
+    session: AsyncSession = Depends(deps.get_session),
+) -> DocumentJobResponse:
+    job = await session.scalar(
+        select(DocumentJob).where(
+            DocumentJob.id == str(job_id), DocumentJob.user_id == current_user.user_id
+        )
+    )
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=api_messages.DOCUMENT_JOB_NOT_FOUND,
+        )
+
+    return map_document_job_to_response(job)
+
+
+@router.get(
+    "/documents/jobs/{job_id}/file",
+    description="Download the document rendered by a finished job",
+    status_code=status.HTTP_200_OK,
+    response_class=PDFResponse,
+    responses={
+        200: {
+            "content": {"application/pdf": {}},
+            "description": "Return a PDF file",
+        }
+    },
+)
+async def download_document_job_file(
+    job_id: UUID,
+    current_user: User = Depends(deps.get_current_user),
+    session: AsyncSession = Depends(deps.get_session),
+) -> PDFResponse:
+    job = await session.scalar(
+        select(DocumentJob)
+        .options(undefer(DocumentJob.arquivo))
+        .where(DocumentJob.id == str(job_id), DocumentJob.user_id == current_user.user_id)
+    )
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=api_messages.DOCUMENT_JOB_NOT_FOUND,
+        )
+
+    if job.status != "done":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=api_messages.DOCUMENT_JOB_NOT_READY,
+        )
+
+    return PDFResponse(content=job.arquivo, filename=job.nome_arquivo)
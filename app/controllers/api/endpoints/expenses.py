@@ -4,8 +4,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.controllers.api.api_messages as api_messages
 from app.controllers.api import deps
-from app.schemas.map_responses import map_expense_to_response
-from app.schemas.responses import ExpenseResponse
+from app.schemas.map_responses import (
+    EXPENSE_LIST,
+    map_expense_to_response,
+    map_list_to_response,
+)
+from app.schemas.responses import ExpenseResponse, ValidatedJSONResponse
 from app.schemas.requests import ExpenseCreateRequest, ExpenseUpdateRequest
 from app.models.models import Expenses
 from app.models.models import Owner as User
@@ -16,13 +20,14 @@ router = APIRouter()
 @router.get(
     "/expenses/{house_id}",
     response_model=list[ExpenseResponse],
+    response_class=ValidatedJSONResponse,
     description="Get all expenses by house id",
 )
 async def get_expenses(
     house_id: int,
     current_user: User = Depends(deps.get_current_user),
     session: AsyncSession = Depends(deps.get_session),
-) -> list[ExpenseResponse]:
+) -> ValidatedJSONResponse:
     result = await session.execute(
         select(Expenses).filter(Expenses.casa_id == house_id)
     )
@@ -34,7 +39,7 @@ async def get_expenses(
             detail=api_messages.EXPENSE_NOT_FOUND,
         )
 
-    return [map_expense_to_response(expense) for expense in expenses]
+    return map_list_to_response(EXPENSE_LIST, expenses)
 
 
 @router.post(
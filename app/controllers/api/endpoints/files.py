@@ -0,0 +1,57 @@
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+import app.controllers.api.api_messages as api_messages
+from app.core.security.jwt import verify_upload_token
+from app.storage.backend import get_storage
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/files/{file_path:path}",
+    description="Download a file uploaded to the local or in-memory storage backend",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={404: {"description": api_messages.FILE_NOT_FOUND}},
+)
+async def download_file(file_path: str) -> Response:
+    storage = await get_storage()
+    return storage.file_response(file_path)
+
+
+@router.put(
+    "/files/{file_path:path}",
+    description="Direct upload to the local or in-memory storage backend, "
+    "with a URL from one of the upload-url endpoints",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={
+        400: {"description": api_messages.INVALID_UPLOAD},
+        403: {"description": api_messages.INVALID_UPLOAD_TOKEN},
+        413: {"description": api_messages.UPLOAD_TOO_LARGE},
+    },
+)
+async def upload_file(file_path: str, token: str, request: Request) -> Response:
+    payload = verify_upload_token(token)
+    if payload.file_path != file_path:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=api_messages.INVALID_UPLOAD_TOKEN,
+        )
+    if request.headers.get("content-type") != payload.content_type:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=api_messages.INVALID_UPLOAD,
+        )
+    if int(request.headers.get("content-length") or 0) > payload.max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=api_messages.UPLOAD_TOO_LARGE,
+        )
+
+    storage = await get_storage()
+    await storage.receive_upload(
+        file_path, request.stream(), payload.content_type, payload.max_size
+    )
+    return Response(status_code=status.HTTP_200_OK)
@@ -0,0 +1,62 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+import app.controllers.api.api_messages as api_messages
+from app.core.config import get_settings
+from app.core.metrics import render_metrics
+from app.rendering.renderer import get_pdf_renderer
+from app.schemas.responses import ReadinessResponse
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    description="Readiness probe: 503 until the PDF renderer workers are warm",
+    status_code=status.HTTP_200_OK,
+    responses={503: {"description": api_messages.RENDERER_WARMING_UP}},
+)
+async def get_readiness() -> ReadinessResponse:
+    renderer = get_pdf_renderer()
+    warm = renderer.ready or not get_settings().renderer.warm_up
+
+    if not warm:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=api_messages.RENDERER_WARMING_UP,
+        )
+
+    return ReadinessResponse(
+        status="ready",
+        renderer_workers=renderer.workers,
+        renderer_warm=renderer.ready,
+    )
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+)
+async def get_metrics(
+    authorization: Optional[str] = Header(None),
+) -> PlainTextResponse:
+    settings = get_settings().metrics
+    if not settings.enabled or settings.token is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if not secrets.compare_digest(
+        authorization or "", f"Bearer {settings.token.get_secret_value()}"
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=api_messages.INVALID_METRICS_TOKEN,
+        )
+
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -1,17 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 import app.controllers.api.api_messages as api_messages
 from app.controllers.api import deps
-from app.helpers.get_service_account import get_service_account
-from app.models.models import Houses, Props
+from app.models.models import Houses
 from app.models.models import Properties
 from app.models.models import Owner as User
-from app.schemas.map_responses import map_house_to_response
+from app.schemas.map_responses import (
+    HOUSE_LIST,
+    map_house_to_response,
+    map_list_to_response,
+)
+from app.schemas.fields import fields_adapter, orm_columns, sparse_fields
 from app.schemas.requests import HouseCreateRequest, HouseUpdateRequest
-from app.schemas.responses import HouseResponse
-from app.storage.gcs import GCStorage
+from app.schemas.responses import HouseResponse, ValidatedJSONResponse
+from app.storage.backend import get_storage
 
 
 router = APIRouter()
@@ -19,18 +24,23 @@ router = APIRouter()
 @router.get(
     "/houses",
     response_model=list[HouseResponse],
+    response_class=ValidatedJSONResponse,
     description="Get all houses for the current user"
 )
 async def get_houses(
+    fields: tuple[str, ...] | None = sparse_fields(HouseResponse),
     current_user: User = Depends(deps.get_current_user),
     session: AsyncSession = Depends(deps.get_session),
-) -> list[HouseResponse]:
-    result = await session.execute(
-        select(Houses).join(Properties).where(Properties.user_id == current_user.user_id)
-    )
+) -> ValidatedJSONResponse:
+    query = select(Houses).join(Properties).where(Properties.user_id == current_user.user_id)
+    if fields is not None:
+        query = query.options(load_only(*orm_columns(HouseResponse, Houses, fields)))
+    result = await session.execute(query)
     houses = result.scalars().all()
 
-    return [map_house_to_response(house) for house in houses]
+    if fields is not None:
+        return map_list_to_response(fields_adapter(HouseResponse, fields), houses)
+    return map_list_to_response(HOUSE_LIST, houses)
 
 @router.get(
     "/houses/{house_id}",
@@ -58,13 +68,14 @@ async def get_house(
 @router.get(
         "/houses/property/{property_id}",
         response_model=list[HouseResponse],
+        response_class=ValidatedJSONResponse,
         description="Get all houses for a property"
 )
 async def get_houses_by_property(
     property_id: int,
     current_user: User = Depends(deps.get_current_user),
     session: AsyncSession = Depends(deps.get_session),
-) -> list[HouseResponse]:
+) -> ValidatedJSONResponse:
     result = await session.execute(
         select(Houses).join(Properties)
         .where(Houses.propriedade_id == property_id, Properties.user_id == current_user.user_id)
@@ -77,7 +88,7 @@ async def get_houses_by_property(
             detail=api_messages.HOUSE_NOT_FOUND
         )
 
-    return [map_house_to_response(house) for house in houses]
+    return map_list_to_response(HOUSE_LIST, houses)
 
 @router.post(
     "/houses/{property_id}",
@@ -102,15 +113,15 @@ async def create_house(
             detail=api_messages.USER_WITHOUT_PERMISSION
         )
     
-    file_path = None
+    photo_variants = None
     if house_data.photo is not None:
-        key = await session.execute(select(Props.column).limit(1))
-        key_response = key.scalar_one_or_none()
-        file_path = GCStorage(key_response).upload_file(house_data.photo, "image")
+        storage = await get_storage()
+        photo_variants = await storage.upload_photo(house_data.photo)
     
     new_house = Houses(
         apelido=house_data.nickname,
-        foto=file_path,
+        foto=photo_variants["original"]["jpeg"] if photo_variants else None,
+        foto_variantes=photo_variants,
         qtd_comodos=house_data.room_count,
         banheiros=house_data.bathrooms,
         mobiliada=house_data.furnished,
@@ -150,9 +161,10 @@ async def update_house(
         )
 
     if house_data.photo is not None:
-        key = await get_service_account(session)
-        file_path = GCStorage(key).upload_file(house_data.photo, "image")
-        existing_house.foto = file_path
+        storage = await get_storage()
+        photo_variants = await storage.upload_photo(house_data.photo)
+        existing_house.foto = photo_variants["original"]["jpeg"]
+        existing_house.foto_variantes = photo_variants
 
     existing_house.apelido = house_data.nickname if house_data.nickname is not None else existing_house.apelido
     existing_house.qtd_comodos = house_data.room_count if house_data.room_count is not None else existing_house.qtd_comodos
@@ -7,8 +7,12 @@ from decimal import Decimal
 
 import app.controllers.api.api_messages as api_messages
 from app.controllers.api import deps
-from app.schemas.map_responses import map_payment_installment_to_response
-from app.schemas.responses import PaymentInstallmentResponse
+from app.schemas.map_responses import (
+    PAYMENT_INSTALLMENT_LIST,
+    map_list_to_response,
+    map_payment_installment_to_response,
+)
+from app.schemas.responses import PaymentInstallmentResponse, ValidatedJSONResponse
 
 from app.schemas.requests import PaymentInstallmentUpdateRequest
 from app.models.models import PaymentInstallment
@@ -18,6 +22,31 @@ from app.models.models import Owner as User
 router = APIRouter()
 
 
+def contract_duration_in_months(contract: Contract) -> int:
+    return (contract.data_fim.year - contract.data_inicio.year) * 12 + (
+        contract.data_fim.month - contract.data_inicio.month
+    )
+
+
+def build_installment_schedule(contract: Contract) -> list[tuple[date, Decimal]]:
+    """Return the (due date, value) pairs the contract terms currently imply."""
+    schedule = []
+    data_inicio = contract.data_inicio.replace(day=contract.dia_vencimento)
+    valor_parcela = Decimal(contract.valor_base)
+
+    for i in range(contract_duration_in_months(contract)):
+        data_vencimento_parcela = data_inicio + relativedelta(months=i + 1)
+
+        if contract.taxa_reajuste == "IGPM" and i > 0 and i % 12 == 0:
+            valor_parcela *= Decimal("1.045")
+
+        schedule.append(
+            (data_vencimento_parcela, valor_parcela.quantize(Decimal("0.01")))
+        )
+
+    return schedule
+
+
 @router.post(
     "/payment_installment/{contract_id}",
     response_model=list[PaymentInstallmentResponse],
@@ -43,41 +72,29 @@ async def create_payment_installment(
             detail=api_messages.CONTRACT_NOT_FOUND,
         )
 
-    contract_duration = (contract.data_fim.year - contract.data_inicio.year) * 12 + (
-        contract.data_fim.month - contract.data_inicio.month
-    )
-
-    if contract_duration < 1:
+    if contract_duration_in_months(contract) < 1:
         raise HTTPException(
             status_code=400, detail=api_messages.CONTRACT_DURATION_ERROR
         )
 
     try:
-        parcelas = []
-        data_inicio = contract.data_inicio.replace(day=contract.dia_vencimento)
-        valor_parcela = Decimal(contract.valor_base)
-
-        for i in range(contract_duration):
-            data_vencimento_parcela = data_inicio + relativedelta(months=i + 1)
-
-            if contract.taxa_reajuste == "IGPM" and i > 0 and i % 12 == 0:
-                valor_parcela *= Decimal("1.045")
-
-            new_payment_installment = PaymentInstallment(
+        parcelas = [
+            PaymentInstallment(
                 contrato_id=contract.id,
-                valor_parcela=valor_parcela.quantize(Decimal("0.01")),
+                valor_parcela=valor_parcela,
                 fg_pago=False,
                 tipo_pagamento=None,
                 data_vencimento=data_vencimento_parcela,
                 data_pagamento=None,
             )
+            for data_vencimento_parcela, valor_parcela in build_installment_schedule(
+                contract
+            )
+        ]
 
-            parcelas.append(new_payment_installment)
-
+        # ids come back from the INSERT, the rows need no refresh
         session.add_all(parcelas)
         await session.commit()
-        for parcela in parcelas:
-            await session.refresh(parcela)
 
     except Exception as e:
         await session.rollback()
@@ -92,6 +109,7 @@ async def create_payment_installment(
 @router.get(
     "/payment_installment/{contract_id}",
     response_model=list[PaymentInstallmentResponse],
+    response_class=ValidatedJSONResponse,
     description="Get all payment installments for the contract",
     status_code=status.HTTP_200_OK,
 )
@@ -99,7 +117,7 @@ async def get_payment_installments(
     contract_id: int,
     current_user: User = Depends(deps.get_current_user),
     session: AsyncSession = Depends(deps.get_session),
-) -> list[PaymentInstallmentResponse]:
+) -> ValidatedJSONResponse:
 
     result = await session.execute(
         select(Contract).where(
@@ -119,9 +137,126 @@ async def get_payment_installments(
     )
     payment_installments = payment.scalars().all()
 
+    return map_list_to_response(PAYMENT_INSTALLMENT_LIST, payment_installments)
+
+
+@router.put(
+    "/payment_installment/{contract_id}/regenerate",
+    response_model=list[PaymentInstallmentResponse],
+    description="Regenerate the payment installments after the contract terms change. "
+    "Paid installments are preserved and only the changed rows are written.",
+    status_code=status.HTTP_200_OK,
+)
+async def regenerate_payment_installments(
+    contract_id: int,
+    current_user: User = Depends(deps.get_current_user),
+    session: AsyncSession = Depends(deps.get_session),
+) -> list[PaymentInstallmentResponse]:
+
+    result = await session.execute(
+        select(Contract).where(
+            Contract.id == contract_id, Contract.user_id == current_user.user_id
+        )
+    )
+    contract = result.scalar_one_or_none()
+
+    if not contract:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=api_messages.CONTRACT_NOT_FOUND,
+        )
+
+    if contract_duration_in_months(contract) < 1:
+        raise HTTPException(
+            status_code=400, detail=api_messages.CONTRACT_DURATION_ERROR
+        )
+
+    try:
+        schedule = build_installment_schedule(contract)
+
+        existing = await session.execute(
+            select(PaymentInstallment)
+            .where(PaymentInstallment.contrato_id == contract_id)
+            .order_by(PaymentInstallment.data_vencimento)
+            .with_for_update()
+        )
+
+        # one installment per month: rows are matched by the month they are due
+        existing_by_month: dict[tuple[int, int], list[PaymentInstallment]] = {}
+        for parcela in existing.scalars().all():
+            month = (parcela.data_vencimento.year, parcela.data_vencimento.month)
+            existing_by_month.setdefault(month, []).append(parcela)
+
+        to_update: list[tuple[PaymentInstallment, date, Decimal]] = []
+        to_insert: list[PaymentInstallment] = []
+        to_delete: list[PaymentInstallment] = []
+
+        for data_vencimento_parcela, valor_parcela in schedule:
+            month = (data_vencimento_parcela.year, data_vencimento_parcela.month)
+            parcelas_do_mes = existing_by_month.pop(month, [])
+
+            if any(parcela.fg_pago for parcela in parcelas_do_mes):
+                # paid installments are never touched, nor duplicated
+                to_delete.extend(p for p in parcelas_do_mes if not p.fg_pago)
+                continue
+
+            if not parcelas_do_mes:
+                to_insert.append(
+                    PaymentInstallment(
+                        contrato_id=contract.id,
+                        valor_parcela=valor_parcela,
+                        fg_pago=False,
+                        tipo_pagamento=None,
+                        data_vencimento=data_vencimento_parcela,
+                        data_pagamento=None,
+                    )
+                )
+                continue
+
+            parcela, *duplicadas = parcelas_do_mes
+            to_delete.extend(duplicadas)
+            if (
+                parcela.data_vencimento != data_vencimento_parcela
+                or Decimal(parcela.valor_parcela) != valor_parcela
+            ):
+                to_update.append((parcela, data_vencimento_parcela, valor_parcela))
+
+        # months that fell out of the schedule keep only their paid installments
+        to_delete.extend(
+            parcela
+            for parcelas_do_mes in existing_by_month.values()
+            for parcela in parcelas_do_mes
+            if not parcela.fg_pago
+        )
+
+        # deletes are flushed first so moved due dates never hit the unique constraint
+        for parcela in to_delete:
+            await session.delete(parcela)
+        await session.flush()
+
+        for parcela, data_vencimento_parcela, valor_parcela in to_update:
+            parcela.data_vencimento = data_vencimento_parcela
+            parcela.valor_parcela = valor_parcela  # type: ignore
+
+        session.add_all(to_insert)
+        await session.commit()
+
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"{api_messages.ERROR_CREATING_PAYMENT_INSTALLMENT}: {str(e)}",
+        )
+
+    payment = await session.execute(
+        select(PaymentInstallment)
+        .where(PaymentInstallment.contrato_id == contract_id)
+        .order_by(PaymentInstallment.data_vencimento)
+    )
+
     return [
         map_payment_installment_to_response(payment_installment)
-        for payment_installment in payment_installments
+        for payment_installment in payment.scalars().all()
     ]
 
 
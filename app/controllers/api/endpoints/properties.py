@@ -3,13 +3,16 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.controllers.api import deps
-from app.helpers.get_service_account import get_service_account
-from app.models.models import Properties, Props
+from app.models.models import Properties
 from app.models.models import Owner as User
-from app.schemas.map_responses import map_property_to_response
+from app.schemas.map_responses import (
+    PROPERTY_LIST,
+    map_list_to_response,
+    map_property_to_response,
+)
 from app.schemas.requests import PropertyCreateRequest, PropertyUpdateRequest
-from app.schemas.responses import PropertyResponse
-from app.storage.gcs import GCStorage
+from app.schemas.responses import PropertyResponse, ValidatedJSONResponse
+from app.storage.backend import get_storage
 
 
 router = APIRouter()
@@ -26,17 +29,17 @@ async def create_property(
     current_user: User = Depends(deps.get_current_user),
     session: AsyncSession = Depends(deps.get_session),
 ) -> PropertyResponse:
-    file_path = None
+    photo_variants = None
     
     if property_data.photo is not None:
-        result = await session.execute(select(Props.column).limit(1))
-        key = result.scalar()
-        file_path = GCStorage(key).upload_file(property_data.photo, "image")
+        storage = await get_storage()
+        photo_variants = await storage.upload_photo(property_data.photo)
 
     
     new_property = Properties(
         apelido=property_data.nickname,
-        foto=file_path,
+        foto=photo_variants["original"]["jpeg"] if photo_variants else None,
+        foto_variantes=photo_variants,
         iptu=property_data.iptu,
         user_id=current_user.user_id,
         rua=property_data.street,
@@ -76,9 +79,10 @@ async def update_property(
         )
 
     if property_data.photo is not None:
-        key = await get_service_account(session)
-        file_path = GCStorage(key).upload_file(property_data.photo, "image")
-        existing_property.foto = file_path
+        storage = await get_storage()
+        photo_variants = await storage.upload_photo(property_data.photo)
+        existing_property.foto = photo_variants["original"]["jpeg"]
+        existing_property.foto_variantes = photo_variants
 
     existing_property.apelido = property_data.nickname if property_data.nickname is not None else existing_property.apelido
     existing_property.iptu = property_data.iptu if property_data.iptu is not None else existing_property.iptu
@@ -99,17 +103,18 @@ async def update_property(
 @router.get(
     "/properties",
     response_model=list[PropertyResponse],
+    response_class=ValidatedJSONResponse,
     description="Get all properties for the current user"
 )
 async def get_properties(
     current_user: User = Depends(deps.get_current_user),
     session: AsyncSession = Depends(deps.get_session),
-) -> list[PropertyResponse]:
+) -> ValidatedJSONResponse:
     result = await session.execute(
         select(Properties).where(Properties.user_id == current_user.user_id)
     )
     properties = result.scalars().all()
-    return [map_property_to_response(property) for property in properties]
+    return map_list_to_response(PROPERTY_LIST, properties)
 
 
 @router.delete(
@@ -4,8 +4,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.controllers.api.api_messages as api_messages
 from app.controllers.api import deps
-from app.schemas.map_responses import map_template_to_response
-from app.schemas.responses import TemplateResponse
+from app.schemas.map_responses import (
+    TEMPLATE_LIST,
+    map_list_to_response,
+    map_template_to_response,
+)
+from app.schemas.responses import TemplateResponse, ValidatedJSONResponse
 from app.schemas.requests import TemplateCreateRequest, TemplateUpdateRequest
 from app.models.models import Template
 from app.models.models import Owner as User
@@ -16,12 +20,13 @@ router = APIRouter()
 @router.get(
     "/templates",
     response_model=list[TemplateResponse],
+    response_class=ValidatedJSONResponse,
     description="Get all templates for the current user",
 )
 async def get_templates(
     current_user: User = Depends(deps.get_current_user),
     session: AsyncSession = Depends(deps.get_session),
-) -> list[TemplateResponse]:
+) -> ValidatedJSONResponse:
     result = await session.execute(
         select(Template).filter(Template.user_id == current_user.user_id)
     )
@@ -33,7 +38,7 @@ async def get_templates(
             detail=api_messages.TEMPLATE_NOT_FOUND,
         )
 
-    return [map_template_to_response(template) for template in templates]
+    return map_list_to_response(TEMPLATE_LIST, templates)
 
 
 @router.get(
@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 import app.controllers.api.api_messages as api_messages
 from app.controllers.api import deps
 from app.models.models import Tenant
 from app.models.models import Owner as User
 from app.schemas.map_responses import map_tenant_to_response
+from app.schemas.map_responses import TENANT_LIST, map_list_to_response
 from app.schemas.map_responses import TenantResponse
+from app.schemas.fields import fields_adapter, orm_columns, sparse_fields
+from app.schemas.responses import ValidatedJSONResponse
 from app.schemas.requests import TenantCreateRequest, TenantUpdateRequest
 
 import logging
@@ -18,16 +22,19 @@ router = APIRouter()
 @router.get(
     "/tenants",
     response_model=list[TenantResponse],
+    response_class=ValidatedJSONResponse,
     description="Get all tenants for the current user",
     status_code=status.HTTP_200_OK
 )
 async def get_tenants(
+    fields: tuple[str, ...] | None = sparse_fields(TenantResponse),
     current_user: User = Depends(deps.get_current_user),
     session: AsyncSession = Depends(deps.get_session),
-) -> list[TenantResponse]:
-    result = await session.execute(
-        select(Tenant).join(User).where(User.user_id == current_user.user_id)
-    )
+) -> ValidatedJSONResponse:
+    query = select(Tenant).join(User).where(User.user_id == current_user.user_id)
+    if fields is not None:
+        query = query.options(load_only(*orm_columns(TenantResponse, Tenant, fields)))
+    result = await session.execute(query)
 
     if not result:
         raise HTTPException(
@@ -37,7 +44,9 @@ async def get_tenants(
 
     tenants = result.scalars().all()
 
-    return [map_tenant_to_response(tenant) for tenant in tenants]
+    if fields is not None:
+        return map_list_to_response(fields_adapter(TenantResponse, fields), tenants)
+    return map_list_to_response(TENANT_LIST, tenants)
 
 @router.get(
     "/tenants/{tenant_id}",
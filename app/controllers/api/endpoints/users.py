@@ -5,22 +5,26 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import File, UploadFile
 from app.controllers.api import deps
 from app.controllers.api import api_messages
-from app.helpers.get_service_account import get_service_account
 from app.core.config import get_settings
 from app.core.security.jwt import generate_reset_token, verify_reset_token
 from app.core.security.password import get_password_hash
 from app.models.models import Owner as User
-from app.models.models import Props
 from app.schemas.map_responses import map_user_to_response
 from app.schemas.requests import (
     UserUpdatePasswordRequest,
     UserUpdateRequest,
     PasswordResetRequest,
     PasswordResetConfirmRequest,
+    UploadConfirmRequest,
 )
-from app.schemas.responses import UserResponse
+from app.schemas.responses import SignedUploadResponse, UserResponse
 import requests
-from app.storage.gcs import GCStorage
+from app.storage.backend import get_storage
+from app.storage.direct_uploads import (
+    USER_PHOTO_TARGET,
+    confirm_direct_photo_upload,
+    start_direct_upload,
+)
 
 router = APIRouter()
 
@@ -97,10 +101,10 @@ async def update_current_user_photo(
         )
 
     try:
-        key = await session.execute(select(Props.column).limit(1))
-        key_response = key.scalar_one_or_none()
-        file_path = GCStorage(key_response).upload_file(file, "image")
-        current_user.foto = file_path
+        storage = await get_storage()
+        photo_variants = await storage.upload_photo(file)
+        current_user.foto = photo_variants["original"]["jpeg"]
+        current_user.foto_variantes = photo_variants
 
         session.add(current_user)
         await session.commit()
@@ -114,6 +118,43 @@ async def update_current_user_photo(
         )
 
 
+@router.post(
+    "/me/photo/upload-url",
+    response_model=SignedUploadResponse,
+    description="Get a signed URL to upload the current user photo directly to storage",
+)
+async def get_current_user_photo_upload_url(
+    current_user: User = Depends(deps.get_current_user),
+) -> SignedUploadResponse:
+    storage = await get_storage()
+    return start_direct_upload(
+        storage, current_user.user_id, USER_PHOTO_TARGET, "image"
+    )
+
+
+@router.post(
+    "/me/photo/confirm",
+    response_model=UserResponse,
+    description="Update current user photo with one uploaded through a signed URL",
+)
+async def confirm_current_user_photo_upload(
+    upload: UploadConfirmRequest,
+    current_user: User = Depends(deps.get_current_user),
+    session: AsyncSession = Depends(deps.get_session),
+) -> UserResponse:
+    storage = await get_storage()
+    photo_variants = await confirm_direct_photo_upload(
+        storage, upload.upload_token, current_user.user_id, USER_PHOTO_TARGET
+    )
+    current_user.foto = photo_variants["original"]["jpeg"]
+    current_user.foto_variantes = photo_variants
+
+    session.add(current_user)
+    await session.commit()
+    await session.refresh(current_user)
+    return map_user_to_response(current_user)
+
+
 @router.delete(
     "/me",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -0,0 +1,167 @@
+"""Brotli and gzip compression of response bodies.
+
+The encoding is negotiated from ``Accept-Encoding``, preferring ``br``.
+Bodies under ``compression.minimum_size``, responses that already carry a
+``Content-Encoding`` and content types listed in
+``compression.skip_content_types`` (PDFs, photos) are sent as they are.
+Chunks of ``compression.offload_size`` or more are compressed in
+``get_compression_executor`` so a large list response does not hold up the
+event loop.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import zlib
+
+import brotli  # type: ignore
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Compression, get_settings
+
+
+@lru_cache(maxsize=1)
+def get_compression_executor() -> ThreadPoolExecutor:
+    # brotli and zlib release the GIL while compressing
+    return ThreadPoolExecutor(
+        max_workers=get_settings().compression.workers,
+        thread_name_prefix="compression",
+    )
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """``br``, ``gzip`` or None, from an ``Accept-Encoding`` header."""
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.strip()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, settings: Compression):
+        self._brotli = None
+        self._gzip = None
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.brotli_quality)
+        else:
+            # wbits 31 writes the gzip header and trailer
+            self._gzip = zlib.compressobj(settings.gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes, last: bool) -> bytes:
+        if self._brotli is not None:
+            data = self._brotli.process(chunk)
+            return data + (self._brotli.finish() if last else self._brotli.flush())
+        assert self._gzip is not None
+        data = self._gzip.compress(chunk)
+        return data + self._gzip.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, get_settings().compression)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, settings: Compression):
+        self._send = send
+        self.encoding = encoding
+        self.settings = settings
+        self.start: Message | None = None
+        self.compressor: _Compressor | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            # held until the first body message shows how large the body is
+            self.start = message
+            return
+
+        assert self.start is not None
+        body = message.get("body", b"")
+        last = not message.get("more_body", False)
+        if self.compressor is None:
+            if message["type"] != "http.response.body" or not self._compressible(
+                message
+            ):
+                self.passthrough = True
+                await self._send(self.start)
+                await self._send(message)
+                return
+            self.compressor = _Compressor(self.encoding, self.settings)
+            body = await self._compress(body, last)
+            self._set_headers(len(body) if last else None)
+            await self._send(self.start)
+        else:
+            body = await self._compress(body, last)
+
+        await self._send(
+            {"type": "http.response.body", "body": body, "more_body": not last}
+        )
+
+    def _compressible(self, message: Message) -> bool:
+        assert self.start is not None
+        headers = Headers(raw=self.start["headers"])
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        if content_type.startswith(self.settings.skip_content_types):
+            return False
+        # a streamed body is compressed whatever its first chunk's size
+        return message.get("more_body", False) or (
+            len(message.get("body", b"")) >= self.settings.minimum_size
+        )
+
+    def _set_headers(self, content_length: int | None) -> None:
+        assert self.start is not None
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+        elif "content-length" in headers:
+            # streamed, the length is only known at the end
+            del headers["Content-Length"]
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            # same content, different bytes
+            headers["ETag"] = "W/" + etag
+
+    async def _compress(self, body: bytes, last: bool) -> bytes:
+        assert self.compressor is not None
+        if len(body) < self.settings.offload_size:
+            return self.compressor.compress(body, last)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_compression_executor(), self.compressor.compress, body, last
+        )
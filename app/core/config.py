@@ -1,5 +1,6 @@
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import AnyHttpUrl, BaseModel, SecretStr, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,9 +27,124 @@ class Database(BaseModel):
     db: str = "postgres"
 
 
+class PdfCache(BaseModel):
+    enabled: bool = True
+    directory: Path = Path("/tmp/e-aluguel/pdf-cache")
+    max_size_bytes: int = 256 * 1024 * 1024  # 256MB
+
+
+class Renderer(BaseModel):
+    workers: int = 2
+    job_timeout_secs: float = 60.0
+    max_queue_size: int = 16
+    recycle_after_jobs: int = 200
+    warm_up: bool = True
+
+
+class Documents(BaseModel):
+    # counted over every process, see app.rendering.jobs
+    max_concurrent_jobs_per_owner: int = 2
+    # jobs one process renders at once
+    workers: int = 4
+    # a running job not finished within this is claimed again
+    lease_secs: float = 10 * 60
+    poll_interval_secs: float = 5.0
+    # finished jobs are deleted, PDF included, this long after finishing
+    retention_secs: float = 7 * 24 * 3600
+    purge_interval_secs: float = 3600
+
+
+class ConfigCache(BaseModel):
+    ttl_secs: float = 300.0
+    listen: bool = True
+
+
+class Storage(BaseModel):
+    backend: Literal["gcs", "local", "memory"] = "gcs"
+    bucket: str = "e-aluguel"
+    local_directory: Path = Path("/var/lib/e-aluguel/files")
+    # where /files is reachable from clients, set the absolute URL in production
+    public_url: str = "/files/"
+    # internal nginx location serving local_directory, see SendfileResponse
+    accel_redirect_prefix: str | None = None
+    upload_workers: int = 8
+    upload_timeout_secs: float = 120.0
+    chunk_size_bytes: int = 8 * 1024 * 1024  # 8MB, a multiple of 256KB
+    # 0 disables the periodic cleanup of unreferenced files
+    cleanup_interval_secs: float = 24 * 3600
+    cleanup_grace_secs: float = 24 * 3600
+    # direct uploads, see app.storage.direct_uploads
+    signed_upload_expire_secs: int = 15 * 60
+    max_upload_bytes: int = 20 * 1024 * 1024  # 20MB
+
+
+class InspectionPhotos(BaseModel):
+    dpi: int = 150
+    jpeg_quality: int = 80
+    workers: int = 4
+
+
+class PhotoVariants(BaseModel):
+    # longest side in pixels, the original keeps its size
+    thumbnail_size: int = 320
+    medium_size: int = 1280
+    jpeg_quality: int = 80
+    webp_quality: int = 75
+    # 0-6, above 2 the encoder gets much slower for little size gain
+    webp_method: int = 2
+    workers: int = 4
+
+
+class Compression(BaseModel):
+    # smaller bodies go out as they are, see app.core.compression
+    minimum_size: int = 1024
+    # 0-11, dynamic responses are compressed on every request
+    brotli_quality: int = 4
+    gzip_level: int = 6
+    # bodies from this size are compressed in a worker thread
+    offload_size: int = 256 * 1024
+    workers: int = 2
+    # prefixes of content types that are compressed already
+    skip_content_types: tuple[str, ...] = (
+        "application/pdf",
+        "application/zip",
+        "application/gzip",
+        "image/",
+        "audio/",
+        "video/",
+        "font/woff",
+    )
+
+
+class Metrics(BaseModel):
+    enabled: bool = True
+    # GET /metrics wants it as a bearer token, and is not served without one
+    token: SecretStr | None = None
+
+
+class SlowQueries(BaseModel):
+    # statements slower than this are logged, 0 turns the hooks off
+    threshold_secs: float = 0.5
+    # share of the slow statements whose EXPLAIN goes to explain_file
+    explain_sample_rate: float = 0.0
+    explain_file: Path = Path("/var/log/e-aluguel/slow-queries.jsonl")
+    explain_file_max_bytes: int = 10 * 1024 * 1024  # 10MB
+    explain_file_backups: int = 3
+
+
 class Settings(BaseSettings):
     security: Security
     database: Database
+    pdf_cache: PdfCache = PdfCache()
+    renderer: Renderer = Renderer()
+    documents: Documents = Documents()
+    inspection_photos: InspectionPhotos = InspectionPhotos()
+    photo_variants: PhotoVariants = PhotoVariants()
+    config_cache: ConfigCache = ConfigCache()
+    storage: Storage = Storage()
+    compression: Compression = Compression()
+    metrics: Metrics = Metrics()
+    slow_queries: SlowQueries = SlowQueries()
 
     @computed_field  # type: ignore[misc]
     @property
@@ -0,0 +1,215 @@
+"""Per-route request metrics in the Prometheus text format.
+
+``MetricsMiddleware`` times every request and counts its response bytes;
+``instrument_engines`` hooks SQLAlchemy engines so each statement is
+counted, and timed, against the request that issued it, found through a
+context variable (SQLAlchemy runs statements in a greenlet that shares the
+request task's context). Routes are labelled by their path template, so
+the number of series stays bounded. ``GET /metrics`` serves the lot, to
+scrapers bearing ``metrics.token``; it is not served without one.
+
+Series are plain lists of bucket counts kept in dicts, updated from the
+event loop thread only, so recording a request allocates nothing but its
+``RequestMetrics``.
+"""
+from bisect import bisect_left
+from contextvars import ContextVar
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        # labels -> count per bucket, then +Inf, sum and count
+        self.series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [0.0] * (len(self.buckets) + 3)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self, label_names: tuple[str, ...]) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self.series.items()):
+            base = _labels(label_names, labels)
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, "+Inf"), series):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(
+                    f"{self.name}_bucket{{{base},{le}}} {cumulative:g}"
+                    if base
+                    else f"{self.name}_bucket{{{le}}} {cumulative:g}"
+                )
+            lines.append(f"{self.name}_sum{_braces(base)} {series[-2]:g}")
+            lines.append(f"{self.name}_count{_braces(base)} {series[-1]:g}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, labels: tuple[str, ...], value: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + value
+
+    def render(self, label_names: tuple[str, ...]) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self.values.items()):
+            lines.append(
+                f"{self.name}{_braces(_labels(label_names, labels))} {value:g}"
+            )
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _braces(labels: str) -> str:
+    return f"{{{labels}}}" if labels else ""
+
+
+ROUTE_LABELS = ("method", "route")
+
+request_duration = Histogram(
+    "http_request_duration_seconds", "Request latency by route", LATENCY_BUCKETS
+)
+response_size = Histogram(
+    "http_response_size_bytes", "Response body bytes sent by route", SIZE_BUCKETS
+)
+request_db_statements = Histogram(
+    "http_request_db_statements", "SQL statements issued per request", STATEMENT_BUCKETS
+)
+request_db_duration = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in SQL statements per request",
+    LATENCY_BUCKETS,
+)
+responses = Counter("http_responses_total", "Responses by route and status")
+db_statements = Counter("db_statements_total", "SQL statements, in requests or not")
+db_duration = Counter(
+    "db_statement_duration_seconds_total", "Time spent in SQL statements"
+)
+
+
+class RequestMetrics:
+    __slots__ = ("scope", "statements", "db_seconds", "status", "size")
+
+    def __init__(self, scope: Scope) -> None:
+        self.scope = scope
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.status = 500
+        self.size = 0
+
+
+_current_request: ContextVar[RequestMetrics | None] = ContextVar(
+    "current_request_metrics", default=None
+)
+
+
+def current_route() -> str | None:
+    """Method and route template of the request being served, if any."""
+    request = _current_request.get()
+    if request is None:
+        return None
+    route = request.scope.get("route")
+    return f"{request.scope['method']} {getattr(route, 'path', UNMATCHED_ROUTE)}"
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    started = getattr(context, "_metrics_started", None)
+    elapsed = time.perf_counter() - started if started is not None else 0.0
+    db_statements.inc(())
+    db_duration.inc((), elapsed)
+
+    request = _current_request.get()
+    if request is not None:
+        request.statements += 1
+        request.db_seconds += elapsed
+
+
+def instrument_engines() -> None:
+    """Count statements of every engine, the async ones included."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = RequestMetrics(scope)
+        token = _current_request.set(request)
+        started = time.perf_counter()
+
+        async def send_counting(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                request.status = message["status"]
+            elif message["type"] == "http.response.body":
+                request.size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_counting)
+        finally:
+            _current_request.reset(token)
+            route = scope.get("route")
+            labels = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE))
+            request_duration.observe(labels, time.perf_counter() - started)
+            response_size.observe(labels, request.size)
+            request_db_statements.observe(labels, request.statements)
+            request_db_duration.observe(labels, request.db_seconds)
+            responses.inc((*labels, str(request.status)))
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for histogram in (
+        request_duration,
+        response_size,
+        request_db_statements,
+        request_db_duration,
+    ):
+        lines.extend(histogram.render(ROUTE_LABELS))
+    lines.extend(responses.render((*ROUTE_LABELS, "status")))
+    lines.extend(db_statements.render(()))
+    lines.extend(db_duration.render(()))
+    return "\n".join(lines) + "\n"
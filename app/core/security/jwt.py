@@ -57,6 +57,13 @@ def verify_jwt_token(token: str) -> JWTTokenPayload:
             detail=f"Token invalid: {e}",
         )
 
+    # reset and upload tokens are signed with the same key
+    if "type" in raw_payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token type",
+        )
+
     return JWTTokenPayload(**raw_payload)
 
 def generate_reset_token(email: str) -> str:
@@ -106,4 +113,65 @@ def verify_reset_token(token: str) -> str:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token: {e}"
-        )
\ No newline at end of file
+        )
+
+class UploadTokenPayload(BaseModel):
+    iss: str
+    sub: str
+    exp: int
+    iat: int
+    type: str = "upload"
+    file_path: str
+    content_type: str
+    max_size: int
+    target: str
+
+
+def generate_upload_token(
+    user_id: str, file_path: str, content_type: str, max_size: int, target: str
+) -> tuple[str, UploadTokenPayload]:
+    iat = int(time.time())
+    exp = iat + get_settings().storage.signed_upload_expire_secs
+
+    token_payload = UploadTokenPayload(
+        iss=get_settings().security.jwt_issuer,
+        sub=user_id,
+        exp=exp,
+        iat=iat,
+        file_path=file_path,
+        content_type=content_type,
+        max_size=max_size,
+        target=target,
+    )
+
+    upload_token = jwt.encode(
+        token_payload.model_dump(),
+        key=get_settings().security.jwt_secret_key.get_secret_value(),
+        algorithm=JWT_ALGORITHM,
+    )
+
+    return upload_token, token_payload
+
+
+def verify_upload_token(token: str) -> UploadTokenPayload:
+    try:
+        raw_payload = jwt.decode(
+            token,
+            get_settings().security.jwt_secret_key.get_secret_value(),
+            algorithms=[JWT_ALGORITHM],
+            options={"verify_signature": True},
+            issuer=get_settings().security.jwt_issuer,
+        )
+    except jwt.InvalidTokenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Token invalid: {e}",
+        )
+
+    if raw_payload.get("type") != "upload":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token type"
+        )
+
+    return UploadTokenPayload(**raw_payload)
@@ -0,0 +1,154 @@
+"""Slow-query log.
+
+Statements running longer than ``slow_queries.threshold_secs`` are logged
+with the route that issued them, the shape of their parameters (the types,
+never the values) and their duration. A sample of them also gets its plan:
+``EXPLAIN (FORMAT JSON)`` is run right after, on the same connection inside
+a savepoint, and appended as a JSON line to a rotating file.
+
+The hooks are not registered when the threshold is 0, so a disabled log
+costs nothing.
+"""
+import json
+import logging
+from logging.handlers import RotatingFileHandler
+import random
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core import config
+from app.core.metrics import current_route
+
+logger = logging.getLogger(__name__)
+
+EXPLAINABLE = ("select", "insert", "update", "delete", "with")
+
+
+def parameter_shape(parameters: Any, many: bool = False) -> str:
+    if many:
+        rows = list(parameters)
+        return f"{len(rows)} x {parameter_shape(rows[0])}" if rows else "[]"
+    if isinstance(parameters, dict):
+        return (
+            "{"
+            + ", ".join(
+                f"{name}: {type(value).__name__}" for name, value in parameters.items()
+            )
+            + "}"
+        )
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+class SlowQueryLog:
+    def __init__(self, settings: config.SlowQueries):
+        self.settings = settings
+        self._explain_handler: RotatingFileHandler | None = None
+
+    def install(self) -> None:
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def remove(self) -> None:
+        event.remove(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", self._after_cursor_execute)
+        if self._explain_handler is not None:
+            self._explain_handler.close()
+            self._explain_handler = None
+
+    def _before_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        many: bool,
+    ) -> None:
+        if context is not None:
+            context._slow_query_started = time.perf_counter()
+
+    def _after_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        many: bool,
+    ) -> None:
+        started = getattr(context, "_slow_query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        if elapsed < self.settings.threshold_secs:
+            return
+
+        route = current_route() or "-"
+        shape = parameter_shape(parameters, many)
+        logger.warning(
+            "Slow query, %.1fms on %s: %s %s",
+            elapsed * 1000,
+            route,
+            " ".join(statement.split()),
+            shape,
+        )
+
+        if (
+            not many
+            and statement.lstrip()[:6].lower().startswith(EXPLAINABLE)
+            and random.random() < self.settings.explain_sample_rate
+        ):
+            try:
+                plan = self._explain(conn, statement, parameters)
+                self._write_plan(
+                    {
+                        "time": time.time(),
+                        "route": route,
+                        "duration_ms": round(elapsed * 1000, 1),
+                        "statement": statement,
+                        "parameters": shape,
+                        "plan": plan,
+                    }
+                )
+            except Exception:
+                logger.warning("Could not EXPLAIN a slow query", exc_info=True)
+
+    def _explain(self, conn: Any, statement: str, parameters: Any) -> Any:
+        # a raw cursor: the EXPLAIN goes through none of the engine hooks,
+        # and the savepoint keeps a failing one from aborting the transaction
+        cursor = conn.connection.cursor()
+        savepoint = conn.in_transaction()
+        try:
+            if savepoint:
+                cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                (plan,) = cursor.fetchone()
+            except Exception:
+                if savepoint:
+                    cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                raise
+            if savepoint:
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        finally:
+            cursor.close()
+        return json.loads(plan) if isinstance(plan, str) else plan
+
+    def _write_plan(self, entry: dict[str, Any]) -> None:
+        if self._explain_handler is None:
+            path = self.settings.explain_file
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._explain_handler = RotatingFileHandler(
+                path,
+                maxBytes=self.settings.explain_file_max_bytes,
+                backupCount=self.settings.explain_file_backups,
+                encoding="utf-8",
+            )
+        self._explain_handler.handle(
+            logging.makeLogRecord({"msg": json.dumps(entry, default=str)})
+        )
@@ -1,12 +1,100 @@
+import asyncio
+import logging
+import time
+from functools import lru_cache
+
+import asyncpg  # type: ignore
 from sqlalchemy import select
+
+from app.core import database_session
+from app.core.config import get_settings
 from app.models.models import Props
-from sqlalchemy.ext.asyncio import AsyncSession
 
-async def get_service_account(session: AsyncSession) -> dict:
-    result = await session.execute(select(Props.column).limit(1))
-    key = result.scalar()
-    if key is None:
-        raise Exception("No service account key found")
-    return key
+logger = logging.getLogger(__name__)
+
+# sent by the trigger on the config table, see the add_config_notify migration
+CONFIG_CHANGED_CHANNEL = "config_changed"
+
+
+class ServiceAccountCache:
+    """Service-account JSON from the ``config`` table, shared by every upload.
+
+    The value is loaded once and reused for ``ttl_secs``. When ``listen`` is
+    started, a ``NOTIFY config_changed`` from Postgres invalidates it right
+    away, so the TTL only matters if the listener connection is lost.
+    """
+
+    def __init__(self, ttl_secs: float):
+        self.ttl_secs = ttl_secs
+        self._value: dict | None = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._listener: asyncpg.Connection | None = None
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._value is not None
+            and time.monotonic() - self._loaded_at < self.ttl_secs
+        )
+
+    async def get(self) -> dict:
+        if not self._is_fresh():
+            async with self._lock:
+                if not self._is_fresh():
+                    await self.refresh()
+        assert self._value is not None
+        return self._value
+
+    async def refresh(self) -> None:
+        async with database_session.get_async_session() as session:
+            result = await session.execute(select(Props.column).limit(1))
+            key = result.scalar()
+        if key is None:
+            raise Exception("No service account key found")
+        self._value = key
+        self._loaded_at = time.monotonic()
+
+    def invalidate(self, *args: object) -> None:
+        self._loaded_at = 0.0
+
+    async def listen(self) -> None:
+        settings = get_settings().database
+        self._listener = await asyncpg.connect(
+            host=settings.hostname,
+            port=settings.port,
+            user=settings.username,
+            password=settings.password.get_secret_value(),
+            database=settings.db,
+        )
+        await self._listener.add_listener(CONFIG_CHANGED_CHANNEL, self.invalidate)
+        self._listener.add_termination_listener(self._on_listener_lost)
+
+    def _on_listener_lost(self, *args: object) -> None:
+        logger.warning("Lost the config listener, falling back to the TTL")
+        self._listener = None
+
+    async def start(self) -> None:
+        try:
+            await self.refresh()
+        except Exception:
+            # uploads retry the load, the app can serve everything else
+            logger.warning("Service account not loaded at startup", exc_info=True)
+        if get_settings().config_cache.listen:
+            try:
+                await self.listen()
+            except Exception:
+                logger.warning("Could not LISTEN for config changes", exc_info=True)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            await listener.close()
+
+
+@lru_cache(maxsize=1)
+def get_service_account_cache() -> ServiceAccountCache:
+    return ServiceAccountCache(ttl_secs=get_settings().config_cache.ttl_secs)
+
 
-    
\ No newline at end of file
+async def get_service_account() -> dict:
+    return await get_service_account_cache().get()
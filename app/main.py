@@ -1,7 +1,46 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from app.controllers.api.api_router import auth_router, api_router
+from app.controllers.api.api_router import (
+    auth_router,
+    api_router,
+    files_router,
+    health_router,
+)
+from app.core.compression import CompressionMiddleware
+from app.core.config import get_settings
+from app.core.metrics import MetricsMiddleware, instrument_engines
+from app.core.slow_queries import SlowQueryLog
+from app.helpers.get_service_account import get_service_account_cache
+from app.rendering.jobs import get_document_job_runner
+from app.rendering.renderer import get_pdf_renderer
+from app.schemas.responses import ORJSONResponse
+from app.storage.cleanup import cleanup_periodically
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if get_settings().renderer.warm_up:
+        # in the background: the app serves JSON while the renderer warms up
+        get_pdf_renderer().start_warm_up()
+    if get_settings().storage.backend == "gcs":
+        await get_service_account_cache().start()
+    await get_document_job_runner().resume()
+    cleanup_interval = get_settings().storage.cleanup_interval_secs
+    cleanup = (
+        asyncio.create_task(cleanup_periodically(cleanup_interval))
+        if cleanup_interval > 0
+        else None
+    )
+    yield
+    if cleanup is not None:
+        cleanup.cancel()
+    await get_document_job_runner().shutdown()
+    await get_service_account_cache().close()
+    get_pdf_renderer().shutdown()
 
 
 app = FastAPI(
@@ -10,11 +49,18 @@ app = FastAPI(
     description="https://simulacaotcc.github.io/DOCS/",
     openapi_url="/openapi.json",
     docs_url="/",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+app.include_router(health_router)
+app.include_router(files_router)
 app.include_router(auth_router)
 app.include_router(api_router)
 
+# Compresses large responses for clients that accept br or gzip
+app.add_middleware(CompressionMiddleware)
+
 # Sets all CORS enabled origins
 app.add_middleware(
     CORSMiddleware,
@@ -30,6 +76,15 @@ app.add_middleware(
     allowed_hosts=["*"],
 )
 
+# Outermost, so latency and response sizes are what clients see
+if get_settings().metrics.enabled:
+    instrument_engines()
+    app.add_middleware(MetricsMiddleware)
+
+# Logs statements over the threshold, with the route that issued them
+if get_settings().slow_queries.threshold_secs > 0:
+    SlowQueryLog(get_settings().slow_queries).install()
+
 
 if __name__ == '__main__':
     import uvicorn
@@ -15,6 +15,7 @@ from sqlalchemy import (
     Enum,
     Text,
     Numeric,
+    LargeBinary,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.schema import UniqueConstraint
@@ -55,6 +56,7 @@ class Owner(Base, Address):
         Uuid(as_uuid=False), primary_key=True, default=lambda _: str(uuid.uuid4())
     )
     foto: Mapped[str] = mapped_column(String(256), nullable=True)
+    foto_variantes: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     email: Mapped[str] = mapped_column(
         String(256), nullable=False, unique=True, index=True
     )
@@ -80,6 +82,9 @@ class Owner(Base, Address):
     templates: Mapped[list["Template"]] = relationship(
         "Template", back_populates="user", cascade="all, delete-orphan"
     )
+    documentos: Mapped[list["DocumentJob"]] = relationship(
+        "DocumentJob", back_populates="user", cascade="all, delete-orphan"
+    )
 
 
 class RefreshToken(Base):
@@ -103,6 +108,7 @@ class Properties(Base, Address):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     apelido: Mapped[str] = mapped_column(String(100), nullable=False)
     foto: Mapped[str] = mapped_column(String(256), nullable=True)
+    foto_variantes: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     iptu: Mapped[float] = mapped_column(Numeric, nullable=False)
     user_id: Mapped[str] = mapped_column(
         Uuid(as_uuid=False), ForeignKey("conta_usuario.user_id"), nullable=False
@@ -120,6 +126,7 @@ class Houses(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     apelido: Mapped[str] = mapped_column(String(255), nullable=False)
     foto: Mapped[str] = mapped_column(String(256), nullable=True)
+    foto_variantes: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     qtd_comodos: Mapped[int] = mapped_column(Integer, nullable=False)
     banheiros: Mapped[int] = mapped_column(Integer, nullable=False)
     mobiliada: Mapped[bool] = mapped_column(Boolean, nullable=False)
@@ -300,3 +307,38 @@ class Inspection(Base):
     contratos: Mapped["Contract"] = relationship("Contract", back_populates="vistorias")
 
     __table_args__ = (UniqueConstraint("contrato_id", name="uq_vistoria_contrato_id"),)
+
+
+class DocumentJob(Base):
+    __tablename__ = "documento_job"
+
+    id: Mapped[str] = mapped_column(
+        Uuid(as_uuid=False), primary_key=True, default=lambda _: str(uuid.uuid4())
+    )
+    tipo: Mapped[enumerate] = mapped_column(
+        Enum("contract", "report", name="tipo_documento"), nullable=False
+    )
+    status: Mapped[enumerate] = mapped_column(
+        Enum("pending", "running", "done", "failed", name="status_documento"),
+        nullable=False,
+        default="pending",
+        index=True,
+    )
+    parametros: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    nome_arquivo: Mapped[str] = mapped_column(String(255), nullable=True)
+    arquivo: Mapped[bytes] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    erro: Mapped[str] = mapped_column(Text, nullable=True)
+    # the claim of the worker rendering the job, see DocumentJobRunner.claim
+    reserva: Mapped[str] = mapped_column(Uuid(as_uuid=False), nullable=True)
+    reservado_em: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # done or failed, kept until documents.retention_secs after this
+    concluido_em: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+    user_id: Mapped[str] = mapped_column(
+        ForeignKey("conta_usuario.user_id", ondelete="CASCADE"), nullable=False
+    )
+
+    user: Mapped["Owner"] = relationship("Owner", back_populates="documentos")
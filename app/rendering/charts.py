@@ -0,0 +1,319 @@
+"""Small SVG chart library for the PDF reports.
+
+Charts are returned as inline ``<svg>`` markup, which WeasyPrint renders
+natively, so the report never needs a plotting stack in the request path.
+"""
+import math
+from collections.abc import Callable
+from functools import lru_cache
+from html import escape
+
+# inputs are plain tuples so identical charts hit the cache
+CHART_CACHE_SIZE = 128
+
+PALETTE = (
+    "#1f77b4",
+    "#ff7f0e",
+    "#2ca02c",
+    "#d62728",
+    "#9467bd",
+    "#8c564b",
+    "#e377c2",
+    "#7f7f7f",
+)
+MONTHS = (
+    "Jan",
+    "Fev",
+    "Mar",
+    "Abr",
+    "Mai",
+    "Jun",
+    "Jul",
+    "Ago",
+    "Set",
+    "Out",
+    "Nov",
+    "Dez",
+)
+FONT_FAMILY = "Arial, sans-serif"
+TEXT_COLOR = "#333"
+GRID_COLOR = "#ddd"
+EMPTY_LABEL = "Sem dados"
+
+
+def format_brl(value: float) -> str:
+    """Format ``value`` as Brazilian currency, e.g. ``R$ 1.234,56``."""
+    formatted = f"{abs(value):,.2f}".translate(str.maketrans(",.", ".,"))
+    return f"-R$ {formatted}" if value < 0 else f"R$ {formatted}"
+
+
+def format_percent(value: float) -> str:
+    return f"{value:.1f}%".replace(".", ",")
+
+
+def month_label(month: int) -> str:
+    return MONTHS[month - 1] if 1 <= month <= 12 else str(month)
+
+
+def _n(value: float) -> str:
+    # short coordinates keep the markup small
+    return f"{value:.1f}".rstrip("0").rstrip(".")
+
+
+def _text(
+    x: float,
+    y: float,
+    content: str,
+    size: int = 12,
+    anchor: str = "middle",
+    weight: str = "normal",
+    fill: str = TEXT_COLOR,
+) -> str:
+    return (
+        f'<text x="{_n(x)}" y="{_n(y)}" font-size="{size}" text-anchor="{anchor}" '
+        f'font-weight="{weight}" fill="{fill}">{escape(content)}</text>'
+    )
+
+
+def _svg(width: int, height: int, title: str, body: list[str]) -> str:
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="{FONT_FAMILY}">'
+        + _text(width / 2, 24, title, size=18, weight="bold")
+        + "".join(body)
+        + "</svg>"
+    )
+
+
+def _empty(width: int, height: int, title: str) -> str:
+    return _svg(width, height, title, [_text(width / 2, height / 2, EMPTY_LABEL)])
+
+
+def _nice_ticks(maximum: float, count: int = 5) -> list[float]:
+    """Evenly spaced axis ticks from zero covering ``maximum``."""
+    if maximum <= 0:
+        return [0.0, 1.0]
+    raw_step = maximum / count
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(
+        factor * magnitude
+        for factor in (1, 2, 2.5, 5, 10)
+        if factor * magnitude >= raw_step
+    )
+    return [step * i for i in range(math.ceil(maximum / step) + 1)]
+
+
+def _legend(x: float, y: float, labels: tuple[str, ...], colors: list[str]) -> list[str]:
+    items = []
+    for i, (label, color) in enumerate(zip(labels, colors)):
+        row_y = y + i * 22
+        items.append(
+            f'<rect x="{_n(x)}" y="{_n(row_y - 11)}" width="14" height="14" '
+            f'fill="{color}"/>'
+        )
+        items.append(_text(x + 20, row_y, label, anchor="start"))
+    return items
+
+
+def pie_chart(
+    title: str,
+    labels: tuple[str, ...],
+    values: tuple[float, ...],
+    width: int = 600,
+    height: int = 320,
+) -> str:
+    total = sum(values)
+    if total <= 0:
+        return _empty(width, height, title)
+
+    radius = (height - 60) / 2
+    cx, cy = radius + 20, 40 + radius
+    colors = [PALETTE[i % len(PALETTE)] for i in range(len(values))]
+    body = []
+    angle = -math.pi / 2
+
+    for value, color in zip(values, colors):
+        sweep = value / total * 2 * math.pi
+        if sweep >= 2 * math.pi - 1e-9:
+            body.append(
+                f'<circle cx="{_n(cx)}" cy="{_n(cy)}" r="{_n(radius)}" fill="{color}"/>'
+            )
+        elif sweep > 0:
+            x1, y1 = cx + radius * math.cos(angle), cy + radius * math.sin(angle)
+            end = angle + sweep
+            x2, y2 = cx + radius * math.cos(end), cy + radius * math.sin(end)
+            large_arc = 1 if sweep > math.pi else 0
+            body.append(
+                f'<path d="M{_n(cx)},{_n(cy)} L{_n(x1)},{_n(y1)} '
+                f'A{_n(radius)},{_n(radius)} 0 {large_arc} 1 {_n(x2)},{_n(y2)} Z" '
+                f'fill="{color}" stroke="#fff" stroke-width="1"/>'
+            )
+
+        # tiny slices would only get an unreadable label
+        if value / total >= 0.04:
+            middle = angle + sweep / 2
+            body.append(
+                _text(
+                    cx + radius * 0.62 * math.cos(middle),
+                    cy + radius * 0.62 * math.sin(middle) + 4,
+                    format_percent(value / total * 100),
+                    fill="#fff",
+                    weight="bold",
+                )
+            )
+        angle += sweep
+
+    legend_labels = tuple(
+        f"{label} - {format_brl(value)}" for label, value in zip(labels, values)
+    )
+    body.extend(_legend(cx + radius + 30, 60, legend_labels, colors))
+    return _svg(width, height, title, body)
+
+
+def _bar_chart(
+    title: str,
+    categories: tuple[str, ...],
+    series: tuple[tuple[str, tuple[float, ...]], ...],
+    color_for: Callable[[int, int], str],
+    y_label: str,
+    currency: bool,
+    width: int,
+    height: int,
+) -> str:
+    if not categories:
+        return _empty(width, height, title)
+
+    left, right, top, bottom = 80, 20, 50, 40
+    if len(series) > 1:
+        bottom += 24
+    plot_width = width - left - right
+    plot_height = height - top - bottom
+    ticks = _nice_ticks(max(max(values, default=0) for _, values in series))
+    scale = plot_height / ticks[-1]
+    axis_y = top + plot_height
+
+    body = []
+    for tick in ticks:
+        y = axis_y - tick * scale
+        label = format_brl(tick).removesuffix(",00") if currency else _n(tick)
+        body.append(
+            f'<line x1="{left}" y1="{_n(y)}" x2="{width - right}" y2="{_n(y)}" '
+            f'stroke="{GRID_COLOR}"/>'
+        )
+        body.append(_text(left - 6, y + 4, label, size=10, anchor="end"))
+
+    if y_label:
+        body.append(
+            f'<g transform="translate(14,{_n(top + plot_height / 2)}) rotate(-90)">'
+            + _text(0, 0, y_label)
+            + "</g>"
+        )
+
+    group_width = plot_width / len(categories)
+    bar_width = group_width * 0.7 / len(series)
+    for i, category in enumerate(categories):
+        group_x = left + i * group_width + group_width * 0.15
+        for j, (_, values) in enumerate(series):
+            bar_height = values[i] * scale
+            body.append(
+                f'<rect x="{_n(group_x + j * bar_width)}" '
+                f'y="{_n(axis_y - bar_height)}" width="{_n(bar_width)}" '
+                f'height="{_n(bar_height)}" fill="{color_for(i, j)}"/>'
+            )
+        body.append(
+            _text(left + (i + 0.5) * group_width, axis_y + 16, category, size=11)
+        )
+
+    body.append(
+        f'<line x1="{left}" y1="{axis_y}" x2="{width - right}" y2="{axis_y}" '
+        f'stroke="{TEXT_COLOR}"/>'
+    )
+
+    if len(series) > 1:
+        legend_x: float = left
+        for j, (name, _) in enumerate(series):
+            body.extend(_legend(legend_x, height - 10, (name,), [color_for(0, j)]))
+            legend_x += 40 + 8 * len(name)
+
+    return _svg(width, height, title, body)
+
+
+def bar_chart(
+    title: str,
+    labels: tuple[str, ...],
+    values: tuple[float, ...],
+    colors: tuple[str, ...] = PALETTE,
+    y_label: str = "",
+    currency: bool = False,
+    width: int = 600,
+    height: int = 320,
+) -> str:
+    """One bar per label, each bar taking the next colour."""
+    return _bar_chart(
+        title,
+        labels,
+        ((title, values),),
+        lambda i, j: colors[i % len(colors)],
+        y_label,
+        currency,
+        width,
+        height,
+    )
+
+
+def grouped_bar_chart(
+    title: str,
+    categories: tuple[str, ...],
+    series: tuple[tuple[str, tuple[float, ...]], ...],
+    colors: tuple[str, ...] = PALETTE,
+    y_label: str = "",
+    currency: bool = False,
+    width: int = 600,
+    height: int = 320,
+) -> str:
+    """Side by side bars per category, one colour and legend entry per series."""
+    return _bar_chart(
+        title,
+        categories,
+        series,
+        lambda i, j: colors[j % len(colors)],
+        y_label,
+        currency,
+        width,
+        height,
+    )
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def expenses_by_type_chart(labels: tuple[str, ...], values: tuple[float, ...]) -> str:
+    return pie_chart(
+        "Despesas por Tipo", tuple(label.capitalize() for label in labels), values
+    )
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def occupancy_chart(statuses: tuple[str, ...], counts: tuple[int, ...]) -> str:
+    return bar_chart(
+        "Taxa de Ocupação dos Imóveis",
+        tuple(status.capitalize() for status in statuses),
+        tuple(float(count) for count in counts),
+        colors=("green", "red", "orange"),
+        y_label="N° Imóveis",
+        height=220,
+    )
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def income_expense_chart(
+    months: tuple[int, ...],
+    incomes: tuple[float, ...],
+    expenses: tuple[float, ...],
+) -> str:
+    return grouped_bar_chart(
+        "Receita e Despesa por Mês",
+        tuple(month_label(month) for month in months),
+        (("Receita", incomes), ("Despesa", expenses)),
+        colors=("blue", "red"),
+        y_label="Valor (R$)",
+        currency=True,
+    )
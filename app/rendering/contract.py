@@ -0,0 +1,155 @@
+import asyncio
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.controllers.api.api_messages as api_messages
+from app.models.models import (
+    Contract,
+    Guarantor,
+    Houses,
+    Inspection,
+    Owner as User,
+    Properties,
+    Template,
+    Tenant,
+)
+from app.rendering.engine import (
+    CONTRACT_STYLESHEET,
+    CONTRACT_TEMPLATE_VERSION,
+    render_contract_html,
+)
+from app.rendering.renderer import get_pdf_renderer
+from app.storage.base import get_upload_executor
+from app.storage.pdf_cache import get_pdf_cache, make_cache_key
+
+CONTRACT_PDF_FILENAME = "Contrato_Aluguel.pdf"
+
+
+@dataclass
+class ContractDocument:
+    contract: Contract
+    template: Template
+    tenant: Tenant
+    house: Houses
+    property: Properties
+    owner: User
+    guarantor: Guarantor | None
+    inspection: Inspection | None
+
+    def cache_key(self) -> str:
+        # ids too: rows written in one transaction share their update_time,
+        # and the cache is shared by every owner
+        return make_cache_key(
+            CONTRACT_TEMPLATE_VERSION,
+            self.owner.user_id,
+            self.owner.update_time,
+            ("Contract", self.contract.id, self.contract.update_time),
+            ("Template", self.template.id, self.template.update_time),
+            ("Tenant", self.tenant.id, self.tenant.update_time),
+            ("Houses", self.house.id, self.house.update_time),
+            ("Properties", self.property.id, self.property.update_time),
+            (
+                (self.guarantor.id, self.guarantor.update_time)
+                if self.guarantor is not None
+                else None
+            ),
+            self.inspection is not None,
+        )
+
+
+async def load_contract_document(
+    session: AsyncSession, contract_id: int, owner: User
+) -> ContractDocument:
+    result = await session.execute(
+        select(Contract, Template, Tenant, Houses, Properties)
+        .join(Template, Contract.template_id == Template.id)
+        .join(Tenant, Contract.inquilino_id == Tenant.id)
+        .join(Houses, Contract.casa_id == Houses.id)
+        .join(Properties, Houses.propriedade_id == Properties.id)
+        .where(Contract.id == contract_id, Contract.user_id == owner.user_id)
+        .where(Tenant.user_id == owner.user_id)
+        .where(Properties.user_id == owner.user_id)
+    )
+    result_data = result.one_or_none()
+
+    if not result_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=api_messages.CONTRACT_NOT_FOUND,
+        )
+
+    contract, template, tenant, house, property = result_data
+
+    inspection_data = await session.execute(
+        select(Inspection).where(Inspection.contrato_id == contract_id)
+    )
+    inspection: Inspection | None = inspection_data.scalar_one_or_none()
+
+    guarantor: Guarantor | None
+    if template.garantia == "fiador":
+        fiador = await session.execute(
+            select(Guarantor).where(Guarantor.inquilino_id == tenant.id)
+        )
+        guarantor = fiador.scalar_one_or_none()
+    else:
+        guarantor = None
+
+    if template.garantia == "fiador" and guarantor is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=api_messages.GUARANTOR_NOT_FOUND,
+        )
+
+    return ContractDocument(
+        contract=contract,
+        template=template,
+        tenant=tenant,
+        house=house,
+        property=property,
+        owner=owner,
+        guarantor=guarantor,
+        inspection=inspection,
+    )
+
+
+async def render_contract_pdf(
+    document: ContractDocument, request: Request | None = None
+) -> bytes:
+    # the cache is files on disk, read and written off the event loop
+    loop = asyncio.get_running_loop()
+    pdf_cache = get_pdf_cache()
+    cache_key = document.cache_key()
+    if pdf_cache is not None:
+        cached_pdf = await loop.run_in_executor(
+            get_upload_executor(), pdf_cache.get, cache_key
+        )
+        if cached_pdf is not None:
+            return cached_pdf
+
+    try:
+        html_template = render_contract_html(
+            contract=document.contract,
+            template=document.template,
+            tenant=document.tenant,
+            property=document.property,
+            owner=document.owner,
+            guarantor=document.guarantor,
+            inspection=document.inspection,
+        )
+
+        pdf = await get_pdf_renderer().render(
+            html_template, request, stylesheet=CONTRACT_STYLESHEET
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro ao gerar PDF: {e} algum campo obrigatório está nulo.")
+
+    if pdf_cache is not None:
+        await loop.run_in_executor(get_upload_executor(), pdf_cache.put, cache_key, pdf)
+
+    return pdf
@@ -0,0 +1,43 @@
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# bump whenever a template or its stylesheet changes so cached PDFs are not reused
+CONTRACT_TEMPLATE_VERSION = "2"
+CONTRACT_TEMPLATE = "contract.html.j2"
+CONTRACT_STYLESHEET = "contract.css"
+
+
+def _upper_or_blank(value: Any) -> str:
+    return str(value or "").upper()
+
+
+def _por_extenso(value: Any) -> str:
+    # num2words loads every language module, so only pay for it when needed
+    from num2words import num2words  # type: ignore
+
+    return num2words(value, lang="pt-br")
+
+
+_environment = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=select_autoescape(["html", "j2"]),
+    undefined=StrictUndefined,
+    auto_reload=False,
+)
+_environment.filters["upper_or_blank"] = _upper_or_blank
+_environment.filters["por_extenso"] = _por_extenso
+
+# compiled once at import time, rendering only fills in the context
+_contract_template = _environment.get_template(CONTRACT_TEMPLATE)
+
+
+def render_contract_html(**context: Any) -> str:
+    contract = context["contract"]
+    duracao_meses = (contract.data_fim.year - contract.data_inicio.year) * 12 + (
+        contract.data_fim.month - contract.data_inicio.month
+    )
+    return _contract_template.render(duracao_meses=duracao_meses, **context)
@@ -0,0 +1,267 @@
+from functools import lru_cache
+from io import BytesIO
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from reportlab.lib.pagesizes import A4
+
+from app.models.models import Owner as User
+from app.models.models import Properties, Tenant
+from app.schemas.requests import InspectionCreateRequest
+
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle
+
+FOTOS_POR_LINHA = 2
+ESPACO_ENTRE_FOTOS = 20
+LARGURA_FOTO = (
+    A4[0] - 50 - ESPACO_ENTRE_FOTOS * (FOTOS_POR_LINHA - 1)
+) / FOTOS_POR_LINHA
+ALTURA_FOTO = 150
+
+
+@lru_cache(maxsize=1)
+def get_styles() -> MappingProxyType[str, "ParagraphStyle"]:
+    """Paragraph styles, built on first use and then shared read-only."""
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    # derived styles only: the sample sheet itself is never mutated
+    sample = getSampleStyleSheet()
+    return MappingProxyType(
+        {
+            "title": ParagraphStyle(
+                "Title",
+                parent=sample["Heading1"],
+                alignment=1,
+                fontSize=14,
+                spaceAfter=12,
+            ),
+            "subtitle": ParagraphStyle(
+                "Subtitle",
+                parent=sample["Heading2"],
+                alignment=1,
+                fontSize=12,
+                spaceAfter=10,
+            ),
+            "text": ParagraphStyle("Text", parent=sample["BodyText"], leading=14),
+            "signature": ParagraphStyle(
+                "Signature", parent=sample["BodyText"], alignment=1, leading=20
+            ),
+        }
+    )
+
+
+
+def create_inspection_pdf(
+    inspection_data: InspectionCreateRequest,
+    owner: User,
+    tenant: Tenant,
+    property: Properties,
+    inspection_photos: list[bytes] | None,
+) -> bytes:
+    from reportlab.platypus import (
+        BaseDocTemplate,
+        Frame,
+        Image,
+        PageBreak,
+        PageTemplate,
+        Paragraph,
+        Spacer,
+        Table,
+        TableStyle,
+    )
+
+    # every call builds into its own buffer, so concurrent renders never share output
+    buffer = BytesIO()
+    doc = BaseDocTemplate(buffer, pagesize=A4)
+    width, height = A4
+    styles = get_styles()
+    title_style = styles["title"]
+    subtitle_style = styles["subtitle"]
+    text_style = styles["text"]
+    signatures_style = styles["signature"]
+
+    frame = Frame(50, 50, width - 100, height - 100, showBoundary=0)
+    template = PageTemplate(id="main_template", frames=[frame], onPage=add_page_number)
+    doc.addPageTemplates([template])
+
+    content = [
+        Paragraph("TERMO DE VISTORIA INICIAL DO IMÓVEL", title_style),
+        Paragraph("CONTRATO DE LOCAÇÃO", subtitle_style),
+        Paragraph(
+            f"LOCADOR: {owner.nome}, inscrito no CPF sob nº {owner.cpf}, e-mail {owner.email}, residente e domiciliado na rua {owner.rua}, {owner.numero}, no bairro {owner.bairro}, {owner.cep} em {owner.cidade}/{owner.estado}.",
+            text_style,
+        ),
+        Paragraph(
+            f"LOCATÁRIO: {tenant.nome}, {tenant.estado_civil}, {tenant.profissao} inscrito no CPF sob nº {tenant.cpf}, e-mail {tenant.email}, residente e domiciliado na rua {tenant.rua}, {tenant.numero}, no bairro {tenant.bairro}, {tenant.cep} em {tenant.cidade}/{tenant.estado}.",
+            text_style,
+        ),
+        Paragraph(
+            f"IMÓVEL OBJETO DA LOCAÇÃO: Imóvel situado na rua {property.rua}, no bairro {property.bairro}, n° {property.numero}, em {property.cidade}/{property.estado}.",
+            text_style,
+        ),
+        Paragraph(
+            "Firmam por meio do presente o termo de vistoria e entrega das chaves ao locatário para início na data de hoje da vigência do contrato de locação.",
+            text_style,
+        ),
+        Paragraph(
+            "O presente termo é parte integrante do contrato de locação celebrado entre as partes.",
+            text_style,
+        ),
+        Paragraph(
+            "Pelo presente, declaram as partes, que o o imóvel acima indicado se encontra em bom estado de conservação, com todos os acessórios em prefeito estado de funcionamento e conservação, sendo que dessa forma o LOCATÁRIO se compromete a devolvê-lo no mesmo estado, findo o prazo contratual, independente de vistoria final.",
+            text_style,
+        ),
+        Paragraph("O imóvel está inspecionado conforme os itens abaixo:", text_style),
+        Spacer(1, 12),
+    ]
+
+    if inspection_data.pintura:
+        content.append(
+            Paragraph(
+                f"1) PINTURA: {inspection_data.pintura.estado_pintura.value}, Tipo: {inspection_data.pintura.tipo_tinta.value}, Cor: {inspection_data.pintura.cor or 'Não especificada'}.",
+                text_style,
+            )
+        )
+    if inspection_data.acabamento:
+        content.append(
+            Paragraph(
+                f"2) ACABAMENTO: {inspection_data.acabamento.condicao or 'Não especificado'}, Observações: {inspection_data.acabamento.observacoes or 'Nenhuma'}.",
+                text_style,
+            )
+        )
+    if inspection_data.eletrica:
+        content.append(
+            Paragraph(
+                f"3) ELÉTRICA: {inspection_data.eletrica.condicao.value}, Observações: {inspection_data.eletrica.observacoes or 'Nenhuma'}.",
+                text_style,
+            )
+        )
+    if inspection_data.trincos_fechaduras:
+        content.append(
+            Paragraph(
+                f"4) TRINCOS e FECHADURAS: {inspection_data.trincos_fechaduras.condicao or 'Não especificado'}, Observações: {inspection_data.trincos_fechaduras.observacoes or 'Nenhuma'}.",
+                text_style,
+            )
+        )
+    if inspection_data.piso_azulejos:
+        content.append(
+            Paragraph(
+                f"5) PISOS E AZULEJOS: {inspection_data.piso_azulejos.condicao or 'Não especificado'}, Observações: {inspection_data.piso_azulejos.observacoes or 'Nenhuma'}.",
+                text_style,
+            )
+        )
+    if inspection_data.vidracaria_janelas:
+        content.append(
+            Paragraph(
+                f"6) VIDRAÇAS e JANELAS: {inspection_data.vidracaria_janelas.condicao or 'Não especificado'}, Observações: {inspection_data.vidracaria_janelas.observacoes or 'Nenhuma'}.",
+                text_style,
+            )
+        )
+    if inspection_data.telhado:
+        content.append(
+            Paragraph(
+                f"7) TELHADO: {inspection_data.telhado.condicao or 'Não especificado'}, Observações: {inspection_data.telhado.observacoes or 'Nenhuma'}.",
+                text_style,
+            )
+        )
+    if inspection_data.hidraulica:
+        content.append(
+            Paragraph(
+                f"8) HIDRÁULICA: {inspection_data.hidraulica.condicao or 'Não especificado'}, Observações: {inspection_data.hidraulica.observacoes or 'Nenhuma'}.",
+                text_style,
+            )
+        )
+    if inspection_data.mobilia:
+        content.append(
+            Paragraph(
+                f"9) MOBILIA: Observações: {inspection_data.mobilia.observacoes or 'Nenhuma'}.",
+                text_style,
+            )
+        )
+    if inspection_data.chave:
+        content.append(
+            Paragraph(
+                f"10) CHAVES: Número: {inspection_data.chave.numero or 'Não especificado'}, Observações: {inspection_data.chave.observacoes or 'Nenhuma'}.",
+                text_style,
+            )
+        )
+
+    content.append(
+        Paragraph(
+            f"Qualquer impugnação ao presente laudo deverá ser comunicada ao LOCADOR por escrito, dentro de 07 (sete) dias a contar da data da assinatura deste. destinado ao e-mail {owner.email} A falta de comunicação implica em aceitação de vistoria realizada nos termos descritos acima",
+            text_style,
+        )
+    )
+    content.append(Spacer(1, 12))
+
+    if inspection_photos:
+        content.append(PageBreak())  # Adiciona uma quebra de página antes das fotos
+        photo_table_data = []
+        photo_row = []
+
+        for i, photo in enumerate(inspection_photos):
+            photo_row.append(
+                Image(BytesIO(photo), width=LARGURA_FOTO, height=ALTURA_FOTO)
+            )
+
+            if (i + 1) % FOTOS_POR_LINHA == 0:
+                photo_table_data.append(photo_row)
+                photo_row = []
+            else:
+                photo_row.append(Spacer(1, ESPACO_ENTRE_FOTOS))  # type: ignore
+
+        if photo_row:
+            photo_table_data.append(photo_row)
+
+        photo_table = Table(
+            photo_table_data,
+            colWidths=[LARGURA_FOTO, ESPACO_ENTRE_FOTOS] * FOTOS_POR_LINHA,
+        )
+        photo_table.setStyle(
+            TableStyle(
+                [
+                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+                ]
+            )
+        )
+        content.append(photo_table)
+
+    content.append(PageBreak())
+    content.append(Spacer(1, 150))
+    content.extend(
+        [
+            Paragraph("____________________________________", signatures_style),
+            Paragraph("Locatário", signatures_style),
+            Paragraph("____________________________________", signatures_style),
+            Paragraph("Locador", signatures_style),
+            Paragraph("____________________________________", signatures_style),
+            Paragraph("Testemunha", signatures_style),
+            Spacer(1, 50),
+            Paragraph("Local: ________________________", signatures_style),
+            Paragraph("Data: __/__/____", signatures_style),
+        ]
+    )
+
+    doc.build(content)
+
+    return buffer.getvalue()
+
+
+def add_page_number(canvas, doc) -> None:
+    canvas.setFont("Helvetica", 10)
+    page_num_text = f"Página {doc.page}"
+    canvas.drawString(doc.pagesize[0] - 100, 15, page_num_text)
+
+
+def warm_up() -> None:
+    """Import ReportLab and load its fonts and styles before the first inspection."""
+    from reportlab.platypus import Paragraph, SimpleDocTemplate
+
+    styles = get_styles()
+    SimpleDocTemplate(BytesIO(), pagesize=A4).build(
+        [Paragraph("e-Aluguel", style) for style in styles.values()]
+    )
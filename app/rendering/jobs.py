@@ -0,0 +1,262 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core import database_session
+from app.core.config import get_settings
+from app.models.models import DocumentJob, Owner as User
+from app.rendering.contract import (
+    CONTRACT_PDF_FILENAME,
+    load_contract_document,
+    render_contract_pdf,
+)
+from app.rendering.report import REPORT_PDF_FILENAME, generate_report_pdf
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock key serializing job claims across processes
+CLAIM_LOCK_KEY = 0x646F63  # "doc"
+
+
+async def _build_contract(
+    session: AsyncSession, owner: User, parametros: dict
+) -> tuple[bytes, str]:
+    document = await load_contract_document(session, parametros["contract_id"], owner)
+    return await render_contract_pdf(document), CONTRACT_PDF_FILENAME
+
+
+async def _build_report(
+    session: AsyncSession, owner: User, parametros: dict
+) -> tuple[bytes, str]:
+    return await generate_report_pdf(session, owner), REPORT_PDF_FILENAME
+
+
+DocumentBuilder = Callable[[AsyncSession, User, dict], Awaitable[tuple[bytes, str]]]
+
+DOCUMENT_BUILDERS: dict[str, DocumentBuilder] = {
+    "contract": _build_contract,
+    "report": _build_report,
+}
+
+
+class DocumentJobRunner:
+    """Renders persisted document jobs in the background.
+
+    Jobs live in the ``documento_job`` table and every process claims them
+    from there: ``claim`` marks the oldest claimable job as running under a
+    new ``reserva`` in one UPDATE, so two processes never render the same
+    job. A job is claimable when it is pending, or when it is running but
+    its lease, ``lease_secs`` from the claim, ran out because its worker
+    died; a worker finishes a job only while it still holds the claim.
+
+    Each owner has at most ``max_concurrent_jobs_per_owner`` jobs running,
+    counted in the table, so over every process. Claims take a transaction
+    advisory lock, so two processes cannot both see an owner's last slot as
+    free.
+
+    Finished jobs, and their PDFs, are deleted ``retention_secs`` after they
+    finish, checked every ``purge_interval_secs``.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_jobs_per_owner: int,
+        workers: int = 4,
+        lease_secs: float = 600.0,
+        poll_interval_secs: float = 5.0,
+        retention_secs: float = 7 * 24 * 3600,
+        purge_interval_secs: float = 3600,
+    ):
+        self.max_concurrent_jobs_per_owner = max_concurrent_jobs_per_owner
+        self.workers = workers
+        self.lease_secs = lease_secs
+        self.poll_interval_secs = poll_interval_secs
+        self.retention_secs = retention_secs
+        self.purge_interval_secs = purge_interval_secs
+        self._tasks: set[asyncio.Task] = set()
+        self._wake = asyncio.Event()
+        self._loop_task: asyncio.Task | None = None
+
+    def submit(self, job_id: str) -> None:
+        """Tell the runner a job was queued, it is claimed like any other."""
+        self._wake.set()
+
+    async def claim(self) -> tuple[str, str] | None:
+        """Claim the next job, giving its id and the claim, or None."""
+        lease_cutoff = func.now() - timedelta(seconds=self.lease_secs)
+        candidate = aliased(DocumentJob)
+        running = aliased(DocumentJob)
+        owner_running = (
+            select(func.count())
+            .select_from(running)
+            .where(
+                running.user_id == candidate.user_id,
+                running.status == "running",
+                running.reservado_em >= lease_cutoff,
+            )
+            .scalar_subquery()
+        )
+        next_job = (
+            select(candidate.id)
+            .where(
+                or_(
+                    candidate.status == "pending",
+                    and_(
+                        candidate.status == "running",
+                        candidate.reservado_em < lease_cutoff,
+                    ),
+                ),
+                owner_running < self.max_concurrent_jobs_per_owner,
+            )
+            .order_by(candidate.create_time)
+            .limit(1)
+            .with_for_update(of=candidate, skip_locked=True)
+            .scalar_subquery()
+        )
+        reserva = str(uuid4())
+
+        async with database_session.get_async_session() as session:
+            await session.execute(select(func.pg_advisory_xact_lock(CLAIM_LOCK_KEY)))
+            job_id = await session.scalar(
+                update(DocumentJob)
+                .where(DocumentJob.id == next_job)
+                .values(status="running", reserva=reserva, reservado_em=func.now())
+                .returning(DocumentJob.id)
+            )
+            await session.commit()
+
+        return (job_id, reserva) if job_id is not None else None
+
+    async def run(self, job_id: str, reserva: str) -> None:
+        async with database_session.get_async_session() as session:
+            job = await session.scalar(
+                select(DocumentJob).where(
+                    DocumentJob.id == job_id, DocumentJob.reserva == reserva
+                )
+            )
+            if job is None:
+                return
+
+            try:
+                # a failed build only discards its own work, not the job row
+                async with session.begin_nested():
+                    owner = await session.scalar(
+                        select(User).where(User.user_id == job.user_id)
+                    )
+                    builder = DOCUMENT_BUILDERS[str(job.tipo)]
+                    content, filename = await builder(session, owner, job.parametros)  # type: ignore
+            except Exception as e:
+                logger.exception("Document job %s failed", job_id)
+                values: dict[str, Any] = {
+                    "status": "failed",
+                    "concluido_em": func.now(),
+                    "erro": e.detail if isinstance(e, HTTPException) else str(e),
+                }
+            else:
+                values = {
+                    "status": "done",
+                    "concluido_em": func.now(),
+                    "arquivo": content,
+                    "nome_arquivo": filename,
+                    "erro": None,
+                }
+
+            # after a lost claim the job may be someone else's, or done already
+            await session.execute(
+                update(DocumentJob)
+                .where(
+                    DocumentJob.id == job_id,
+                    DocumentJob.reserva == reserva,
+                    DocumentJob.status == "running",
+                )
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+    async def run_next(self) -> str | None:
+        """Claim and run one job, giving its id, or None when none was free."""
+        claimed = await self.claim()
+        if claimed is None:
+            return None
+        await self.run(*claimed)
+        return claimed[0]
+
+    async def purge(self) -> int:
+        """Delete the jobs that finished over ``retention_secs`` ago."""
+        async with database_session.get_async_session() as session:
+            result = await session.execute(
+                delete(DocumentJob).where(
+                    DocumentJob.status.in_(["done", "failed"]),
+                    DocumentJob.concluido_em
+                    < func.now() - timedelta(seconds=self.retention_secs),
+                )
+            )
+            await session.commit()
+        return result.rowcount
+
+    async def _claim_and_run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_purge = loop.time()
+        while True:
+            self._wake.clear()
+            try:
+                if loop.time() >= next_purge:
+                    next_purge = loop.time() + self.purge_interval_secs
+                    purged = await self.purge()
+                    if purged:
+                        logger.info("Purged %d finished document jobs", purged)
+                while len(self._tasks) < self.workers:
+                    claimed = await self.claim()
+                    if claimed is None:
+                        break
+                    task = asyncio.create_task(self.run(*claimed))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._finished)
+            except Exception:
+                # the database may be back by the next poll
+                logger.exception("Claiming document jobs failed")
+            try:
+                # polled too: jobs of other processes free owner slots, and
+                # expired leases are only noticed by looking
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval_secs)
+            except asyncio.TimeoutError:
+                pass
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        self._wake.set()
+
+    async def resume(self) -> None:
+        """Start claiming jobs, the ones left over by a stopped process too."""
+        self._loop_task = asyncio.create_task(self._claim_and_run())
+
+    async def shutdown(self) -> None:
+        tasks = set(self._tasks)
+        if self._loop_task is not None:
+            tasks.add(self._loop_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@lru_cache(maxsize=1)
+def get_document_job_runner() -> DocumentJobRunner:
+    settings = get_settings().documents
+    return DocumentJobRunner(
+        max_concurrent_jobs_per_owner=settings.max_concurrent_jobs_per_owner,
+        workers=settings.workers,
+        lease_secs=settings.lease_secs,
+        poll_interval_secs=settings.poll_interval_secs,
+        retention_secs=settings.retention_secs,
+        purge_interval_secs=settings.purge_interval_secs,
+    )
@@ -0,0 +1,163 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from typing import BinaryIO
+
+from fastapi import HTTPException, UploadFile, status
+
+import app.controllers.api.api_messages as api_messages
+from app.core.config import get_settings
+
+POINTS_PER_INCH = 72
+
+
+class InvalidPhotoError(ValueError):
+    pass
+
+
+def cell_size_in_pixels(width: float, height: float, dpi: int) -> tuple[int, int]:
+    """Pixel size of a ``width`` x ``height`` point cell printed at ``dpi``."""
+    return (
+        max(1, round(width / POINTS_PER_INCH * dpi)),
+        max(1, round(height / POINTS_PER_INCH * dpi)),
+    )
+
+
+def prepare_photo(fp: BinaryIO, size: tuple[int, int], quality: int) -> bytes:
+    """Downscale a photo to ``size`` and recompress it as an in-memory JPEG.
+
+    ``draft`` lets the JPEG decoder skip straight to a reduced scale, so a
+    camera image is never fully decoded just to be thrown away.
+    """
+    # Pillow pulls in NumPy when it is installed, so it is imported on first use
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        with Image.open(fp) as image:
+            longest = max(size)
+            image.draft("RGB", (longest, longest))
+            ImageOps.exif_transpose(image, in_place=True)
+            photo = image.convert("RGB")
+
+        if photo.width > size[0] or photo.height > size[1]:
+            photo = photo.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    # a truncated or corrupt image raises a plain OSError once it is decoded
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise InvalidPhotoError(str(e)) from e
+
+    buffer = BytesIO()
+    photo.save(buffer, "JPEG", quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=1)
+def get_photo_executor() -> ThreadPoolExecutor:
+    # Pillow releases the GIL while decoding, resizing and encoding
+    return ThreadPoolExecutor(
+        max_workers=get_settings().inspection_photos.workers,
+        thread_name_prefix="inspection-photos",
+    )
+
+
+async def prepare_photos(
+    photos: list[UploadFile], width: float, height: float
+) -> list[bytes]:
+    """Prepare every uploaded photo for a ``width`` x ``height`` point cell.
+
+    At most ``inspection_photos.workers`` photos are decoded at once, which
+    keeps peak memory bounded no matter how many photos were uploaded.
+    """
+    settings = get_settings().inspection_photos
+    size = cell_size_in_pixels(width, height, settings.dpi)
+    loop = asyncio.get_running_loop()
+    executor = get_photo_executor()
+
+    try:
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor, prepare_photo, photo.file, size, settings.jpeg_quality
+                )
+                for photo in photos
+            )
+        )
+    except InvalidPhotoError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=api_messages.INVALID_INSPECTION_PHOTO,
+        )
+
+
+def make_photo_variants(
+    fp: BinaryIO,
+    sizes: dict[str, int | None],
+    jpeg_quality: int,
+    webp_quality: int,
+    webp_method: int = 2,
+) -> dict[str, dict[str, bytes]]:
+    """Encode a photo as WebP and JPEG at each of ``sizes``.
+
+    ``sizes`` maps variant names to the longest side in pixels, ``None``
+    keeping the original size, from the largest variant to the smallest.
+    The photo is decoded once and each variant is scaled down from the
+    previous one.
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        with Image.open(fp) as image:
+            ImageOps.exif_transpose(image, in_place=True)
+            photo = image.convert("RGB")
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise InvalidPhotoError(str(e)) from e
+
+    variants = {}
+    for name, longest in sizes.items():
+        if longest is not None and max(photo.size) > longest:
+            photo = photo.copy()
+            photo.thumbnail(
+                (longest, longest), Image.Resampling.LANCZOS, reducing_gap=3.0
+            )
+
+        webp, jpeg = BytesIO(), BytesIO()
+        photo.save(webp, "WEBP", quality=webp_quality, method=webp_method)
+        photo.save(jpeg, "JPEG", quality=jpeg_quality, optimize=True, progressive=True)
+        variants[name] = {"webp": webp.getvalue(), "jpeg": jpeg.getvalue()}
+
+    return variants
+
+
+@lru_cache(maxsize=1)
+def get_photo_variants_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=get_settings().photo_variants.workers,
+        thread_name_prefix="photo-variants",
+    )
+
+
+async def prepare_photo_variants(photo: UploadFile) -> dict[str, dict[str, bytes]]:
+    """Original, medium and thumbnail variants of an uploaded photo."""
+    settings = get_settings().photo_variants
+    sizes = {
+        "original": None,
+        "medium": settings.medium_size,
+        "thumbnail": settings.thumbnail_size,
+    }
+    loop = asyncio.get_running_loop()
+
+    try:
+        return await loop.run_in_executor(
+            get_photo_variants_executor(),
+            make_photo_variants,
+            photo.file,
+            sizes,
+            settings.jpeg_quality,
+            settings.webp_quality,
+            settings.webp_method,
+        )
+    except InvalidPhotoError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=api_messages.INVALID_PHOTO,
+        )
@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import get_settings
+from app.rendering.engine import CONTRACT_STYLESHEET, TEMPLATES_DIR
+
+if TYPE_CHECKING:
+    from weasyprint import CSS  # type: ignore
+    from weasyprint.text.fonts import FontConfiguration  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+DISCONNECT_POLL_INTERVAL_SECS = 0.5
+WARM_UP_HTML = "<html><body><p>e-Aluguel</p></body></html>"
+WARM_UP_PING_SECS = 0.1
+WARM_UP_MAX_ROUNDS = 10
+
+# WeasyPrint is only imported by the worker processes, never by the web workers
+# per worker process: fonts and stylesheets are loaded once and reused
+_font_config: "FontConfiguration | None" = None
+_stylesheets: dict[str, "CSS"] = {}
+
+
+def _get_font_config() -> "FontConfiguration":
+    global _font_config
+    if _font_config is None:
+        from weasyprint.text.fonts import FontConfiguration
+
+        _font_config = FontConfiguration()
+    return _font_config
+
+
+def _get_stylesheet(name: str) -> "CSS":
+    if name not in _stylesheets:
+        from weasyprint import CSS
+
+        _stylesheets[name] = CSS(
+            filename=str(TEMPLATES_DIR / name), font_config=_get_font_config()
+        )
+    return _stylesheets[name]
+
+
+def render_html_to_pdf(html: str, stylesheet: str | None = None) -> bytes:
+    # runs inside a worker process
+    from weasyprint import HTML  # type: ignore
+
+    stylesheets = [_get_stylesheet(stylesheet)] if stylesheet is not None else []
+    return HTML(string=html).write_pdf(
+        stylesheets=stylesheets, font_config=_get_font_config()
+    )
+
+
+def _warm_up_worker() -> None:
+    # process pool initializer: imports WeasyPrint, builds the font cache and
+    # parses the stylesheets before the worker accepts its first real job
+    try:
+        render_html_to_pdf(WARM_UP_HTML, CONTRACT_STYLESHEET)
+    except Exception:
+        # a failed warm-up must not break the pool, the first job retries it
+        logger.exception("PDF renderer worker warm-up failed")
+
+
+def _worker_pid() -> int:
+    # held briefly so that concurrent pings land on different workers
+    time.sleep(WARM_UP_PING_SECS)
+    return os.getpid()
+
+
+class PDFRenderer:
+    """Renders PDFs in a process pool so WeasyPrint never blocks the event loop.
+
+    At most ``max_queue_size`` jobs may be queued or running at once; further
+    requests are rejected with 503 instead of piling up behind the workers.
+
+    Workers render a tiny document as soon as they start, so the first real
+    request does not pay for imports and font discovery, and the whole pool
+    is replaced after ``recycle_after_jobs`` renders to bound memory growth.
+    ``ready`` turns true once, after the first warm-up: the old pool keeps
+    serving while a replacement warms up, so a recycle never fails readiness.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        job_timeout_secs: float,
+        max_queue_size: int,
+        recycle_after_jobs: int = 0,
+    ):
+        self.workers = workers
+        self.job_timeout_secs = job_timeout_secs
+        self.max_queue_size = max_queue_size
+        self.recycle_after_jobs = recycle_after_jobs
+        self.pending = 0
+        self.completed_jobs = 0
+        self.ready = False
+        # whether the current pool is warm, readiness does not look at it
+        self._pool_warm = False
+        self._executor: Executor | None = None
+        self._warm_up_task: asyncio.Task | None = None
+
+    def _new_executor(self) -> Executor:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_up_worker,
+        )
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._new_executor()
+        return self._executor
+
+    async def warm_up(self) -> None:
+        """Start every worker process and wait until all of them are warm."""
+        self._pool_warm = False
+        from app.rendering import inspection
+
+        executor = self.executor
+        loop = asyncio.get_running_loop()
+        pids: set[int] = set()
+        try:
+            # inspection PDFs are built in-process, so ReportLab warms up here
+            reportlab_warm_up = loop.run_in_executor(None, inspection.warm_up)
+
+            # a worker only answers a ping after its warm-up initializer ran,
+            # so once every pid has answered the whole pool is warm
+            for _ in range(WARM_UP_MAX_ROUNDS):
+                pids.update(
+                    await asyncio.gather(
+                        *(
+                            loop.run_in_executor(executor, _worker_pid)
+                            for _ in range(self.workers)
+                        )
+                    )
+                )
+                if len(pids) >= self.workers:
+                    break
+
+            await reportlab_warm_up
+        except Exception:
+            logger.exception("PDF renderer warm-up failed")
+            return
+        if executor is self._executor:
+            self._pool_warm = True
+            self.ready = True
+            logger.info("PDF renderer warm, worker pids %s", sorted(pids))
+
+    def start_warm_up(self) -> None:
+        self._warm_up_task = asyncio.create_task(self.warm_up())
+
+    def _recycle(self) -> None:
+        # queued and running jobs still finish on the old pool, new jobs go to
+        # a fresh one that warms up in the background
+        old_executor = self._executor
+        self._executor = None
+        self._pool_warm = False
+        self.completed_jobs = 0
+        if old_executor is not None:
+            old_executor.shutdown(wait=False)
+        self.start_warm_up()
+
+    async def render(
+        self,
+        html: str,
+        request: Request | None = None,
+        stylesheet: str | None = None,
+    ) -> bytes:
+        if self.pending >= self.max_queue_size:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="PDF renderer is busy, try again later",
+                headers={"Retry-After": "5"},
+            )
+
+        self.pending += 1
+        loop = asyncio.get_running_loop()
+        job = loop.run_in_executor(
+            self.executor, render_html_to_pdf, html, stylesheet
+        )
+        watcher = (
+            asyncio.ensure_future(_wait_for_disconnect(request))
+            if request is not None
+            else None
+        )
+
+        waiting: set[asyncio.Future[Any]] = {job}
+        if watcher is not None:
+            waiting.add(watcher)
+
+        try:
+            done, _ = await asyncio.wait(
+                waiting,
+                timeout=self.job_timeout_secs,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if job in done:
+                pdf = job.result()
+                self.completed_jobs += 1
+                if 0 < self.recycle_after_jobs <= self.completed_jobs:
+                    self._recycle()
+                return pdf
+
+            # a job that already started keeps its worker until it finishes,
+            # but queued jobs are dropped before they ever reach a worker
+            job.cancel()
+            if watcher is not None and watcher in done:
+                raise asyncio.CancelledError()
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="PDF rendering timed out",
+            )
+        finally:
+            self.pending -= 1
+            if watcher is not None:
+                watcher.cancel()
+
+    def shutdown(self) -> None:
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pool_warm = False
+        self.ready = False
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_INTERVAL_SECS)
+
+
+@lru_cache(maxsize=1)
+def get_pdf_renderer() -> PDFRenderer:
+    settings = get_settings().renderer
+    return PDFRenderer(
+        workers=settings.workers,
+        job_timeout_secs=settings.job_timeout_secs,
+        max_queue_size=settings.max_queue_size,
+        recycle_after_jobs=settings.recycle_after_jobs,
+    )
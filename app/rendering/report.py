@@ -0,0 +1,205 @@
+from fastapi import HTTPException, Request
+from sqlalchemy import select, func, extract
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+
+from app.models.models import (
+    Owner as User,
+    Properties,
+    Houses,
+    PaymentInstallment,
+    Expenses,
+    Contract,
+)
+from app.rendering.charts import (
+    expenses_by_type_chart,
+    income_expense_chart,
+    occupancy_chart,
+)
+from app.rendering.renderer import get_pdf_renderer
+
+REPORT_PDF_FILENAME = "report.pdf"
+
+
+async def generate_report_pdf(
+    session: AsyncSession, owner: User, request: Request | None = None
+) -> bytes:
+    current_year = datetime.now().year
+    try:
+        payments_last_year = await session.execute(
+            select(func.sum(PaymentInstallment.valor_parcela))
+            .join(Contract, PaymentInstallment.contrato_id == Contract.id)
+            .where(
+                extract("year", PaymentInstallment.data_vencimento) == current_year,
+                PaymentInstallment.fg_pago == True,
+                Contract.user_id == owner.user_id,
+            )
+        )
+        total_payments_last_year = float(payments_last_year.scalar() or 0)
+
+        expenses_last_year = await session.execute(
+            select(func.sum(Expenses.valor))
+            .join(Houses)
+            .join(Properties)
+            .where(
+                extract("year", Expenses.data_despesa) == current_year,
+                Properties.user_id == owner.user_id,
+            )
+        )
+        total_expenses_last_year = float(expenses_last_year.scalar() or 0)
+
+        expenses_by_type = await session.execute(
+            select(Expenses.tipo_despesa, func.sum(Expenses.valor))
+            .join(Houses, Expenses.casa_id == Houses.id)
+            .join(Properties, Houses.propriedade_id == Properties.id)
+            .where(
+                extract("year", Expenses.data_despesa) == current_year,
+                Properties.user_id == owner.user_id,
+            )
+            .group_by(Expenses.tipo_despesa)
+        )
+        expenses_by_type_list = [
+            (tipo_despesa, float(valor))
+            for tipo_despesa, valor in expenses_by_type.all()
+        ]
+
+        occupancy = await session.execute(
+            select(Houses.status, func.count(Houses.id))
+            .join(Properties)
+            .where(Properties.user_id == owner.user_id)
+            .group_by(Houses.status)
+        )
+        occupancy_list = [(status, int(count)) for status, count in occupancy.all()]
+
+        total_houses = sum(count for _, count in occupancy_list)
+
+        income_by_month = await session.execute(
+            select(
+                extract("month", PaymentInstallment.data_vencimento).label("month"),
+                func.sum(PaymentInstallment.valor_parcela).label("income"),
+            )
+            .join(Contract, PaymentInstallment.contrato_id == Contract.id)
+            .join(Houses, Contract.casa_id == Houses.id)
+            .join(Properties, Houses.propriedade_id == Properties.id)
+            .where(
+                extract("year", PaymentInstallment.data_vencimento) == current_year,
+                PaymentInstallment.fg_pago == True,
+                Properties.user_id == owner.user_id,
+            )
+            .group_by("month")
+        )
+        income_by_month_list = income_by_month.fetchall()
+
+        expense_by_month = await session.execute(
+            select(
+                extract("month", Expenses.data_despesa).label("month"),
+                func.sum(Expenses.valor).label("expense"),
+            )
+            .join(Houses, Expenses.casa_id == Houses.id)
+            .join(Properties, Houses.propriedade_id == Properties.id)
+            .where(
+                extract("year", Expenses.data_despesa) == current_year,
+                Properties.user_id == owner.user_id,
+            )
+            .group_by("month")
+        )
+        expense_by_month_list = expense_by_month.fetchall()
+
+        income_by_month_map = {
+            int(row.month): float(row.income) for row in income_by_month_list
+        }
+        expense_by_month_map = {
+            int(row.month): float(row.expense) for row in expense_by_month_list
+        }
+        months = tuple(sorted(income_by_month_map.keys() | expense_by_month_map.keys()))
+
+        figure_expenses = expenses_by_type_chart(
+            tuple(tipo_despesa for tipo_despesa, _ in expenses_by_type_list),
+            tuple(valor for _, valor in expenses_by_type_list),
+        )
+        figure_occupancy = occupancy_chart(
+            tuple(status for status, _ in occupancy_list),
+            tuple(count for _, count in occupancy_list),
+        )
+        figure_income_expense = income_expense_chart(
+            months,
+            tuple(income_by_month_map.get(month, 0.0) for month in months),
+            tuple(expense_by_month_map.get(month, 0.0) for month in months),
+        )
+
+        if expenses_by_type_list:
+            maior_tipo_despesa = max(expenses_by_type_list, key=lambda row: row[1])[0]
+        else:
+            maior_tipo_despesa = "N/A"
+
+        if occupancy_list:
+            status_mais_comum = max(occupancy_list, key=lambda row: row[1])[0]
+        else:
+            status_mais_comum = "N/A"
+
+        html_template = f"""
+        <html>
+        <head>
+            <style>
+            body {{ font-family: Arial, sans-serif; }}
+            h1 {{ color: #333; }}
+            svg {{ width: 100%; max-width: 600px; height: auto; }}
+            table {{ width: 100%; border-collapse: collapse; }}
+            th, td {{ border: 1px solid #333; padding: 8px; text-align: center; }}
+            </style>
+        </head>
+        <body>
+            <h1>Relatório e-Aluguel</h1>
+            <h2>Informações Financeiras</h2>
+            <p>Este relatório apresenta uma análise detalhada das receitas e despesas do último ano, bem como insights sobre a distribuição de despesas por tipo e a taxa de ocupação dos imóveis.</p>
+
+            <h3>Gráfico de Despesas por Tipo</h3>
+            {figure_expenses}
+            
+            <h3>Taxa de Ocupação dos Imóveis</h3>
+            {figure_occupancy}
+            <p>Total de Imóveis: <b>{total_houses}</b></p>
+
+            <h3>Receita e Despesa por Mês</h3>
+            {figure_income_expense}
+
+            <h3>Resumo</h3>
+            <p>No último ano, a receita totalizou <b>{total_payments_last_year:.2f} R$</b>, enquanto as despesas foram de <b>{total_expenses_last_year:.2f} R$</b>, resultando em um saldo <b>{(total_payments_last_year - total_expenses_last_year):.2f}</b> R$.</p>
+            <p>O tipo de despesa com maior impacto foi <b>{maior_tipo_despesa.capitalize()}</b>.</p>
+            <p>A maior parte dos imóveis está com o status <b>{status_mais_comum.capitalize()}</b>.</p>
+
+            <h2>Informações Adicionais</h2>
+
+            <h3>Receita por Mês</h3>
+            <table>
+                <tr>
+                    <th>Mês</th>
+                    <th>Receita (R$)</th>
+                </tr>
+                {"".join(f"<tr><td>{row.month}</td><td>{row.income:.2f}</td></tr>" for row in income_by_month_list)}
+            </table>
+
+            <h3>Despesa por Mês</h3>
+            <table>
+                <tr>
+                    <th>Mês</th>
+                    <th>Despesa (R$)</th>
+                </tr>
+                {"".join(f'<tr><td>{row.month}</td><td>{row.expense:.2f}</td></tr>' for row in expense_by_month_list)}
+            </table>
+            <br>
+            <p>Gerado em: {datetime.now().strftime("%d/%m/%Y %H:%M:%S")}</p>
+
+
+        </body>
+        </html>
+        """
+        return await get_pdf_renderer().render(html_template, request)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erro ao gerar relatório: {e} Cadastre despesas e receitas para o ano corrente.",
+        )
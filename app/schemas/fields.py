@@ -0,0 +1,86 @@
+"""Sparse fieldsets, the ``?fields=`` query parameter of list routes.
+
+``sparse_fields(Model)`` is the route dependency, giving the requested
+response field names in the model's order, or None for every field.
+``orm_columns`` turns them into the entity columns for ``load_only``, so
+the query selects only those, and ``fields_adapter`` validates and renders
+rows through a model holding just those fields.
+"""
+from functools import lru_cache
+from typing import Any, ClassVar, Optional
+
+from fastapi import Depends, HTTPException, Query, status
+from pydantic import BaseModel, TypeAdapter, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstrumentedAttribute, Mapper
+
+import app.controllers.api.api_messages as api_messages
+
+
+def sparse_fields(model: type[BaseModel]) -> Any:
+    names = list(model.model_fields)
+
+    def requested_fields(
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated fields to return instead of all of "
+            f"them, any of: {', '.join(names)}",
+        ),
+    ) -> tuple[str, ...] | None:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",")}
+        unknown = sorted(requested - set(names))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{api_messages.UNKNOWN_FIELDS}: {', '.join(unknown)}",
+            )
+        return tuple(name for name in names if name in requested)
+
+    return Depends(requested_fields)
+
+
+def orm_attribute(model: type[BaseModel], name: str) -> str:
+    """The ORM attribute behind a response field, see its validation alias."""
+    alias = model.model_fields[name].validation_alias
+    return alias if isinstance(alias, str) else name
+
+
+def orm_columns(
+    model: type[BaseModel], entity: type, fields: tuple[str, ...]
+) -> list[InstrumentedAttribute]:
+    """``entity`` columns for ``fields``, always with its primary key.
+
+    Fields that are not columns of ``entity``, like a nested response, are
+    left to the caller.
+    """
+    mapper: Mapper[Any] = inspect(entity)
+    keys = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+    for name in fields:
+        key = orm_attribute(model, name)
+        if key in mapper.column_attrs and key not in keys:
+            keys.append(key)
+    return [getattr(entity, key) for key in keys]
+
+
+@lru_cache(maxsize=128)
+def fields_adapter(
+    model: type[BaseModel], fields: tuple[str, ...]
+) -> TypeAdapter[list[Any]]:
+    """List adapter for a model with only ``fields`` of ``model``.
+
+    A subclass of ``model``, keeping its config and validators, where the
+    other fields are shadowed by class variables and so are neither read
+    nor rendered.
+    """
+    subset = create_model(  # type: ignore[call-overload]
+        f"{model.__name__}Fields",
+        __base__=model,
+        **{
+            name: (ClassVar[Any], None)
+            for name in model.model_fields
+            if name not in fields
+        },
+    )
+    return TypeAdapter(list[subset])  # type: ignore[valid-type]
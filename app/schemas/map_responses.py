@@ -1,3 +1,7 @@
+from typing import Any, Iterable
+
+from pydantic import TypeAdapter
+
 from app.models.models import (
     Houses,
     Properties,
@@ -9,6 +13,7 @@ from app.models.models import (
     Guarantor,
     PaymentInstallment,
     Inspection,
+    DocumentJob,
 )
 from app.schemas.responses import (
     HouseResponse,
@@ -21,193 +26,98 @@ from app.schemas.responses import (
     GuarantorResponse,
     PaymentInstallmentResponse,
     InspectionResponse,
+    DocumentJobResponse,
+    ValidatedJSONResponse,
 )
 
+# built once at import, each builds its validator and serializer
+HOUSE_LIST = TypeAdapter(list[HouseResponse])
+PROPERTY_LIST = TypeAdapter(list[PropertyResponse])
+TENANT_LIST = TypeAdapter(list[TenantResponse])
+TEMPLATE_LIST = TypeAdapter(list[TemplateResponse])
+CONTRACT_LIST = TypeAdapter(list[ContractResponse])
+EXPENSE_LIST = TypeAdapter(list[ExpenseResponse])
+PAYMENT_INSTALLMENT_LIST = TypeAdapter(list[PaymentInstallmentResponse])
+
 
 def map_property_to_response(property: Properties) -> PropertyResponse:
-    return PropertyResponse(
-        id=property.id,
-        nickname=property.apelido,
-        photo=property.foto,
-        iptu=property.iptu,
-        owner_id=property.user_id,
-        street=property.rua,
-        neighborhood=property.bairro,
-        number=property.numero,
-        zip_code=property.cep,
-        city=property.cidade,
-        state=property.estado,
-    )
+    return PropertyResponse.model_validate(property)
 
 
 def map_user_to_response(user: Owner) -> UserResponse:
-    return UserResponse(
-        user_id=user.user_id,
-        email=user.email,
-        telephone=user.telefone,
-        hashed_signature=user.assinatura_hash,
-        cpf=user.cpf,
-        birth_date=user.data_nascimento,
-        name=user.nome,
-        photo=user.foto,
-        profession=user.profissao,
-        marital_status=user.estado_civil,
-        street=user.rua,
-        neighborhood=user.bairro,
-        number=user.numero,
-        zip_code=user.cep,
-        city=user.cidade,
-        state=user.estado,
-    )
+    return UserResponse.model_validate(user)
 
 
 def map_house_to_response(house: Houses) -> HouseResponse:
-    return HouseResponse(
-        id=house.id,
-        property_id=house.propriedade_id,
-        photo=house.foto,
-        nickname=house.apelido,
-        room_count=house.qtd_comodos,
-        bathrooms=house.banheiros,
-        furnished=house.mobiliada,
-        status=str(house.status),
-    )
+    return HouseResponse.model_validate(house)
 
 
 def map_tenant_to_response(tenant: Tenant) -> TenantResponse:
-    return TenantResponse(
-        id=tenant.id,
-        cpf=tenant.cpf,
-        contact=tenant.contato,
-        email=tenant.email,
-        name=tenant.nome,
-        profession=tenant.profissao,
-        marital_status=tenant.estado_civil,
-        birth_date=tenant.data_nascimento,
-        emergency_contact=tenant.contato_emergencia,
-        income=tenant.renda,
-        residents=tenant.num_residentes,
-        street=tenant.rua,
-        neighborhood=tenant.bairro,
-        number=tenant.numero,
-        zip_code=tenant.cep,
-        city=tenant.cidade,
-        state=tenant.estado,
-    )
+    return TenantResponse.model_validate(tenant)
 
 
 def map_template_to_response(template: Template) -> TemplateResponse:
-    return TemplateResponse(
-        id=template.id,
-        template_name=template.nome_template,
-        description=template.descricao,
-        garage=template.garagem,
-        warranty=str(template.garantia),
-        animals=template.animais,
-        sublease=template.sublocacao,
-        contract_type=str(template.tipo_contrato),
-    )
+    return TemplateResponse.model_validate(template)
 
 
 def map_contract_to_response(
     contract: Contract, house: Houses, tenant: Tenant
 ) -> ContractResponse:
-    return ContractResponse(
-        id=contract.id,
-        deposit_value=contract.valor_caucao,
-        start_date=contract.data_inicio,
-        end_date=contract.data_fim,
-        base_value=contract.valor_base,
-        due_date=contract.dia_vencimento,
-        reajustment_rate=str(contract.taxa_reajuste),
-        signed_pdf=contract.pdf_assinado,
-        house_id=contract.casa_id,
-        template_id=contract.template_id,
-        tenant_id=contract.inquilino_id,
-        user_id=contract.user_id,
-        house=HouseResponse(
-            id=house.id,
-            property_id=house.propriedade_id,
-            photo=house.foto,
-            nickname=house.apelido,
-            room_count=house.qtd_comodos,
-            bathrooms=house.banheiros,
-            furnished=house.mobiliada,
-            status=str(house.status),
-        ),
-        tenant=TenantResponse(
-            id=tenant.id,
-            cpf=tenant.cpf,
-            contact=tenant.contato,
-            email=tenant.email,
-            name=tenant.nome,
-            profession=tenant.profissao,
-            marital_status=tenant.estado_civil,
-            birth_date=tenant.data_nascimento,
-            emergency_contact=tenant.contato_emergencia,
-            income=tenant.renda,
-            residents=tenant.num_residentes,
-            street=tenant.rua,
-            neighborhood=tenant.bairro,
-            number=tenant.numero,
-            zip_code=tenant.cep,
-            city=tenant.cidade,
-            state=tenant.estado,
-        ),
+    return ContractResponse.model_validate(
+        {
+            "id": contract.id,
+            "valor_caucao": contract.valor_caucao,
+            "data_inicio": contract.data_inicio,
+            "data_fim": contract.data_fim,
+            "valor_base": contract.valor_base,
+            "dia_vencimento": contract.dia_vencimento,
+            "taxa_reajuste": contract.taxa_reajuste,
+            "pdf_assinado": contract.pdf_assinado,
+            "casa_id": contract.casa_id,
+            "template_id": contract.template_id,
+            "inquilino_id": contract.inquilino_id,
+            "user_id": contract.user_id,
+            "house": house,
+            "tenant": tenant,
+        }
     )
 
 
 def map_expense_to_response(expense: Expenses) -> ExpenseResponse:
-    return ExpenseResponse(
-        id=expense.id,
-        expense_type=str(expense.tipo_despesa),
-        value=expense.valor,
-        expense_date=expense.data_despesa,
-        house_id=expense.casa_id,
-    )
+    return ExpenseResponse.model_validate(expense)
 
 
 def map_guarantor_to_response(guarantor: Guarantor) -> GuarantorResponse:
-    return GuarantorResponse(
-        id=guarantor.id,
-        tenant_id=guarantor.inquilino_id,
-        cpf=guarantor.cpf,
-        contact=guarantor.contato,
-        email=guarantor.email,
-        name=guarantor.nome,
-        profession=guarantor.profissao,
-        marital_status=guarantor.estado_civil,
-        birth_date=guarantor.data_nascimento,
-        comment=guarantor.comentario,
-        income=guarantor.renda,
-        street=guarantor.rua,
-        neighborhood=guarantor.bairro,
-        number=guarantor.numero,
-        zip_code=guarantor.cep,
-        city=guarantor.cidade,
-        state=guarantor.estado,
-    )
+    return GuarantorResponse.model_validate(guarantor)
 
 
 def map_payment_installment_to_response(
     payment_installment: PaymentInstallment,
 ) -> PaymentInstallmentResponse:
-    return PaymentInstallmentResponse(
-        id=payment_installment.id,
-        installment_value=payment_installment.valor_parcela,
-        fg_paid=payment_installment.fg_pago,
-        payment_type=str(payment_installment.tipo_pagamento),
-        due_date=payment_installment.data_vencimento,
-        payment_date=payment_installment.data_pagamento,
-        contract_id=payment_installment.contrato_id,
-    )
+    return PaymentInstallmentResponse.model_validate(payment_installment)
 
 
 def map_inspection_to_response(inspection: Inspection) -> InspectionResponse:
-    return InspectionResponse(
-        id=inspection.id,
-        pdf_inspection=inspection.pdf_vistoria,
-        signed_pdf=inspection.pdf_assinado,
-        inspection_date=inspection.data_vistoria,
-        contract_id=inspection.contrato_id,
+    return InspectionResponse.model_validate(inspection)
+
+
+def map_document_job_to_response(job: DocumentJob) -> DocumentJobResponse:
+    return DocumentJobResponse(
+        id=job.id,
+        kind=str(job.tipo),
+        status=str(job.status),
+        error=job.erro,
+        contract_id=job.parametros.get("contract_id"),
+        file_name=job.nome_arquivo,
+        created_at=job.create_time,
+        updated_at=job.update_time,
+    )
+
+
+def map_list_to_response(
+    adapter: TypeAdapter[list[Any]], rows: Iterable[Any]
+) -> ValidatedJSONResponse:
+    """Validate ORM rows, or responses already built, once and render them."""
+    return ValidatedJSONResponse(
+        adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
     )
@@ -32,6 +32,10 @@ class UserUpdateRequest(BaseModel):
     state: Optional[str] = None
 
 
+class UploadConfirmRequest(BaseRequest):
+    upload_token: str
+
+
 class PasswordResetRequest(BaseModel):
     email: EmailStr
 
@@ -383,6 +387,15 @@ class PaymentInstallmentUpdateRequest(BaseModel):
     payment_date: date
 
 
+class DocumentKind(str, Enum):
+    contract = "contract"
+    report = "report"
+
+
+class DocumentJobCreateRequest(BaseModel):
+    contract_id: Optional[int] = None
+
+
 # Inspection
 class EstadoPintura(str, Enum):
     nova = "Nova"
@@ -1,7 +1,14 @@
-from datetime import date
-from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
-from typing import List, Optional
-from fastapi.responses import Response
+from datetime import date, datetime
+from decimal import Decimal
+import orjson
+from pydantic import BaseModel, BeforeValidator, ConfigDict, EmailStr, Field
+from typing import Annotated, Any, List, Optional
+from fastapi.encoders import decimal_encoder
+from fastapi.responses import JSONResponse, Response
+
+
+# always went through str(), a missing value reads "None"
+Stringified = Annotated[Optional[str], BeforeValidator(str)]
 
 
 class BaseResponse(BaseModel):
@@ -16,176 +23,238 @@ class AccessTokenResponse(BaseResponse):
     refresh_token_expires_at: int
 
 
+class PhotoVariant(BaseModel):
+    webp: str
+    jpeg: str
+
+
+class PhotoVariants(BaseModel):
+    thumbnail: PhotoVariant
+    medium: PhotoVariant
+    original: PhotoVariant
+
+
+# Response models carry the ORM column names as validation aliases, so
+# ``model_validate(row)`` builds them straight from a row, see map_responses.
+
+
 class UserResponse(BaseResponse):
     user_id: str
     email: EmailStr
-    telephone: str
-    hashed_signature: Optional[str]
+    telephone: str = Field(validation_alias="telefone")
+    hashed_signature: Optional[str] = Field(validation_alias="assinatura_hash")
     cpf: str
-    birth_date: date
-    name: str
-    photo: Optional[str]
-    profession: Optional[str]
-    marital_status: Optional[str]
-
-    street: Optional[str]
-    neighborhood: Optional[str]
-    number: Optional[int]
-    zip_code: str
-    city: Optional[str]
-    state: Optional[str]
+    birth_date: date = Field(validation_alias="data_nascimento")
+    name: str = Field(validation_alias="nome")
+    photo: Optional[str] = Field(validation_alias="foto")
+    photo_variants: Optional[PhotoVariants] = Field(
+        default=None, validation_alias="foto_variantes"
+    )
+    profession: Optional[str] = Field(validation_alias="profissao")
+    marital_status: Optional[str] = Field(validation_alias="estado_civil")
+
+    street: Optional[str] = Field(validation_alias="rua")
+    neighborhood: Optional[str] = Field(validation_alias="bairro")
+    number: Optional[int] = Field(validation_alias="numero")
+    zip_code: str = Field(validation_alias="cep")
+    city: Optional[str] = Field(validation_alias="cidade")
+    state: Optional[str] = Field(validation_alias="estado")
 
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class PropertyResponse(BaseModel):
     id: int
-    nickname: str
-    photo: Optional[str]
+    nickname: str = Field(validation_alias="apelido")
+    photo: Optional[str] = Field(validation_alias="foto")
+    photo_variants: Optional[PhotoVariants] = Field(
+        default=None, validation_alias="foto_variantes"
+    )
     iptu: float
-    owner_id: str
+    owner_id: str = Field(validation_alias="user_id")
 
-    street: Optional[str]
-    neighborhood: Optional[str]
-    number: Optional[int]
-    zip_code: str
-    city: Optional[str]
-    state: Optional[str]
+    street: Optional[str] = Field(validation_alias="rua")
+    neighborhood: Optional[str] = Field(validation_alias="bairro")
+    number: Optional[int] = Field(validation_alias="numero")
+    zip_code: str = Field(validation_alias="cep")
+    city: Optional[str] = Field(validation_alias="cidade")
+    state: Optional[str] = Field(validation_alias="estado")
 
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class HouseResponse(BaseModel):
     id: int
-    property_id: int
-    photo: Optional[str]
-    nickname: str
-    room_count: int
-    bathrooms: int
-    furnished: bool
+    property_id: int = Field(validation_alias="propriedade_id")
+    photo: Optional[str] = Field(validation_alias="foto")
+    photo_variants: Optional[PhotoVariants] = Field(
+        default=None, validation_alias="foto_variantes"
+    )
+    nickname: str = Field(validation_alias="apelido")
+    room_count: int = Field(validation_alias="qtd_comodos")
+    bathrooms: int = Field(validation_alias="banheiros")
+    furnished: bool = Field(validation_alias="mobiliada")
     status: str
 
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class TenantResponse(BaseModel):
     id: int
     cpf: str
-    contact: str
+    contact: str = Field(validation_alias="contato")
     email: Optional[str]
-    name: str
-    profession: Optional[str]
-    marital_status: Optional[str]
-    birth_date: Optional[date]
-    emergency_contact: Optional[str]
-    income: Optional[float]
-    residents: Optional[int]
-
-    street: Optional[str]
-    neighborhood: Optional[str]
-    number: Optional[int]
-    zip_code: str
-    city: Optional[str]
-    state: Optional[str]
+    name: str = Field(validation_alias="nome")
+    profession: Optional[str] = Field(validation_alias="profissao")
+    marital_status: Optional[str] = Field(validation_alias="estado_civil")
+    birth_date: Optional[date] = Field(validation_alias="data_nascimento")
+    emergency_contact: Optional[str] = Field(validation_alias="contato_emergencia")
+    income: Optional[float] = Field(validation_alias="renda")
+    residents: Optional[int] = Field(validation_alias="num_residentes")
+
+    street: Optional[str] = Field(validation_alias="rua")
+    neighborhood: Optional[str] = Field(validation_alias="bairro")
+    number: Optional[int] = Field(validation_alias="numero")
+    zip_code: str = Field(validation_alias="cep")
+    city: Optional[str] = Field(validation_alias="cidade")
+    state: Optional[str] = Field(validation_alias="estado")
 
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class TemplateResponse(BaseModel):
     id: int
-    template_name: str
-    description: Optional[str]
-    garage: bool
-    warranty: str
-    animals: bool
-    sublease: bool
-    contract_type: str
+    template_name: str = Field(validation_alias="nome_template")
+    description: Optional[str] = Field(validation_alias="descricao")
+    garage: bool = Field(validation_alias="garagem")
+    warranty: str = Field(validation_alias="garantia")
+    animals: bool = Field(validation_alias="animais")
+    sublease: bool = Field(validation_alias="sublocacao")
+    contract_type: str = Field(validation_alias="tipo_contrato")
 
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class ContractResponse(BaseModel):
     id: int
-    deposit_value: Optional[float]
-    start_date: date
-    end_date: date
-    base_value: float
-    due_date: int
-    reajustment_rate: Optional[str]
-    signed_pdf: Optional[str]
-    house_id: int
+    deposit_value: Optional[float] = Field(validation_alias="valor_caucao")
+    start_date: date = Field(validation_alias="data_inicio")
+    end_date: date = Field(validation_alias="data_fim")
+    base_value: float = Field(validation_alias="valor_base")
+    due_date: int = Field(validation_alias="dia_vencimento")
+    reajustment_rate: Stringified = Field(validation_alias="taxa_reajuste")
+    signed_pdf: Optional[str] = Field(validation_alias="pdf_assinado")
+    house_id: int = Field(validation_alias="casa_id")
     template_id: int
-    tenant_id: int
+    tenant_id: int = Field(validation_alias="inquilino_id")
     user_id: str
     house: HouseResponse
     tenant: TenantResponse
 
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class ExpenseResponse(BaseModel):
     id: int
-    expense_type: str
-    value: float
-    expense_date: date
-    house_id: int
+    expense_type: str = Field(validation_alias="tipo_despesa")
+    value: float = Field(validation_alias="valor")
+    expense_date: date = Field(validation_alias="data_despesa")
+    house_id: int = Field(validation_alias="casa_id")
 
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class GuarantorResponse(BaseModel):
     id: int
-    tenant_id: int
+    tenant_id: int = Field(validation_alias="inquilino_id")
     cpf: str
-    contact: str
+    contact: str = Field(validation_alias="contato")
     email: Optional[str]
-    name: str
-    profession: Optional[str]
-    marital_status: Optional[str]
-    birth_date: Optional[date]
-    comment: Optional[str]
-    income: Optional[float]
-
-    street: Optional[str]
-    neighborhood: Optional[str]
-    number: Optional[int]
-    zip_code: str
-    city: Optional[str]
-    state: Optional[str]
+    name: str = Field(validation_alias="nome")
+    profession: Optional[str] = Field(validation_alias="profissao")
+    marital_status: Optional[str] = Field(validation_alias="estado_civil")
+    birth_date: Optional[date] = Field(validation_alias="data_nascimento")
+    comment: Optional[str] = Field(validation_alias="comentario")
+    income: Optional[float] = Field(validation_alias="renda")
+
+    street: Optional[str] = Field(validation_alias="rua")
+    neighborhood: Optional[str] = Field(validation_alias="bairro")
+    number: Optional[int] = Field(validation_alias="numero")
+    zip_code: str = Field(validation_alias="cep")
+    city: Optional[str] = Field(validation_alias="cidade")
+    state: Optional[str] = Field(validation_alias="estado")
 
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class PaymentInstallmentResponse(BaseModel):
     id: int
-    installment_value: float
-    fg_paid: bool
-    payment_type: Optional[str]
-    due_date: date
-    payment_date: Optional[date]
-    contract_id: int
+    installment_value: float = Field(validation_alias="valor_parcela")
+    fg_paid: bool = Field(validation_alias="fg_pago")
+    payment_type: Stringified = Field(validation_alias="tipo_pagamento")
+    due_date: date = Field(validation_alias="data_vencimento")
+    payment_date: Optional[date] = Field(validation_alias="data_pagamento")
+    contract_id: int = Field(validation_alias="contrato_id")
 
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class InspectionResponse(BaseModel):
     id: int
-    pdf_inspection: str
-    signed_pdf: Optional[str]
-    inspection_date: date
-    contract_id: int
+    pdf_inspection: str = Field(validation_alias="pdf_vistoria")
+    signed_pdf: Optional[str] = Field(validation_alias="pdf_assinado")
+    inspection_date: date = Field(validation_alias="data_vistoria")
+    contract_id: int = Field(validation_alias="contrato_id")
 
     class Config:
         from_attributes = True
+        populate_by_name = True
+
+
+class DocumentJobResponse(BaseModel):
+    id: str
+    kind: str
+    status: str
+    error: Optional[str]
+    contract_id: Optional[int]
+    file_name: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SignedUploadResponse(BaseModel):
+    upload_url: str
+    method: str = "PUT"
+    headers: dict[str, str]
+    upload_token: str
+    expires_at: int
+
+
+class ReadinessResponse(BaseModel):
+    status: str
+    renderer_workers: int
+    renderer_warm: bool
 
 
 class DashboardResponse(BaseModel):
@@ -217,10 +286,44 @@ class DashboardResponse(BaseModel):
     class Config:
         from_attributes = True
 
+def _orjson_default(value: Any) -> Any:
+    # date, datetime and UUID are encoded by orjson itself
+    if isinstance(value, Decimal):
+        return decimal_encoder(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """The app's default response class, encoding with orjson.
+
+    Routes with a ``response_model`` hand it JSON-ready data already; for
+    content built by hand, dates, UUIDs and Decimals are encoded as
+    FastAPI's ``jsonable_encoder`` would.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+class ValidatedJSONResponse(JSONResponse):
+    """JSON rendered from response models that were already validated.
+
+    FastAPI passes a returned ``Response`` through as is. Returning plain
+    models instead makes it dump them to dicts and validate those again
+    against ``response_model`` before rendering; routes using this keep
+    ``response_model`` for the OpenAPI schema only.
+    """
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
 class PDFResponse(Response):
     media_type = "application/pdf"
 
     def __init__(self, content: bytes, filename: str = "document.pdf", *args, **kwargs):
-        headers = kwargs.get("headers", {})
+        headers = kwargs.pop("headers", None) or {}
         headers["Content-Disposition"] = f'inline; filename="{filename}"'
         super().__init__(content=content, headers=headers, *args, **kwargs)  # type: ignore
@@ -0,0 +1,38 @@
+from functools import lru_cache
+from pathlib import Path
+
+from app.core.config import get_settings
+from app.helpers.get_service_account import get_service_account
+from app.storage.base import Storage
+from app.storage.local import LocalStorage
+from app.storage.memory import MemoryStorage
+
+
+@lru_cache(maxsize=4)
+def get_local_storage(
+    directory: Path, public_url: str, accel_redirect_prefix: str | None
+) -> LocalStorage:
+    return LocalStorage(directory, public_url, accel_redirect_prefix)
+
+
+@lru_cache(maxsize=1)
+def get_memory_storage(public_url: str) -> MemoryStorage:
+    return MemoryStorage(public_url)
+
+
+async def get_storage() -> Storage:
+    """The storage backend chosen by ``storage.backend``, shared by the process."""
+    settings = get_settings().storage
+    if settings.backend == "local":
+        return get_local_storage(
+            settings.local_directory,
+            settings.public_url,
+            settings.accel_redirect_prefix,
+        )
+    if settings.backend == "memory":
+        return get_memory_storage(settings.public_url)
+
+    # imported here, google-cloud-storage is only needed by this backend
+    from app.storage.gcs import get_gcs_storage
+
+    return get_gcs_storage(await get_service_account())
@@ -0,0 +1,214 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+import hashlib
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, BinaryIO, Callable, TypeVar
+from uuid import uuid4
+
+from fastapi import HTTPException, Response, UploadFile, status
+
+import app.controllers.api.api_messages as api_messages
+from app.core.config import get_settings
+from app.rendering.photos import prepare_photo_variants
+
+# photo variant format -> upload type
+PHOTO_FORMATS = {"webp": "webp", "jpeg": "image"}
+HASH_CHUNK_SIZE = 1024 * 1024
+# received uploads larger than this are spooled to disk
+SPOOL_MAX_SIZE = 1024 * 1024
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1)
+def get_upload_executor() -> ThreadPoolExecutor:
+    # storage clients block, uploads spend their time waiting on I/O
+    return ThreadPoolExecutor(
+        max_workers=get_settings().storage.upload_workers,
+        thread_name_prefix="storage-uploads",
+    )
+
+
+def content_digest(file: BinaryIO) -> str:
+    """SHA-256 of the rest of ``file``, which is left where it was."""
+    start = file.tell()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    file.seek(start)
+    return digest.hexdigest()
+
+
+class Storage:
+    """Where uploaded photos and signed PDFs are kept.
+
+    Files are content addressed: the key is the SHA-256 of the content, so
+    uploading the same file twice stores and transfers it once. Nothing
+    here deletes files, ``app.storage.cleanup`` removes the ones no row
+    points at any more.
+
+    Backends implement ``url`` and the blocking ``_touch``, ``_put``,
+    ``list_files``, ``file_written_at`` and ``delete_file``. The async methods run them in
+    ``get_upload_executor`` so no backend ever holds up the event loop, and
+    bound every upload by ``storage.upload_timeout_secs``.
+
+    Clients can also upload straight to the backend under a random key, see
+    ``app.storage.direct_uploads``. Backends implement ``stat_file`` and
+    ``open_file`` for it, and may override ``signed_upload_url`` to hand out
+    their own signed URLs instead of ``PUT /files``.
+    """
+
+    base_path = "aluguelapp/"
+    file_type = {
+        "image": "image/jpeg",
+        "webp": "image/webp",
+        "pdf": "application/pdf",
+    }
+    file_extension = {"image": "jpg", "webp": "webp", "pdf": "pdf"}
+
+    def _file_path(self, type: str, digest: str) -> str:
+        name = f"{digest}.{self.file_extension[type]}"
+        if type == "pdf":
+            return self.base_path + "contratos/" + name
+        return self.base_path + name
+
+    def direct_upload_path(self, type: str) -> str:
+        return f"{self.base_path}diretos/{uuid4().hex}.{self.file_extension[type]}"
+
+    def url(self, file_path: str) -> str:
+        raise NotImplementedError
+
+    def file_path_from_url(self, url: str) -> str | None:
+        """The key behind a URL from ``url``, None for a foreign URL."""
+        prefix = self.url("")
+        return url[len(prefix) :] if url.startswith(prefix) else None
+
+    def _touch(self, file_path: str) -> bool:
+        """Mark an existing file as just written, False if there is none.
+
+        A deduplicated upload must not be taken by the cleanup before the
+        row pointing at it is committed.
+        """
+        raise NotImplementedError
+
+    def _put(self, file_path: str, file: BinaryIO, content_type: str) -> None:
+        raise NotImplementedError
+
+    def list_files(self) -> list[tuple[str, datetime]]:
+        """Every stored key with the time it was last written."""
+        raise NotImplementedError
+
+    def file_written_at(self, file_path: str) -> datetime | None:
+        """When a stored file was last written, None if there is none."""
+        raise NotImplementedError
+
+    def delete_file(self, file_path: str) -> None:
+        raise NotImplementedError
+
+    def stat_file(self, file_path: str) -> tuple[int, str] | None:
+        """Size and content type of a stored file, None if there is none."""
+        raise NotImplementedError
+
+    def open_file(self, file_path: str) -> BinaryIO:
+        raise NotImplementedError
+
+    def signed_upload_url(
+        self,
+        file_path: str,
+        content_type: str,
+        max_size: int,
+        expires_secs: int,
+        upload_token: str,
+    ) -> tuple[str, dict[str, str]]:
+        """URL and headers a client can ``PUT`` ``file_path`` to.
+
+        The default goes through ``PUT /files``, which checks the upload
+        token and calls ``receive_upload``.
+        """
+        return (
+            f"{self.url(file_path)}?token={upload_token}",
+            {"Content-Type": content_type},
+        )
+
+    def _upload(self, file: BinaryIO, type: str) -> str:
+        file_path = self._file_path(type, content_digest(file))
+        if not self._touch(file_path):
+            self._put(file_path, file, self.file_type[type])
+        return self.url(file_path)
+
+    async def upload_file(self, file: UploadFile, type: str) -> str:
+        return await self.upload_content(file.file, type)
+
+    async def _run_upload(self, func: Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(get_upload_executor(), func, *args),
+                timeout=get_settings().storage.upload_timeout_secs,
+            )
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=api_messages.STORAGE_UPLOAD_TIMEOUT,
+            )
+
+    async def upload_content(self, file: BinaryIO, type: str) -> str:
+        return await self._run_upload(self._upload, file, type)
+
+    async def receive_upload(
+        self,
+        file_path: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        max_size: int,
+    ) -> None:
+        """Store a request body streamed in ``chunks`` under ``file_path``."""
+        with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as file:
+            size = 0
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=api_messages.UPLOAD_TOO_LARGE,
+                    )
+                file.write(chunk)
+            file.seek(0)
+            await self._run_upload(self._put, file_path, file, content_type)
+
+    async def upload_many(self, files: list[tuple[BinaryIO, str]]) -> list[str]:
+        """Upload ``(file, type)`` pairs in parallel, returning URLs in order."""
+        return await asyncio.gather(
+            *(self.upload_content(file, type) for file, type in files)
+        )
+
+    async def upload_photo(self, photo: UploadFile) -> dict[str, dict[str, str]]:
+        """Upload every variant of ``photo``, see ``prepare_photo_variants``.
+
+        Returns the URLs by variant and format, e.g.
+        ``{"thumbnail": {"webp": ..., "jpeg": ...}, ...}``.
+        """
+        variants = await prepare_photo_variants(photo)
+
+        keys: list[tuple[str, str]] = []
+        files: list[tuple[BinaryIO, str]] = []
+        for name, encoded in variants.items():
+            for format, content in encoded.items():
+                keys.append((name, format))
+                files.append((BytesIO(content), PHOTO_FORMATS[format]))
+
+        urls: dict[str, dict[str, str]] = {name: {} for name in variants}
+        uploaded = await self.upload_many(files)
+        for (name, format), url in zip(keys, uploaded):
+            urls[name][format] = url
+        return urls
+
+    def file_response(self, file_path: str) -> Response:
+        """Serve a stored file, for backends without their own public URLs."""
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=api_messages.FILE_NOT_FOUND,
+        )
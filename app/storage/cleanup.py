@@ -0,0 +1,158 @@
+"""Removes stored files that no row points at any more.
+
+Uploads are content addressed, so one file can back several rows and is only
+garbage once its reference count drops to zero. The counts are taken from
+the columns holding storage URLs rather than kept on every write, which
+keeps them right however a row is updated or deleted. Direct uploads that
+were never confirmed have no references either and go the same way.
+
+Runs periodically from the app (``storage.cleanup_interval_secs``) or once
+with ``python -m app.storage.cleanup``.
+"""
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+import logging
+import re
+from urllib.parse import urlsplit
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import database_session
+from app.core.config import get_settings
+from app.models.models import Contract, Houses, Inspection, Owner, Properties
+from app.storage.backend import get_storage
+from app.storage.base import Storage, get_upload_executor
+
+logger = logging.getLogger(__name__)
+
+# only content-addressed keys and direct uploads, files named before
+# deduplication are left alone
+MANAGED_KEY = re.compile(r"(?:^|/)((?:[0-9a-f]{64}|diretos/[0-9a-f]{32})\.[a-z]+)$")
+
+URL_COLUMNS = (
+    Owner.foto,
+    Properties.foto,
+    Houses.foto,
+    Contract.pdf_assinado,
+    Inspection.pdf_vistoria,
+    Inspection.pdf_assinado,
+)
+PHOTO_VARIANT_COLUMNS = (
+    Owner.foto_variantes,
+    Properties.foto_variantes,
+    Houses.foto_variantes,
+)
+
+
+def managed_name(key_or_url: str) -> str | None:
+    """The digest or direct upload part of a key or URL, None if unmanaged.
+
+    Rows keep whole URLs, whose prefix changes with ``storage.public_url``
+    or the bucket; the name at their end does not.
+    """
+    match = MANAGED_KEY.search(urlsplit(key_or_url).path)
+    return match.group(1) if match else None
+
+
+async def count_references(session: AsyncSession) -> Counter[str]:
+    """How many rows point at each managed name."""
+    urls: list[str] = []
+    for url_column in URL_COLUMNS:
+        urls.extend(
+            await session.scalars(select(url_column).where(url_column.is_not(None)))
+        )
+    for variants_column in PHOTO_VARIANT_COLUMNS:
+        for variants in await session.scalars(
+            select(variants_column).where(variants_column.is_not(None))
+        ):
+            # JSON null from rows saved without a photo
+            for formats in (variants or {}).values():
+                urls.extend(formats.values())
+
+    references: Counter[str] = Counter()
+    for url in urls:
+        name = managed_name(url)
+        if name is not None:
+            references[name] += 1
+    return references
+
+
+def is_unreferenced(
+    file_path: str, written_at: datetime, references: Counter[str], cutoff: datetime
+) -> bool:
+    name = managed_name(file_path)
+    return name is not None and written_at < cutoff and references[name] == 0
+
+
+async def remove_unreferenced_files(
+    storage: Storage, session: AsyncSession, grace_secs: float
+) -> list[str]:
+    """Delete managed files with no references, returning their keys.
+
+    Files written in the last ``grace_secs`` are kept: their rows may not be
+    committed yet.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_upload_executor()
+
+    stored = await loop.run_in_executor(executor, storage.list_files)
+    references = await count_references(session)
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=grace_secs)
+
+    unreferenced = [
+        file_path
+        for file_path, written_at in stored
+        if is_unreferenced(file_path, written_at, references, cutoff)
+    ]
+
+    if unreferenced:
+        # a deduplicated upload may have touched a file, and committed its
+        # row, since the listing: each one is checked again right before
+        # it goes, its write time first so a row committed after it is seen
+        written = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, storage.file_written_at, file_path)
+                for file_path in unreferenced
+            )
+        )
+        references = await count_references(session)
+        unreferenced = [
+            file_path
+            for file_path, written_at in zip(unreferenced, written)
+            if written_at is not None
+            and is_unreferenced(file_path, written_at, references, cutoff)
+        ]
+
+    await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, storage.delete_file, file_path)
+            for file_path in unreferenced
+        )
+    )
+
+    logger.info("Removed %d unreferenced stored files", len(unreferenced))
+    return unreferenced
+
+
+async def run_cleanup() -> list[str]:
+    storage = await get_storage()
+    async with database_session.get_async_session() as session:
+        return await remove_unreferenced_files(
+            storage, session, get_settings().storage.cleanup_grace_secs
+        )
+
+
+async def cleanup_periodically(interval_secs: float) -> None:
+    while True:
+        await asyncio.sleep(interval_secs)
+        try:
+            await run_cleanup()
+        except Exception:
+            logger.exception("Stored file cleanup failed")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_cleanup())
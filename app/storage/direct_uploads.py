@@ -0,0 +1,115 @@
+"""Uploads that go from the client straight to storage.
+
+The API hands out a short-lived signed URL for a fresh key under
+``aluguelapp/diretos/`` along with an upload token, the client ``PUT``s the
+file there, and then confirms with the token so the API can check the
+stored object and record it on the row. The file never passes through the
+API on GCS; the local and in-memory backends take it on ``PUT /files``.
+
+Directly uploaded PDFs are kept under their random key and not
+deduplicated, the API never reads them. Photos are turned into variants on
+confirm and the staged file dropped. Uploads that are never confirmed are
+removed by ``app.storage.cleanup``.
+"""
+import asyncio
+
+from fastapi import HTTPException, UploadFile, status
+
+import app.controllers.api.api_messages as api_messages
+from app.core.config import get_settings
+from app.core.security.jwt import generate_upload_token, verify_upload_token
+from app.schemas.responses import SignedUploadResponse
+from app.storage.base import Storage, get_upload_executor
+
+
+def contract_target(contract_id: int) -> str:
+    return f"contract:{contract_id}"
+
+
+def inspection_target(inspection_id: int) -> str:
+    return f"inspection:{inspection_id}"
+
+
+USER_PHOTO_TARGET = "user_photo"
+
+
+def start_direct_upload(
+    storage: Storage, user_id: str, target: str, type: str
+) -> SignedUploadResponse:
+    """Signed URL for the client to upload a ``type`` file meant for ``target``."""
+    settings = get_settings().storage
+    file_path = storage.direct_upload_path(type)
+    content_type = storage.file_type[type]
+
+    upload_token, payload = generate_upload_token(
+        user_id=user_id,
+        file_path=file_path,
+        content_type=content_type,
+        max_size=settings.max_upload_bytes,
+        target=target,
+    )
+    upload_url, headers = storage.signed_upload_url(
+        file_path,
+        content_type,
+        settings.max_upload_bytes,
+        settings.signed_upload_expire_secs,
+        upload_token,
+    )
+    return SignedUploadResponse(
+        upload_url=upload_url,
+        headers=headers,
+        upload_token=upload_token,
+        expires_at=payload.exp,
+    )
+
+
+async def confirm_direct_upload(
+    storage: Storage, upload_token: str, user_id: str, target: str
+) -> str:
+    """Check what was uploaded with ``upload_token``, returning its key."""
+    payload = verify_upload_token(upload_token)
+    if payload.sub != user_id or payload.target != target:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=api_messages.INVALID_UPLOAD_TOKEN,
+        )
+
+    loop = asyncio.get_running_loop()
+    stored = await loop.run_in_executor(
+        get_upload_executor(), storage.stat_file, payload.file_path
+    )
+    if stored is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=api_messages.UPLOAD_NOT_FOUND,
+        )
+
+    size, content_type = stored
+    if content_type != payload.content_type or size == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=api_messages.INVALID_UPLOAD,
+        )
+    if size > payload.max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=api_messages.UPLOAD_TOO_LARGE,
+        )
+    return payload.file_path
+
+
+async def confirm_direct_photo_upload(
+    storage: Storage, upload_token: str, user_id: str, target: str
+) -> dict[str, dict[str, str]]:
+    """Store the variants of a directly uploaded photo, see ``upload_photo``.
+
+    The staged upload is removed once its variants are stored.
+    """
+    file_path = await confirm_direct_upload(storage, upload_token, user_id, target)
+
+    loop = asyncio.get_running_loop()
+    executor = get_upload_executor()
+    with await loop.run_in_executor(executor, storage.open_file, file_path) as file:
+        photo_variants = await storage.upload_photo(UploadFile(file=file))
+    await loop.run_in_executor(executor, storage.delete_file, file_path)
+    return photo_variants
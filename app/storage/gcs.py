@@ -1,37 +1,127 @@
-from google.cloud import storage  # type: ignore
-from datetime import date
-import uuid
+from datetime import datetime, timedelta, timezone
+import json
+from tempfile import SpooledTemporaryFile
+import threading
+from typing import BinaryIO, cast
 
+from app.core.config import get_settings
+from app.storage.base import SPOOL_MAX_SIZE, Storage
+
+
+class GCStorage(Storage):
+    """Uploads files to a Google Cloud Storage bucket.
+
+    Meant to be shared by the whole process through ``get_gcs_storage``:
+    the client keeps its credentials, access token and HTTP connection pool
+    between uploads, and the bucket is a local handle that never needs a
+    metadata request. Uploads share no mutable state, so concurrent calls
+    from different threads are safe. Blobs are sent as chunked resumable
+    uploads of ``storage.chunk_size_bytes``.
+    """
+
+    def __init__(self, service_account_info: dict | None, bucket_name: str):
+        # google-cloud-storage is slow to import and only needed for uploads
+        from google.cloud import storage  # type: ignore
 
-class GCStorage:
-    def __init__(self, service_account_info: dict | None = None):
         self.storage_client = storage.Client.from_service_account_info(
             service_account_info
         )
-        self.bucket_name = "e-aluguel"
-        self.date = str(date.today())
-        self.unique_id = uuid.uuid4().hex
-        self.base_path = "aluguelapp/"
-        self.file_type = {"image": "image/jpeg", "pdf": "application/pdf"}
-
-    def upload_file(self, file, type):
-        content_type = self.file_type[type]
-        if type == "image":
-            file_path = self.base_path + self.unique_id + (self.date)
-        elif type == "pdf":
-            file_path = self.base_path + "contratos/" + self.unique_id + (self.date)
-        bucket = self.storage_client.get_bucket(self.bucket_name)
-        blob = bucket.blob(file_path)
-        blob.upload_from_file(file.file, content_type=content_type)
-        return f"https://storage.googleapis.com/{self.bucket_name}/{file_path}"
+        self.bucket_name = bucket_name
+        self.bucket = self.storage_client.bucket(self.bucket_name)
 
-    def upload_content(self, file, type):
-        content_type = self.file_type[type]
-        if type == "image":
-            file_path = self.base_path + self.unique_id + (self.date)
-        elif type == "pdf":
-            file_path = self.base_path + "contratos/" + self.unique_id + (self.date)
-        bucket = self.storage_client.get_bucket(self.bucket_name)
-        blob = bucket.blob(file_path)
-        blob.upload_from_file(file, content_type=content_type)
+    def url(self, file_path: str) -> str:
         return f"https://storage.googleapis.com/{self.bucket_name}/{file_path}"
+
+    def _touch(self, file_path: str) -> bool:
+        from google.api_core.exceptions import NotFound  # type: ignore
+
+        # a metadata patch moves the blob's updated time, in a single request
+        blob = self.bucket.blob(file_path)
+        blob.metadata = {"ultimo_upload": datetime.now(timezone.utc).isoformat()}
+        try:
+            blob.patch(timeout=get_settings().storage.upload_timeout_secs)
+        except NotFound:
+            return False
+        return True
+
+    def _put(self, file_path: str, file: BinaryIO, content_type: str) -> None:
+        settings = get_settings().storage
+        blob = self.bucket.blob(file_path, chunk_size=settings.chunk_size_bytes)
+        blob.upload_from_file(
+            file, content_type=content_type, timeout=settings.upload_timeout_secs
+        )
+
+    def list_files(self) -> list[tuple[str, datetime]]:
+        return [
+            (blob.name, blob.updated)
+            for blob in self.storage_client.list_blobs(
+                self.bucket, prefix=self.base_path
+            )
+        ]
+
+    def file_written_at(self, file_path: str) -> datetime | None:
+        blob = self.bucket.get_blob(
+            file_path, timeout=get_settings().storage.upload_timeout_secs
+        )
+        return blob.updated if blob is not None else None
+
+    def delete_file(self, file_path: str) -> None:
+        from google.api_core.exceptions import NotFound  # type: ignore
+
+        try:
+            self.bucket.blob(file_path).delete()
+        except NotFound:
+            pass
+
+    def stat_file(self, file_path: str) -> tuple[int, str] | None:
+        blob = self.bucket.get_blob(
+            file_path, timeout=get_settings().storage.upload_timeout_secs
+        )
+        if blob is None:
+            return None
+        return blob.size, blob.content_type
+
+    def open_file(self, file_path: str) -> BinaryIO:
+        file = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        self.bucket.blob(file_path).download_to_file(
+            file, timeout=get_settings().storage.upload_timeout_secs
+        )
+        file.seek(0)
+        return cast(BinaryIO, file)
+
+    def signed_upload_url(
+        self,
+        file_path: str,
+        content_type: str,
+        max_size: int,
+        expires_secs: int,
+        upload_token: str,
+    ) -> tuple[str, dict[str, str]]:
+        # signed locally with the service account key, no request is made;
+        # the bucket itself rejects other content types and sizes
+        length_range = {"x-goog-content-length-range": f"1,{max_size}"}
+        url = self.bucket.blob(file_path).generate_signed_url(
+            version="v4",
+            expiration=timedelta(seconds=expires_secs),
+            method="PUT",
+            content_type=content_type,
+            headers=length_range,
+        )
+        return url, {"Content-Type": content_type, **length_range}
+
+
+_storage: GCStorage | None = None
+_storage_key: str | None = None
+_storage_lock = threading.Lock()
+
+
+def get_gcs_storage(service_account_info: dict | None) -> GCStorage:
+    """Process-wide ``GCStorage``, rebuilt only when the credentials change."""
+    global _storage, _storage_key
+    bucket_name = get_settings().storage.bucket
+    key = json.dumps([service_account_info, bucket_name], sort_keys=True)
+    with _storage_lock:
+        if _storage is None or _storage_key != key:
+            _storage = GCStorage(service_account_info, bucket_name)
+            _storage_key = key
+        return _storage
@@ -0,0 +1,154 @@
+import mimetypes
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO
+
+from fastapi import HTTPException, Response, status
+from starlette.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+
+import app.controllers.api.api_messages as api_messages
+from app.storage.base import Storage
+
+# missing from the mimetypes table before Python 3.11
+mimetypes.add_type("image/webp", ".webp")
+
+
+class SendfileResponse(FileResponse):
+    """``FileResponse`` that lets the server copy the file to the socket.
+
+    Servers advertising the ASGI ``http.response.zerocopysend`` extension get
+    the open file and can use ``sendfile(2)``, ``pathsend`` is already
+    handled by ``FileResponse``. With ``accel_redirect`` set, the body is left
+    to a fronting nginx through ``X-Accel-Redirect``. Anything else streams
+    the file in chunks.
+    """
+
+    def __init__(self, path: Path, accel_redirect: str | None = None, **kwargs):
+        super().__init__(path, **kwargs)
+        if accel_redirect is not None:
+            self.headers["X-Accel-Redirect"] = accel_redirect
+            # nginx sends its own length for the file
+            del self.headers["content-length"]
+        self.accel_redirect = accel_redirect
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get("extensions") or {}
+        if self.accel_redirect is None and (
+            scope["method"].upper() == "HEAD"
+            or "http.response.zerocopysend" not in extensions
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        start = {
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        }
+        if self.accel_redirect is not None:
+            await send(start)
+            await send({"type": "http.response.body", "body": b""})
+        else:
+            with open(self.path, "rb") as file:
+                await send(start)
+                await send({"type": "http.response.zerocopysend", "file": file})
+
+        if self.background is not None:
+            await self.background()
+
+
+class LocalStorage(Storage):
+    """Keeps files in a directory, served back through ``/files``."""
+
+    def __init__(
+        self, directory: Path, public_url: str, accel_redirect_prefix: str | None
+    ):
+        self.directory = directory
+        self.public_url = public_url.rstrip("/") + "/"
+        self.accel_redirect_prefix = accel_redirect_prefix
+
+    def url(self, file_path: str) -> str:
+        return self.public_url + file_path
+
+    def _touch(self, file_path: str) -> bool:
+        try:
+            os.utime(self.directory / file_path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _put(self, file_path: str, file: BinaryIO, content_type: str) -> None:
+        path = self.directory / file_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # written aside and renamed, readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                shutil.copyfileobj(file, tmp)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def list_files(self) -> list[tuple[str, datetime]]:
+        return [
+            (
+                path.relative_to(self.directory).as_posix(),
+                datetime.fromtimestamp(path.stat().st_mtime, timezone.utc),
+            )
+            for path in self.directory.rglob("*")
+            if path.is_file() and path.suffix != ".tmp"
+        ]
+
+    def file_written_at(self, file_path: str) -> datetime | None:
+        try:
+            mtime = (self.directory / file_path).stat().st_mtime
+        except FileNotFoundError:
+            return None
+        return datetime.fromtimestamp(mtime, timezone.utc)
+
+    def delete_file(self, file_path: str) -> None:
+        (self.directory / file_path).unlink(missing_ok=True)
+
+    def stat_file(self, file_path: str) -> tuple[int, str] | None:
+        path = self._resolve(file_path)
+        if path is None:
+            return None
+        # the content type was checked against the upload token on the way in
+        content_type = mimetypes.guess_type(path.name)[0]
+        return path.stat().st_size, content_type or "application/octet-stream"
+
+    def open_file(self, file_path: str) -> BinaryIO:
+        return open(self.directory / file_path, "rb")
+
+    def _resolve(self, file_path: str) -> Path | None:
+        root = self.directory.resolve()
+        path = (root / file_path).resolve()
+        if not path.is_relative_to(root) or not path.is_file():
+            return None
+        return path
+
+    def file_response(self, file_path: str) -> Response:
+        path = self._resolve(file_path)
+        if path is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=api_messages.FILE_NOT_FOUND,
+            )
+
+        accel_redirect = None
+        if self.accel_redirect_prefix is not None:
+            relative = path.relative_to(self.directory.resolve()).as_posix()
+            accel_redirect = self.accel_redirect_prefix.rstrip("/") + "/" + relative
+
+        return SendfileResponse(
+            path,
+            accel_redirect=accel_redirect,
+            media_type=mimetypes.guess_type(path.name)[0],
+            stat_result=path.stat(),
+        )
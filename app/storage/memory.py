@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+from io import BytesIO
+import threading
+from typing import BinaryIO
+
+from fastapi import HTTPException, Response, status
+
+import app.controllers.api.api_messages as api_messages
+from app.storage.base import Storage
+
+
+class MemoryStorage(Storage):
+    """Keeps files in a dict, for tests and local development."""
+
+    def __init__(self, public_url: str):
+        self.public_url = public_url.rstrip("/") + "/"
+        # key -> (content, content type, written at)
+        self.files: dict[str, tuple[bytes, str, datetime]] = {}
+        self._lock = threading.Lock()
+
+    def url(self, file_path: str) -> str:
+        return self.public_url + file_path
+
+    def _touch(self, file_path: str) -> bool:
+        with self._lock:
+            if file_path not in self.files:
+                return False
+            content, content_type, _ = self.files[file_path]
+            self.files[file_path] = (content, content_type, datetime.now(timezone.utc))
+            return True
+
+    def _put(self, file_path: str, file: BinaryIO, content_type: str) -> None:
+        content = file.read()
+        with self._lock:
+            self.files[file_path] = (content, content_type, datetime.now(timezone.utc))
+
+    def list_files(self) -> list[tuple[str, datetime]]:
+        with self._lock:
+            return [(key, written_at) for key, (_, _, written_at) in self.files.items()]
+
+    def file_written_at(self, file_path: str) -> datetime | None:
+        with self._lock:
+            stored = self.files.get(file_path)
+        return stored[2] if stored is not None else None
+
+    def delete_file(self, file_path: str) -> None:
+        with self._lock:
+            self.files.pop(file_path, None)
+
+    def stat_file(self, file_path: str) -> tuple[int, str] | None:
+        with self._lock:
+            stored = self.files.get(file_path)
+        if stored is None:
+            return None
+        content, content_type, _ = stored
+        return len(content), content_type
+
+    def open_file(self, file_path: str) -> BinaryIO:
+        with self._lock:
+            content, _, _ = self.files[file_path]
+        return BytesIO(content)
+
+    def file_response(self, file_path: str) -> Response:
+        with self._lock:
+            stored = self.files.get(file_path)
+        if stored is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=api_messages.FILE_NOT_FOUND,
+            )
+        content, content_type, _ = stored
+        return Response(content=content, media_type=content_type)
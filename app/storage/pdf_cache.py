@@ -0,0 +1,104 @@
+import hashlib
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from app.core.config import get_settings
+
+
+def make_cache_key(*parts: object) -> str:
+    """Hash every input that affects a rendered document into a stable key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class PDFCache:
+    """Content-addressed PDF cache on local disk with an LRU size limit.
+
+    Entries are plain files named after their key, so several workers can
+    share the same directory. A hit refreshes the file mtime, which is what
+    eviction orders by.
+    """
+
+    def __init__(self, directory: Path, max_size_bytes: int):
+        self.directory = Path(directory)
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pdf"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            content = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        if len(content) > self.max_size_bytes:
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(content)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            total_size = 0
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(".pdf"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total_size <= self.max_size_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+
+
+@lru_cache(maxsize=1)
+def get_pdf_cache() -> PDFCache | None:
+    settings = get_settings().pdf_cache
+    if not settings.enabled:
+        return None
+    return PDFCache(settings.directory, settings.max_size_bytes)
+
+
+def etag_for(key: str) -> str:
+    return f'"{key}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
@@ -1,4 +1,6 @@
 import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import date
 import os
 from collections.abc import AsyncGenerator, Generator
@@ -7,17 +9,27 @@ import pytest
 import pytest_asyncio
 import sqlalchemy
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
 )
+from starlette.types import Receive, Scope, Send
 
 from app.core import database_session
 from app.core.config import get_settings
 from app.core.security.jwt import create_jwt_token
 from app.core.security.password import get_password_hash
 from app.main import app as fastapi_app
-from app.models.models import Base, Properties, Houses, Tenant, Template, Owner as User
+from app.models.models import (
+    Base,
+    Properties,
+    Houses,
+    Tenant,
+    Template,
+    Contract,
+    Owner as User,
+)
 
 default_user_id = "b75365d9-7bf9-4f54-add5-aeab333a087b"
 default_user_email = "geralt@wiedzmin.pl"
@@ -33,6 +45,25 @@ default_user_birth_date_string = "1990-01-01"
 default_user_access_token = create_jwt_token(default_user_id).access_token
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "query_budget(n): fail when a request through the client fixture "
+        "executes more than n SQL statements",
+    )
+
+
+@dataclass
+class RequestQueries:
+    request: str
+    statements: list[str] = field(default_factory=list)
+
+
+_request_queries: ContextVar[RequestQueries | None] = ContextVar(
+    "request_queries", default=None
+)
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop = asyncio.new_event_loop()
@@ -56,6 +87,8 @@ async def fixture_setup_new_test_database() -> None:
     session_mpatch = pytest.MonkeyPatch()
     session_mpatch.setenv("DATABASE__DB", test_db_name)
     session_mpatch.setenv("SECURITY__PASSWORD_BCRYPT_ROUNDS", "4")
+    # uploads stay in the process, no Google credentials needed
+    session_mpatch.setenv("STORAGE__BACKEND", "memory")
 
     # force settings to use now monkeypatched environments
     get_settings.cache_clear()
@@ -116,9 +149,62 @@ async def fixture_session_with_rollback(
     await connection.close()
 
 
+@pytest.fixture(name="queries", scope="function")
+def fixture_queries(
+    request: pytest.FixtureRequest,
+) -> Generator[list[RequestQueries], None, None]:
+    """SQL statements of each request made through the client fixture.
+
+    Statements of the fixtures and of the test itself are not recorded. With
+    ``@pytest.mark.query_budget(n)`` the test fails when a request went over
+    ``n`` statements.
+    """
+    queries: list[RequestQueries] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        current = _request_queries.get()
+        if current is not None:
+            current.statements.append(statement)
+
+    engine = database_session._ASYNC_ENGINE.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield queries
+    event.remove(engine, "before_cursor_execute", record)
+
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        return
+    budget = marker.args[0]
+    over = [current for current in queries if len(current.statements) > budget]
+    if over:
+        pytest.fail(
+            "\n\n".join(
+                f"{current.request} executed {len(current.statements)} SQL "
+                f"statements, over the budget of {budget}:\n"
+                + "\n".join(current.statements)
+                for current in over
+            ),
+            pytrace=False,
+        )
+
+
 @pytest_asyncio.fixture(name="client", scope="function")
-async def fixture_client(session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    transport = ASGITransport(app=fastapi_app)  # type: ignore
+async def fixture_client(
+    session: AsyncSession, queries: list[RequestQueries]
+) -> AsyncGenerator[AsyncClient, None]:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await fastapi_app(scope, receive, send)
+            return
+        current = RequestQueries(f"{scope['method']} {scope['path']}")
+        queries.append(current)
+        token = _request_queries.set(current)
+        try:
+            await fastapi_app(scope, receive, send)
+        finally:
+            _request_queries.reset(token)
+
+    transport = ASGITransport(app=app)  # type: ignore
     async with AsyncClient(transport=transport, base_url="http://test") as aclient:
         aclient.headers.update({"Host": "localhost"})
         yield aclient
@@ -253,3 +339,31 @@ async def fixture_default_template(
     await session.refresh(template)
 
     return template
+
+
+@pytest_asyncio.fixture(name="default_contract", scope="function")
+async def fixture_default_contract(
+    session: AsyncSession,
+    default_user: User,
+    default_house: Houses,
+    default_tenant: Tenant,
+    default_template: Template,
+) -> Contract:
+    contract = Contract(
+        valor_caucao=2000.0,
+        data_inicio=date(2024, 1, 1),
+        data_fim=date(2024, 7, 1),
+        valor_base=1000.0,
+        dia_vencimento=10,
+        taxa_reajuste=None,
+        casa_id=default_house.id,
+        template_id=default_template.id,
+        inquilino_id=default_tenant.id,
+        user_id=default_user.user_id,
+    )
+
+    session.add(contract)
+    await session.commit()
+    await session.refresh(contract)
+
+    return contract
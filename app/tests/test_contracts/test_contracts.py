@@ -0,0 +1,89 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Contract, Houses, Template, Tenant
+from app.tests.conftest import RequestQueries
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(2)
+async def test_get_contracts(
+    client: AsyncClient,
+    session: AsyncSession,
+    default_user_headers: dict,
+    default_contract: Contract,
+    default_house: Houses,
+    default_tenant: Tenant,
+):
+    # more contracts must not mean more queries
+    for month in (2, 3, 4):
+        copy = Contract(
+            valor_base=1000.0 * month,
+            data_inicio=default_contract.data_inicio.replace(month=month),
+            data_fim=default_contract.data_fim,
+            dia_vencimento=10,
+            casa_id=default_house.id,
+            template_id=default_contract.template_id,
+            inquilino_id=default_tenant.id,
+            user_id=default_contract.user_id,
+        )
+        session.add(copy)
+    await session.commit()
+
+    response = await client.get("/contracts", headers=default_user_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data) == 4
+    assert {row["tenant"]["name"] for row in data} == {"John Doe"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(4)
+async def test_get_contract(
+    client: AsyncClient, default_user_headers: dict, default_contract: Contract
+):
+    response = await client.get(
+        f"/contracts/{default_contract.id}", headers=default_user_headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == default_contract.id
+    assert response.json()["house"]["nickname"] == "Casa Teste"
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(5)
+async def test_create_contract(
+    client: AsyncClient,
+    default_user_headers: dict,
+    default_house: Houses,
+    default_tenant: Tenant,
+    default_template: Template,
+    queries: list[RequestQueries],
+):
+    response = await client.post(
+        "/contracts",
+        headers=default_user_headers,
+        json={
+            "start_date": "2024-01-01",
+            "end_date": "2025-01-01",
+            "base_value": 900.0,
+            "due_date": 5,
+            "house_id": default_house.id,
+            "template_id": default_template.id,
+            "tenant_id": default_tenant.id,
+        },
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["tenant"]["id"] == default_tenant.id
+    # only the request is recorded, not the fixtures
+    [request] = queries
+    assert request.request == "POST /contracts"
+    assert any(
+        statement.startswith("INSERT INTO contrato")
+        for statement in request.statements
+    )
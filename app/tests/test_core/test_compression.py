@@ -0,0 +1,98 @@
+import gzip
+from io import BytesIO
+
+import brotli  # type: ignore
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core.compression import CompressionMiddleware, choose_encoding
+from app.core.config import get_settings
+from app.storage.backend import get_storage
+
+
+def test_choose_encoding() -> None:
+    assert choose_encoding("gzip, deflate, br") == "br"
+    assert choose_encoding("gzip;q=1.0, br;q=0") == "gzip"
+    assert choose_encoding("*") == "br"
+    assert choose_encoding("identity") is None
+    assert choose_encoding("") is None
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_compressed(client: AsyncClient) -> None:
+    plain = await client.get(
+        "/openapi.json", headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in plain.headers
+
+    for encoding, decompress in (("br", brotli.decompress), ("gzip", gzip.decompress)):
+        async with client.stream(
+            "GET", "/openapi.json", headers={"Accept-Encoding": encoding}
+        ) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-encoding"] == encoding
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(raw)
+        assert len(raw) < len(plain.content) / 4
+        assert decompress(raw) == plain.content
+
+
+@pytest.mark.asyncio
+async def test_small_and_compressed_bodies_are_left_alone(client: AsyncClient) -> None:
+    response = await client.get("/health/ready", headers={"Accept-Encoding": "br"})
+    assert "content-encoding" not in response.headers
+
+    storage = await get_storage()
+    url = await storage.upload_content(BytesIO(b"%PDF-1.7 " * 1000), "pdf")
+    response = await client.get(url, headers={"Accept-Encoding": "br"})
+    assert response.headers["content-type"] == "application/pdf"
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_streamed_bodies_are_compressed_off_the_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("COMPRESSION__OFFLOAD_SIZE", "1024")
+    get_settings.cache_clear()
+    chunks = [b'{"parcelas": [', b'{"valor": 1000.0},' * 200, b"{}]}"]
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"etag", b'"abc"'),
+                ],
+            }
+        )
+        for i, chunk in enumerate(chunks):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": i < len(chunks) - 1,
+                }
+            )
+
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    await CompressionMiddleware(app)(scope, None, send)  # type: ignore[arg-type]
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"etag"] == b'W/"abc"'
+    assert b"content-length" not in headers
+    assert [message["more_body"] for message in sent[1:]] == [True, True, False]
+    body = b"".join(message["body"] for message in sent[1:])
+    assert gzip.decompress(body) == b"".join(chunks)
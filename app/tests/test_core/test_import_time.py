@@ -0,0 +1,22 @@
+import json
+import subprocess
+import sys
+
+from benchmarks.bench_import_time import DEFERRED_MODULES
+
+
+def test_app_startup_does_not_import_rendering_libraries() -> None:
+    # a fresh interpreter, the test session itself has imported everything
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, app.main; print(json.dumps(sorted(sys.modules)))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    imported = set(json.loads(output))
+    assert [name for name in DEFERRED_MODULES if name in imported] == []
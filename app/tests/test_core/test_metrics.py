@@ -0,0 +1,96 @@
+import re
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.models.models import Contract
+
+
+METRICS_HEADERS = {"Authorization": "Bearer scraper"}
+
+
+@pytest.fixture(name="metrics_token")
+def fixture_metrics_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("METRICS__TOKEN", "scraper")
+    get_settings.cache_clear()
+
+
+def _sample(text: str, name: str, labels: str) -> float:
+    match = re.search(rf"^{name}{{{re.escape(labels)}}} (\S+)$", text, re.MULTILINE)
+    assert match is not None, f"{name}{{{labels}}} not exposed"
+    return float(match.group(1))
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    histogram = metrics.Histogram("test_seconds", "Test", (0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(("GET", "/x"), value)
+
+    lines = histogram.render(("method", "route"))
+
+    assert lines[2:] == [
+        'test_seconds_bucket{method="GET",route="/x",le="0.1"} 1',
+        'test_seconds_bucket{method="GET",route="/x",le="1.0"} 3',
+        'test_seconds_bucket{method="GET",route="/x",le="+Inf"} 4',
+        'test_seconds_sum{method="GET",route="/x"} 6.05',
+        'test_seconds_count{method="GET",route="/x"} 4',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_recorded_per_route_template(
+    client: AsyncClient,
+    default_user_headers: dict[str, str],
+    default_contract: Contract,
+    metrics_token: None,
+) -> None:
+    route = 'method="GET",route="/contracts/{contract_id}"'
+    before = await client.get("/metrics", headers=METRICS_HEADERS)
+    count = (
+        _sample(before.text, "http_request_duration_seconds_count", route)
+        if route in before.text
+        else 0
+    )
+
+    response = await client.get(
+        f"/contracts/{default_contract.id}", headers=default_user_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    after = await client.get("/metrics", headers=METRICS_HEADERS)
+    assert after.status_code == status.HTTP_200_OK
+    assert after.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert _sample(after.text, "http_request_duration_seconds_count", route) == count + 1
+    assert _sample(after.text, "http_request_db_statements_sum", route) > 0
+    assert _sample(after.text, "http_request_db_duration_seconds_sum", route) > 0
+    assert _sample(after.text, "http_response_size_bytes_sum", route) > 0
+    assert _sample(after.text, "http_responses_total", f'{route},status="200"') >= 1
+    assert f"/contracts/{default_contract.id}" not in after.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_not_served_without_a_token(client: AsyncClient) -> None:
+    response = await client.get("/metrics")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer "})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_metrics_token(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch, metrics_token: None
+) -> None:
+    response = await client.get("/metrics")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = await client.get("/metrics", headers=METRICS_HEADERS)
+    assert response.status_code == status.HTTP_200_OK
+
+    monkeypatch.setenv("METRICS__ENABLED", "false")
+    get_settings.cache_clear()
+    response = await client.get("/metrics")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,65 @@
+from collections.abc import Generator
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from app.core.config import SlowQueries
+from app.core.slow_queries import SlowQueryLog, parameter_shape
+from app.models.models import Contract
+
+
+@pytest.fixture(name="explain_file")
+def fixture_explain_file(tmp_path: Path) -> Generator[Path, None, None]:
+    explain_file = tmp_path / "logs" / "slow-queries.jsonl"
+    # every statement is slow, and every one is explained
+    slow_queries = SlowQueryLog(
+        SlowQueries(
+            threshold_secs=1e-9, explain_sample_rate=1.0, explain_file=explain_file
+        )
+    )
+    slow_queries.install()
+    yield explain_file
+    slow_queries.remove()
+
+
+def test_parameter_shape() -> None:
+    assert parameter_shape((1, "João", None)) == "(int, str, NoneType)"
+    assert parameter_shape({"cpf": "123"}) == "{cpf: str}"
+    assert parameter_shape([(1, 2.0), (2, 3.0)], many=True) == "2 x (int, float)"
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged_and_explained(
+    client: AsyncClient,
+    default_user_headers: dict[str, str],
+    default_contract: Contract,
+    explain_file: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with caplog.at_level(logging.WARNING, logger="app.core.slow_queries"):
+        response = await client.get(
+            f"/contracts/{default_contract.id}", headers=default_user_headers
+        )
+
+    # the EXPLAINs ran on the request's connection without disturbing it
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == default_contract.id
+
+    [message] = [
+        record.getMessage()
+        for record in caplog.records
+        if "FROM contrato" in record.getMessage()
+    ]
+    assert "on GET /contracts/{contract_id}:" in message
+    assert message.endswith("(int, str)")
+    assert str(default_contract.user_id) not in message
+
+    entries = [json.loads(line) for line in explain_file.read_text().splitlines()]
+    [entry] = [entry for entry in entries if "FROM contrato" in entry["statement"]]
+    assert entry["route"] == "GET /contracts/{contract_id}"
+    assert entry["parameters"] == "(int, str)"
+    assert "Plan" in entry["plan"][0]
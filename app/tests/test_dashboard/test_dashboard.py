@@ -0,0 +1,73 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from app.models.models import Contract
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(4)
+async def test_dashboard_totals(
+    client: AsyncClient, default_user_headers: dict, default_contract: Contract
+):
+    response = await client.get("/dashboard/totals", headers=default_user_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "total_properties": 1,
+        "total_houses": 1,
+        "total_tenants": 1,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(4)
+async def test_dashboard_houses_availability(
+    client: AsyncClient, default_user_headers: dict, default_contract: Contract
+):
+    response = await client.get(
+        "/dashboard/houses-availability", headers=default_user_headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "total_rented": 0,
+        "total_available": 1,
+        "total_maintenance": 0,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(3)
+async def test_dashboard_cash_flow(
+    client: AsyncClient, default_user_headers: dict, default_contract: Contract
+):
+    response = await client.get("/dashboard/cash-flow", headers=default_user_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()) == {
+        "total_monthly_income",
+        "total_monthly_expenses",
+        "total_profit_monthly",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(4)
+async def test_dashboard_payment_status(
+    client: AsyncClient, default_user_headers: dict, default_contract: Contract
+):
+    await client.post(
+        f"/payment_installment/{default_contract.id}", headers=default_user_headers
+    )
+
+    response = await client.get(
+        "/dashboard/payment-status", headers=default_user_headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()) == {
+        "total_monthly_paid",
+        "total_monthly_overdue",
+        "total_monthly_pending",
+    }
@@ -0,0 +1,265 @@
+from datetime import timedelta
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Contract, DocumentJob, Owner as User
+from app.rendering import jobs
+from app.rendering.jobs import DocumentJobRunner, get_document_job_runner
+
+
+@pytest.fixture(name="submitted_jobs")
+def fixture_submitted_jobs(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    # jobs are run explicitly by the tests instead of in the background
+    submitted: list[str] = []
+    monkeypatch.setattr(
+        DocumentJobRunner,
+        "submit",
+        lambda self, job_id: submitted.append(job_id),
+    )
+    return submitted
+
+
+@pytest.mark.asyncio
+async def test_create_report_job(
+    client: AsyncClient, default_user_headers: dict, submitted_jobs: list[str]
+):
+    response = await client.post("/documents/report", headers=default_user_headers)
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    data = response.json()
+    assert data["kind"] == "report"
+    assert data["status"] == "pending"
+    assert submitted_jobs == [data["id"]]
+
+    response = await client.get(
+        f"/documents/jobs/{data['id']}", headers=default_user_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "pending"
+
+    response = await client.get(
+        f"/documents/jobs/{data['id']}/file", headers=default_user_headers
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.asyncio
+async def test_create_contract_job_requires_owned_contract(
+    client: AsyncClient,
+    default_user_headers: dict,
+    default_contract: Contract,
+    submitted_jobs: list[str],
+):
+    response = await client.post("/documents/contract", headers=default_user_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await client.post(
+        "/documents/contract",
+        json={"contract_id": 999999},
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await client.post(
+        "/documents/contract",
+        json={"contract_id": default_contract.id},
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["contract_id"] == default_contract.id
+
+
+@pytest.mark.asyncio
+async def test_unknown_document_kind(client: AsyncClient, default_user_headers: dict):
+    response = await client.post("/documents/invoice", headers=default_user_headers)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_run_job_stores_document(
+    client: AsyncClient,
+    default_user_headers: dict,
+    submitted_jobs: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    async def fake_report(
+        session: AsyncSession, owner: User, parametros: dict
+    ) -> tuple[bytes, str]:
+        return b"%PDF-1.7 report", "report.pdf"
+
+    monkeypatch.setitem(jobs.DOCUMENT_BUILDERS, "report", fake_report)
+
+    response = await client.post("/documents/report", headers=default_user_headers)
+    job_id = response.json()["id"]
+
+    assert await get_document_job_runner().run_next() == job_id
+
+    response = await client.get(
+        f"/documents/jobs/{job_id}", headers=default_user_headers
+    )
+    assert response.json()["status"] == "done"
+    assert response.json()["file_name"] == "report.pdf"
+
+    response = await client.get(
+        f"/documents/jobs/{job_id}/file", headers=default_user_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content == b"%PDF-1.7 report"
+
+
+@pytest.mark.asyncio
+async def test_run_job_records_failure(
+    client: AsyncClient,
+    default_user_headers: dict,
+    submitted_jobs: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    async def failing_report(
+        session: AsyncSession, owner: User, parametros: dict
+    ) -> tuple[bytes, str]:
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(jobs.DOCUMENT_BUILDERS, "report", failing_report)
+
+    response = await client.post("/documents/report", headers=default_user_headers)
+    job_id = response.json()["id"]
+
+    assert await get_document_job_runner().run_next() == job_id
+
+    response = await client.get(
+        f"/documents/jobs/{job_id}", headers=default_user_headers
+    )
+    assert response.json()["status"] == "failed"
+    assert response.json()["error"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_get_unknown_job(client: AsyncClient, default_user_headers: dict):
+    response = await client.get(
+        "/documents/jobs/3f1d5c8e-0000-4000-8000-000000000000",
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.fixture(name="fake_report")
+def fixture_fake_report(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_report(
+        session: AsyncSession, owner: User, parametros: dict
+    ) -> tuple[bytes, str]:
+        return b"%PDF-1.7 report", "report.pdf"
+
+    monkeypatch.setitem(jobs.DOCUMENT_BUILDERS, "report", fake_report)
+
+
+@pytest.mark.asyncio
+async def test_claims_respect_the_owner_limit(
+    client: AsyncClient,
+    default_user_headers: dict,
+    submitted_jobs: list[str],
+    fake_report: None,
+):
+    job_ids = [
+        (await client.post("/documents/report", headers=default_user_headers)).json()[
+            "id"
+        ]
+        for _ in range(3)
+    ]
+    runner = DocumentJobRunner(max_concurrent_jobs_per_owner=2)
+
+    first = await runner.claim()
+    second = await runner.claim()
+    assert first is not None and second is not None
+    assert [first[0], second[0]] == job_ids[:2]
+    # both of the owner's slots are taken, by this process or any other
+    assert await runner.claim() is None
+
+    await runner.run(*first)
+    third = await runner.claim()
+    assert third is not None and third[0] == job_ids[2]
+
+
+@pytest.mark.asyncio
+async def test_expired_claims_are_taken_over(
+    client: AsyncClient,
+    session: AsyncSession,
+    default_user_headers: dict,
+    submitted_jobs: list[str],
+    fake_report: None,
+):
+    response = await client.post("/documents/report", headers=default_user_headers)
+    job_id = response.json()["id"]
+    runner = DocumentJobRunner(max_concurrent_jobs_per_owner=2, lease_secs=60)
+
+    claimed = await runner.claim()
+    assert claimed is not None
+    _, lost_reserva = claimed
+    # a running job within its lease is not claimed twice
+    assert await runner.claim() is None
+
+    await session.execute(
+        update(DocumentJob)
+        .where(DocumentJob.id == job_id)
+        .values(reservado_em=func.now() - timedelta(hours=1))
+    )
+    await session.commit()
+
+    claimed = await runner.claim()
+    assert claimed is not None
+    assert claimed[0] == job_id
+    assert claimed[1] != lost_reserva
+
+    # the worker that lost the claim finishes late and changes nothing
+    await runner.run(job_id, lost_reserva)
+    job_status = await session.scalar(
+        select(DocumentJob.status)
+        .where(DocumentJob.id == job_id)
+        .execution_options(populate_existing=True)
+    )
+    assert job_status == "running"
+
+    await runner.run(*claimed)
+    response = await client.get(
+        f"/documents/jobs/{job_id}", headers=default_user_headers
+    )
+    assert response.json()["status"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_are_purged_after_retention(
+    client: AsyncClient,
+    session: AsyncSession,
+    default_user_headers: dict,
+    submitted_jobs: list[str],
+    fake_report: None,
+):
+    old, recent, pending = [
+        (await client.post("/documents/report", headers=default_user_headers)).json()[
+            "id"
+        ]
+        for _ in range(3)
+    ]
+    runner = DocumentJobRunner(max_concurrent_jobs_per_owner=3, retention_secs=3600)
+    assert await runner.run_next() == old
+    assert await runner.run_next() == recent
+    await session.execute(
+        update(DocumentJob)
+        .where(DocumentJob.id == old)
+        .values(concluido_em=func.now() - timedelta(hours=2))
+    )
+    await session.commit()
+
+    assert await runner.purge() == 1
+
+    response = await client.get(
+        f"/documents/jobs/{old}/file", headers=default_user_headers
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    for job_id in (recent, pending):
+        response = await client.get(
+            f"/documents/jobs/{job_id}", headers=default_user_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,40 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+from app.core.config import get_settings
+from app.rendering.renderer import get_pdf_renderer
+
+
+@pytest.mark.asyncio
+async def test_readiness_waits_for_renderer_warm_up(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    renderer = get_pdf_renderer()
+    monkeypatch.setattr(renderer, "ready", False)
+
+    response = await client.get("/health/ready")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    monkeypatch.setattr(renderer, "ready", True)
+
+    response = await client.get("/health/ready")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "status": "ready",
+        "renderer_workers": renderer.workers,
+        "renderer_warm": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_readiness_without_warm_up(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("RENDERER__WARM_UP", "false")
+    get_settings.cache_clear()
+    monkeypatch.setattr(get_pdf_renderer(), "ready", False)
+
+    response = await client.get("/health/ready")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["renderer_warm"] is False
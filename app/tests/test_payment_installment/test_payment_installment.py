@@ -0,0 +1,131 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Contract, PaymentInstallment
+import datetime
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(3)
+async def test_create_payment_installment(
+    client: AsyncClient, default_contract: Contract, default_user_headers: dict
+):
+    response = await client.post(
+        f"/payment_installment/{default_contract.id}", headers=default_user_headers
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert len(data) == 6
+    assert data[0]["due_date"] == "2024-02-10"
+    assert data[0]["installment_value"] == 1000.0
+    assert data[-1]["due_date"] == "2024-07-10"
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(4)
+async def test_get_payment_installments(
+    client: AsyncClient, default_contract: Contract, default_user_headers: dict
+):
+    await client.post(
+        f"/payment_installment/{default_contract.id}", headers=default_user_headers
+    )
+
+    response = await client.get(
+        f"/payment_installment/{default_contract.id}", headers=default_user_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 6
+
+    response = await client.patch(
+        f"/payment_installment/{response.json()[0]['id']}",
+        headers=default_user_headers,
+        json={"fg_paid": True, "payment_type": "dinheiro", "payment_date": "2024-02-09"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["fg_paid"] is True
+
+
+@pytest.mark.asyncio
+async def test_regenerate_payment_installments_preserves_paid(
+    client: AsyncClient,
+    session: AsyncSession,
+    default_contract: Contract,
+    default_user_headers: dict,
+):
+    response = await client.post(
+        f"/payment_installment/{default_contract.id}", headers=default_user_headers
+    )
+    created = {row["due_date"]: row for row in response.json()}
+
+    paid = await session.scalar(
+        select(PaymentInstallment).where(
+            PaymentInstallment.id == created["2024-02-10"]["id"]
+        )
+    )
+    assert paid is not None
+    paid.fg_pago = True
+    paid.tipo_pagamento = "dinheiro"  # type: ignore
+    paid.data_pagamento = datetime.date(2024, 2, 9)
+
+    contract = await session.merge(default_contract)
+    contract.valor_base = 1200.0
+    contract.dia_vencimento = 5
+    contract.data_fim = datetime.date(2024, 5, 1)
+    await session.commit()
+
+    response = await client.put(
+        f"/payment_installment/{default_contract.id}/regenerate",
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    assert [row["due_date"] for row in data] == [
+        "2024-02-10",
+        "2024-03-05",
+        "2024-04-05",
+        "2024-05-05",
+    ]
+    assert data[0]["id"] == created["2024-02-10"]["id"]
+    assert data[0]["fg_paid"] is True
+    assert data[0]["installment_value"] == 1000.0
+    # unpaid rows are updated in place instead of being recreated
+    assert data[1]["id"] == created["2024-03-10"]["id"]
+    assert all(row["installment_value"] == 1200.0 for row in data[1:])
+
+
+@pytest.mark.asyncio
+async def test_regenerate_payment_installments_inserts_missing_months(
+    client: AsyncClient,
+    session: AsyncSession,
+    default_contract: Contract,
+    default_user_headers: dict,
+):
+    await client.post(
+        f"/payment_installment/{default_contract.id}", headers=default_user_headers
+    )
+
+    contract = await session.merge(default_contract)
+    contract.data_fim = datetime.date(2024, 9, 1)
+    await session.commit()
+
+    response = await client.put(
+        f"/payment_installment/{default_contract.id}/regenerate",
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data) == 8
+    assert data[-1]["due_date"] == "2024-09-10"
+
+
+@pytest.mark.asyncio
+async def test_regenerate_payment_installments_contract_not_found(
+    client: AsyncClient, default_user_headers: dict
+):
+    response = await client.put(
+        "/payment_installment/999999/regenerate", headers=default_user_headers
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,83 @@
+from xml.etree import ElementTree
+
+from app.rendering.charts import (
+    bar_chart,
+    expenses_by_type_chart,
+    format_brl,
+    grouped_bar_chart,
+    income_expense_chart,
+    occupancy_chart,
+    pie_chart,
+)
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _parse(svg: str) -> ElementTree.Element:
+    root = ElementTree.fromstring(svg)
+    assert root.tag == f"{SVG}svg"
+    return root
+
+
+def _texts(root: ElementTree.Element) -> list[str]:
+    return [element.text or "" for element in root.iter(f"{SVG}text")]
+
+
+def test_format_brl() -> None:
+    assert format_brl(0) == "R$ 0,00"
+    assert format_brl(1234.5) == "R$ 1.234,50"
+    assert format_brl(-1234567.891) == "-R$ 1.234.567,89"
+
+
+def test_pie_chart() -> None:
+    root = _parse(pie_chart("Despesas", ("Água", "Luz"), (300.0, 100.0)))
+    assert len(list(root.iter(f"{SVG}path"))) == 2
+    texts = _texts(root)
+    assert "75,0%" in texts
+    assert "Água - R$ 300,00" in texts
+
+
+def test_pie_chart_with_single_slice_draws_a_circle() -> None:
+    root = _parse(pie_chart("Despesas", ("Água",), (300.0,)))
+    assert len(list(root.iter(f"{SVG}circle"))) == 1
+
+
+def test_bar_chart_scales_bars() -> None:
+    root = _parse(bar_chart("Imóveis", ("Alugada", "Disponível"), (4.0, 2.0)))
+    heights = [float(rect.get("height", 0)) for rect in root.iter(f"{SVG}rect")]
+    assert heights[0] == 2 * heights[1]
+
+
+def test_grouped_bar_chart_has_legend_and_currency_axis() -> None:
+    root = _parse(
+        grouped_bar_chart(
+            "Receita e Despesa",
+            ("Jan", "Fev"),
+            (("Receita", (1000.0, 1500.0)), ("Despesa", (200.0, 0.0))),
+            currency=True,
+        )
+    )
+    texts = _texts(root)
+    assert {"Receita", "Despesa", "Jan", "Fev"} <= set(texts)
+    assert "R$ 1.500" in texts
+
+
+def test_labels_are_escaped() -> None:
+    root = _parse(bar_chart("<b>", ("a & b",), (1.0,)))
+    assert "a & b" in _texts(root)
+
+
+def test_empty_charts_render_placeholder() -> None:
+    assert "Sem dados" in _texts(_parse(expenses_by_type_chart((), ())))
+    assert "Sem dados" in _texts(_parse(occupancy_chart((), ())))
+    assert "Sem dados" in _texts(_parse(income_expense_chart((), (), ())))
+
+
+def test_identical_inputs_are_cached() -> None:
+    occupancy_chart.cache_clear()
+    first = occupancy_chart(("alugada",), (2,))
+    second = occupancy_chart(("alugada",), (2,))
+
+    assert first is second
+    assert occupancy_chart.cache_info().hits == 1
+    assert occupancy_chart(("alugada",), (3,)) != first
@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Contract, Owner as User
+from app.rendering.contract import load_contract_document
+
+
+@pytest.mark.asyncio
+async def test_cache_key_differs_for_contracts_with_equal_timestamps(
+    session: AsyncSession, default_user: User, default_contract: Contract
+) -> None:
+    other = Contract(
+        valor_caucao=default_contract.valor_caucao,
+        data_inicio=default_contract.data_inicio,
+        data_fim=default_contract.data_fim,
+        valor_base=default_contract.valor_base,
+        dia_vencimento=default_contract.dia_vencimento,
+        taxa_reajuste=None,
+        casa_id=default_contract.casa_id,
+        template_id=default_contract.template_id,
+        inquilino_id=default_contract.inquilino_id,
+        user_id=default_contract.user_id,
+    )
+    session.add(other)
+    await session.commit()
+    await session.refresh(other)
+
+    document = await load_contract_document(session, default_contract.id, default_user)
+    other_document = await load_contract_document(session, other.id, default_user)
+
+    # written in one transaction, every row shares its update_time
+    assert document.contract.update_time == other_document.contract.update_time
+    assert document.cache_key() != other_document.cache_key()
+    assert document.cache_key() == (
+        await load_contract_document(session, default_contract.id, default_user)
+    ).cache_key()
@@ -0,0 +1,72 @@
+import asyncio
+import base64
+import re
+import zlib
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from reportlab.lib.styles import getSampleStyleSheet
+
+from app.rendering.inspection import create_inspection_pdf, get_styles
+from app.schemas.requests import InspectionCreateRequest
+
+
+def _person(nome: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        nome=nome,
+        cpf="12345678901",
+        email="pessoa@example.com",
+        estado_civil="solteiro",
+        profissao="Engenheiro",
+        rua="Rua das Flores",
+        numero=100,
+        bairro="Centro",
+        cep="72000-000",
+        cidade="Brasilia",
+        estado="DF",
+    )
+
+
+def _render(tenant_name: str) -> bytes:
+    return create_inspection_pdf(
+        InspectionCreateRequest(data_vistoria=date(2024, 1, 1)),
+        _person("Maria Souza"),  # type: ignore
+        _person(tenant_name),  # type: ignore
+        _person("Maria Souza"),  # type: ignore
+        None,
+    )
+
+
+def _pdf_text(pdf: bytes) -> bytes:
+    # ReportLab encodes page streams as ASCII85 over Flate
+    streams = re.findall(rb"stream\n(.*?)~>\s*endstream", pdf, re.DOTALL)
+    return b"".join(zlib.decompress(base64.a85decode(stream)) for stream in streams)
+
+
+def test_create_inspection_pdf_returns_bytes() -> None:
+    pdf = _render("Inquilino Unico")
+    assert pdf.startswith(b"%PDF")
+    assert b"Inquilino Unico" in _pdf_text(pdf)
+
+
+def test_styles_do_not_mutate_sample_stylesheet() -> None:
+    _render("Inquilino Unico")
+    assert get_styles()["text"].leading == 14
+    assert getSampleStyleSheet()["BodyText"].leading != 14
+
+
+@pytest.mark.asyncio
+async def test_concurrent_renders_are_isolated() -> None:
+    names = [f"Inquilino Numero {i}" for i in range(8)]
+
+    pdfs = await asyncio.gather(
+        *(asyncio.to_thread(_render, name) for name in names)
+    )
+
+    for name, pdf in zip(names, pdfs):
+        text = _pdf_text(pdf)
+        assert name.encode() in text
+        assert all(
+            other.encode() not in text for other in names if other != name
+        )
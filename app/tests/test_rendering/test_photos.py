@@ -0,0 +1,136 @@
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, UploadFile, status
+from httpx import AsyncClient
+from PIL import Image
+
+from app.models.models import Contract
+from app.rendering.photos import (
+    InvalidPhotoError,
+    cell_size_in_pixels,
+    make_photo_variants,
+    prepare_photo,
+    prepare_photo_variants,
+    prepare_photos,
+)
+
+TEST_IMAGE = Path(__file__).parent.parent / "test_files" / "test_image.jpg"
+
+
+def test_cell_size_in_pixels() -> None:
+    assert cell_size_in_pixels(72, 144, 150) == (150, 300)
+
+
+def test_prepare_photo_downscales_to_cell() -> None:
+    with TEST_IMAGE.open("rb") as fp:
+        prepared = prepare_photo(fp, (200, 100), quality=80)
+
+    with Image.open(BytesIO(prepared)) as image:
+        assert image.format == "JPEG"
+        assert image.size == (200, 100)
+    assert len(prepared) < TEST_IMAGE.stat().st_size
+
+
+def test_prepare_photo_does_not_upscale() -> None:
+    with TEST_IMAGE.open("rb") as fp:
+        prepared = prepare_photo(fp, (2000, 2000), quality=80)
+
+    with Image.open(BytesIO(prepared)) as image:
+        assert image.size == (860, 585)
+
+
+@pytest.mark.asyncio
+async def test_prepare_photos_keeps_upload_order() -> None:
+    small = BytesIO()
+    Image.new("RGB", (10, 10), "red").save(small, "PNG")
+    small.seek(0)
+
+    photos = [
+        UploadFile(file=TEST_IMAGE.open("rb"), filename="a.jpg"),
+        UploadFile(file=small, filename="b.png"),
+    ]
+    prepared = await prepare_photos(photos, 72, 72)
+
+    sizes = [Image.open(BytesIO(photo)).size for photo in prepared]
+    assert sizes == [(150, 150), (10, 10)]
+    await photos[0].close()
+
+
+@pytest.mark.asyncio
+async def test_prepare_photos_rejects_invalid_image() -> None:
+    with pytest.raises(HTTPException) as exc:
+        await prepare_photos(
+            [UploadFile(file=BytesIO(b"not an image"), filename="a.jpg")], 72, 72
+        )
+    assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_prepare_photo_rejects_truncated_jpeg() -> None:
+    # the header parses, the error only comes once the pixels are decoded
+    truncated = TEST_IMAGE.read_bytes()[:2000]
+
+    with pytest.raises(InvalidPhotoError):
+        prepare_photo(BytesIO(truncated), (200, 100), quality=80)
+
+
+@pytest.mark.asyncio
+async def test_create_inspection_rejects_truncated_jpeg(
+    client: AsyncClient, default_user_headers: dict, default_contract: Contract
+) -> None:
+    response = await client.post(
+        f"/inspection/{default_contract.id}",
+        headers=default_user_headers,
+        data={
+            "data_vistoria": "2024-01-01",
+            "estado_pintura": "Nova",
+            "tipo_tinta": "latex",
+            "condicao_eletrica": "Funcionando",
+        },
+        files={
+            "inspection_photos": (
+                "sala.jpg",
+                TEST_IMAGE.read_bytes()[:2000],
+                "image/jpeg",
+            )
+        },
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_make_photo_variants_scales_each_variant() -> None:
+    with TEST_IMAGE.open("rb") as fp:
+        variants = make_photo_variants(
+            fp,
+            {"original": None, "medium": 430, "thumbnail": 100},
+            jpeg_quality=80,
+            webp_quality=75,
+        )
+
+    sizes = {}
+    for name, encoded in variants.items():
+        for format, content in encoded.items():
+            with Image.open(BytesIO(content)) as image:
+                assert image.format == format.upper()
+                sizes[name, format] = image.size
+
+    assert sizes == {
+        ("original", "webp"): (860, 585),
+        ("original", "jpeg"): (860, 585),
+        ("medium", "webp"): (430, 293),
+        ("medium", "jpeg"): (430, 293),
+        ("thumbnail", "webp"): (100, 68),
+        ("thumbnail", "jpeg"): (100, 68),
+    }
+    assert len(variants["thumbnail"]["webp"]) < len(variants["thumbnail"]["jpeg"])
+
+
+@pytest.mark.asyncio
+async def test_prepare_photo_variants_rejects_invalid_image() -> None:
+    with pytest.raises(HTTPException) as exc:
+        await prepare_photo_variants(
+            UploadFile(file=BytesIO(b"not an image"), filename="a.jpg")
+        )
+    assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,87 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException, status
+
+from app.rendering import renderer
+from app.rendering.renderer import PDFRenderer
+
+
+@pytest.fixture(name="thread_renderer")
+def fixture_thread_renderer(monkeypatch: pytest.MonkeyPatch) -> PDFRenderer:
+    # a thread pool lets the worker function be monkeypatched
+    pdf_renderer = PDFRenderer(
+        workers=1, job_timeout_secs=0.2, max_queue_size=2, recycle_after_jobs=2
+    )
+    monkeypatch.setattr(
+        pdf_renderer, "_new_executor", lambda: ThreadPoolExecutor(max_workers=1)
+    )
+
+    def fake_render(html: str, stylesheet: str | None = None) -> bytes:
+        if html == "slow":
+            time.sleep(0.5)
+        return f"%PDF {html}".encode()
+
+    monkeypatch.setattr(renderer, "render_html_to_pdf", fake_render)
+    return pdf_renderer
+
+
+@pytest.mark.asyncio
+async def test_render_returns_pdf_bytes(thread_renderer: PDFRenderer) -> None:
+    assert await thread_renderer.render("<p>ok</p>") == b"%PDF <p>ok</p>"
+    assert thread_renderer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_render_times_out(thread_renderer: PDFRenderer) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await thread_renderer.render("slow")
+
+    assert exc_info.value.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert thread_renderer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_render_rejects_when_queue_is_full(
+    thread_renderer: PDFRenderer,
+) -> None:
+    thread_renderer.pending = thread_renderer.max_queue_size
+
+    with pytest.raises(HTTPException) as exc_info:
+        await thread_renderer.render("<p>ok</p>")
+
+    assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+@pytest.mark.asyncio
+async def test_warm_up_marks_renderer_ready(thread_renderer: PDFRenderer) -> None:
+    assert not thread_renderer.ready
+
+    await thread_renderer.warm_up()
+
+    assert thread_renderer.ready
+
+
+@pytest.mark.asyncio
+async def test_pool_is_recycled_after_configured_jobs(
+    thread_renderer: PDFRenderer,
+) -> None:
+    await thread_renderer.warm_up()
+    first_executor = thread_renderer.executor
+
+    await thread_renderer.render("<p>1</p>")
+    assert thread_renderer.executor is first_executor
+
+    await thread_renderer.render("<p>2</p>")
+    # the replacement pool warms up without failing the readiness probe
+    assert thread_renderer._warm_up_task is not None
+    assert not thread_renderer._pool_warm
+    assert thread_renderer.ready
+    await thread_renderer._warm_up_task
+
+    assert thread_renderer.executor is not first_executor
+    assert thread_renderer.completed_jobs == 0
+    assert thread_renderer._pool_warm
+    assert thread_renderer.ready
+    thread_renderer.shutdown()
@@ -0,0 +1,43 @@
+import datetime
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Expenses, Houses
+from app.rendering.renderer import PDFRenderer
+
+
+@pytest.mark.asyncio
+async def test_generate_report_embeds_charts(
+    client: AsyncClient,
+    session: AsyncSession,
+    default_house: Houses,
+    default_user_headers: dict,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    session.add(
+        Expenses(
+            tipo_despesa="reparo",
+            valor=250,
+            data_despesa=datetime.date.today(),
+            casa_id=default_house.id,
+        )
+    )
+    await session.commit()
+
+    rendered: list[str] = []
+
+    async def fake_render(self, html: str, request=None, stylesheet=None) -> bytes:
+        rendered.append(html)
+        return b"%PDF-1.7 report"
+
+    monkeypatch.setattr(PDFRenderer, "render", fake_render)
+
+    response = await client.post("/generate-report", headers=default_user_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == b"%PDF-1.7 report"
+
+    (html,) = rendered
+    assert html.count("<svg ") == 3
+    assert "R$ 250,00" in html
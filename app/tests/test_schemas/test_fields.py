@@ -0,0 +1,106 @@
+from collections.abc import Generator
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.core import database_session
+from app.main import app
+from app.models.models import Contract, Houses, Tenant
+
+
+@pytest.fixture(name="statements")
+def fixture_statements() -> Generator[list[str], None, None]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    engine = database_session._ASYNC_ENGINE.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_tenants_fields_narrow_response_and_query(
+    client: AsyncClient,
+    default_user_headers: dict[str, str],
+    default_tenant: Tenant,
+    statements: list[str],
+) -> None:
+    response = await client.get(
+        "/tenants?fields=name,contact", headers=default_user_headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"contact": "555-5555", "name": "John Doe"}]
+
+    query = next(statement for statement in statements if "FROM inquilino" in statement)
+    assert "inquilino.nome" in query
+    assert "inquilino.contato_emergencia" not in query
+
+
+@pytest.mark.asyncio
+async def test_houses_fields(
+    client: AsyncClient, default_user_headers: dict[str, str], default_house: Houses
+) -> None:
+    response = await client.get(
+        "/houses?fields=id,nickname,photo_variants", headers=default_user_headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"id": default_house.id, "nickname": "Casa Teste", "photo_variants": None}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_contracts_fields_with_nested_tenant(
+    client: AsyncClient,
+    default_user_headers: dict[str, str],
+    default_contract: Contract,
+    statements: list[str],
+) -> None:
+    response = await client.get(
+        "/contracts?fields=id,reajustment_rate,tenant", headers=default_user_headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    [contract] = response.json()
+    assert set(contract) == {"id", "reajustment_rate", "tenant"}
+    assert contract["reajustment_rate"] == "None"
+    assert contract["tenant"]["name"] == "John Doe"
+
+    query = next(statement for statement in statements if "FROM contrato" in statement)
+    assert "contrato.valor_base" not in query
+    assert "casas.apelido" not in query
+
+
+@pytest.mark.asyncio
+async def test_unknown_fields_are_rejected(
+    client: AsyncClient, default_user_headers: dict[str, str]
+) -> None:
+    response = await client.get(
+        "/tenants?fields=name,senha_hash", headers=default_user_headers
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Unknown fields requested: senha_hash"
+
+
+def test_fields_parameter_is_documented() -> None:
+    parameters = app.openapi()["paths"]["/houses"]["get"]["parameters"]
+    [fields] = [parameter for parameter in parameters if parameter["name"] == "fields"]
+    assert "nickname" in fields["description"]
+
+
+@pytest.mark.asyncio
+async def test_contracts_fields_without_validated_field(
+    client: AsyncClient, default_user_headers: dict[str, str], default_contract: Contract
+) -> None:
+    response = await client.get("/contracts?fields=id", headers=default_user_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id": default_contract.id}]
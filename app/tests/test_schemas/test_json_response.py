@@ -0,0 +1,35 @@
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+
+from app.main import app
+from app.schemas.responses import ORJSONResponse
+
+
+def test_orjson_response_encodes_like_jsonable_encoder() -> None:
+    content = {
+        "due_date": date(2024, 2, 10),
+        "updated_at": datetime(2024, 2, 10, 12, 30, tzinfo=timezone.utc),
+        "user_id": UUID("b75365d9-7bf9-4f54-add5-aeab333a087b"),
+        "installment_value": Decimal("1000.50"),
+        "rooms": Decimal("4"),
+        "name": "Inquilino São João",
+    }
+
+    body = ORJSONResponse(content).body
+
+    assert json.loads(body) == json.loads(json.dumps(jsonable_encoder(content)))
+    assert "São João".encode() in body
+
+
+def test_routes_default_to_orjson_response() -> None:
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.path == "/users/me"
+    )
+    assert route.response_class is ORJSONResponse
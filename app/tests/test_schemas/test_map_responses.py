@@ -0,0 +1,69 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+from app.models.models import Houses, PaymentInstallment
+from app.schemas.map_responses import (
+    HOUSE_LIST,
+    PAYMENT_INSTALLMENT_LIST,
+    map_house_to_response,
+    map_list_to_response,
+)
+from app.schemas.responses import HouseResponse
+
+
+def test_list_response_is_rendered_from_orm_rows() -> None:
+    parcela = PaymentInstallment(
+        id=1,
+        valor_parcela=Decimal("1000.50"),
+        fg_pago=False,
+        tipo_pagamento=None,
+        data_vencimento=date(2024, 2, 10),
+        data_pagamento=None,
+        contrato_id=7,
+    )
+
+    response = map_list_to_response(PAYMENT_INSTALLMENT_LIST, [parcela])
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [
+        {
+            "id": 1,
+            "installment_value": 1000.5,
+            "fg_paid": False,
+            # what str(None) always gave clients
+            "payment_type": "None",
+            "due_date": "2024-02-10",
+            "payment_date": None,
+            "contract_id": 7,
+        }
+    ]
+
+
+def test_response_models_build_from_rows_and_by_field_name() -> None:
+    house = Houses(
+        id=3,
+        propriedade_id=2,
+        foto=None,
+        foto_variantes=None,
+        apelido="Casa 1",
+        qtd_comodos=4,
+        banheiros=2,
+        mobiliada=True,
+        status="vaga",
+    )
+
+    from_row = map_house_to_response(house)
+    by_name = HouseResponse(
+        id=3,
+        property_id=2,
+        photo=None,
+        nickname="Casa 1",
+        room_count=4,
+        bathrooms=2,
+        furnished=True,
+        status="vaga",
+    )
+
+    assert from_row == by_name
+    assert HOUSE_LIST.dump_python([from_row])[0]["nickname"] == "Casa 1"
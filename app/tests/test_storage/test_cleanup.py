@@ -0,0 +1,135 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Houses
+from app.storage import cleanup
+from app.storage.cleanup import (
+    count_references,
+    managed_name,
+    remove_unreferenced_files,
+)
+from app.storage.memory import MemoryStorage
+
+GRACE_SECS = 3600
+
+
+def key(storage: MemoryStorage, url: str) -> str:
+    file_path = storage.file_path_from_url(url)
+    assert file_path is not None
+    return file_path
+
+
+def age(storage: MemoryStorage, url: str, hours: int) -> None:
+    file_path = key(storage, url)
+    content, content_type, _ = storage.files[file_path]
+    written_at = datetime.now(timezone.utc) - timedelta(hours=hours)
+    storage.files[file_path] = (content, content_type, written_at)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_removes_only_old_unreferenced_files(
+    session: AsyncSession, default_house: Houses
+) -> None:
+    storage = MemoryStorage("/files/")
+    photo = await storage.upload_content(BytesIO(b"photo"), "image")
+    thumbnail = await storage.upload_content(BytesIO(b"thumbnail"), "webp")
+    orphan = await storage.upload_content(BytesIO(b"orphan"), "pdf")
+    recent = await storage.upload_content(BytesIO(b"recent"), "pdf")
+    storage.files["aluguelapp/legacy2024-01-01"] = (
+        b"legacy",
+        "image/jpeg",
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    for url in (photo, thumbnail, orphan):
+        age(storage, url, hours=2)
+
+    default_house.foto = photo
+    default_house.foto_variantes = {"thumbnail": {"webp": thumbnail}}
+    await session.commit()
+
+    references = await count_references(session)
+    name = managed_name(photo)
+    assert name is not None and references[name] == 1
+
+    removed = await remove_unreferenced_files(storage, session, GRACE_SECS)
+
+    assert removed == [key(storage, orphan)]
+    assert set(storage.files) == {
+        key(storage, url) for url in (photo, thumbnail, recent)
+    } | {"aluguelapp/legacy2024-01-01"}
+
+
+@pytest.mark.asyncio
+async def test_reuploading_a_file_keeps_it_from_cleanup(session: AsyncSession) -> None:
+    storage = MemoryStorage("/files/")
+    url = await storage.upload_content(BytesIO(b"contract"), "pdf")
+    age(storage, url, hours=2)
+
+    # deduplicated, its row is about to be committed
+    assert await storage.upload_content(BytesIO(b"contract"), "pdf") == url
+
+    assert await remove_unreferenced_files(storage, session, GRACE_SECS) == []
+    assert len(storage.files) == 1
+
+
+@pytest.mark.asyncio
+async def test_cleanup_removes_unconfirmed_direct_uploads(session: AsyncSession) -> None:
+    storage = MemoryStorage("/files/")
+    staged = storage.direct_upload_path("pdf")
+    storage._put(staged, BytesIO(b"never confirmed"), "application/pdf")
+    age(storage, storage.url(staged), hours=2)
+
+    assert await remove_unreferenced_files(storage, session, GRACE_SECS) == [staged]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_keeps_files_referenced_under_an_older_url(
+    session: AsyncSession, default_house: Houses
+) -> None:
+    old_storage = MemoryStorage("https://old-cdn.example.com/")
+    photo = await old_storage.upload_content(BytesIO(b"photo"), "image")
+    contract = await old_storage.upload_content(BytesIO(b"contract"), "pdf")
+    default_house.foto = photo
+    default_house.foto_variantes = {"thumbnail": {"jpeg": contract}}
+    await session.commit()
+
+    # storage.public_url changed, the rows keep the URLs they were saved with
+    storage = MemoryStorage("/files/")
+    storage.files = old_storage.files
+    for url in (photo, contract):
+        age(old_storage, url, hours=2)
+
+    assert await remove_unreferenced_files(storage, session, GRACE_SECS) == []
+    assert len(storage.files) == 2
+
+
+@pytest.mark.asyncio
+async def test_cleanup_rechecks_files_before_deleting_them(
+    session: AsyncSession, default_house: Houses, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = MemoryStorage("/files/")
+    reuploaded = await storage.upload_content(BytesIO(b"contract"), "pdf")
+    referenced = await storage.upload_content(BytesIO(b"photo"), "image")
+    orphan = await storage.upload_content(BytesIO(b"orphan"), "pdf")
+    for url in (reuploaded, referenced, orphan):
+        age(storage, url, hours=2)
+
+    async def count_then_upload(session: AsyncSession) -> Counter[str]:
+        references = await count_references(session)
+        if not default_house.foto:
+            # both land between the first count and the deletes
+            await storage.upload_content(BytesIO(b"contract"), "pdf")
+            default_house.foto = referenced
+            await session.commit()
+        return references
+
+    monkeypatch.setattr(cleanup, "count_references", count_then_upload)
+
+    removed = await remove_unreferenced_files(storage, session, GRACE_SECS)
+
+    assert removed == [key(storage, orphan)]
+    assert set(storage.files) == {key(storage, url) for url in (reuploaded, referenced)}
@@ -0,0 +1,160 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from app.core.config import get_settings
+from app.models.models import Contract
+from app.storage.backend import get_storage
+from app.storage.memory import MemoryStorage
+
+SIGNED_PDF = b"%PDF-1.7 signed directly"
+
+
+async def upload(client: AsyncClient, signed: dict, content: bytes) -> int:
+    response = await client.request(
+        signed["method"],
+        signed["upload_url"],
+        content=content,
+        headers=signed["headers"],
+    )
+    return response.status_code
+
+
+@pytest.mark.asyncio
+async def test_contract_signed_pdf_direct_upload(
+    client: AsyncClient,
+    default_user_headers: dict[str, str],
+    default_contract: Contract,
+) -> None:
+    response = await client.post(
+        f"/contracts/{default_contract.id}/signed-pdf/upload-url",
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    signed = response.json()
+    assert "/aluguelapp/diretos/" in signed["upload_url"]
+
+    assert await upload(client, signed, SIGNED_PDF) == status.HTTP_200_OK
+
+    response = await client.post(
+        f"/contracts/{default_contract.id}/signed-pdf/confirm",
+        json={"upload_token": signed["upload_token"]},
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    signed_pdf = response.json()["signed_pdf"]
+    assert signed["upload_url"].startswith(signed_pdf + "?")
+
+    stored = await client.get(signed_pdf)
+    assert stored.headers["content-type"] == "application/pdf"
+    assert stored.content == SIGNED_PDF
+
+
+@pytest.mark.asyncio
+async def test_user_photo_direct_upload(
+    client: AsyncClient, default_user_headers: dict[str, str]
+) -> None:
+    response = await client.post(
+        "/users/me/photo/upload-url", headers=default_user_headers
+    )
+    signed = response.json()
+    with open("app/tests/test_files/test_image.jpg", "rb") as image_file:
+        assert await upload(client, signed, image_file.read()) == status.HTTP_200_OK
+
+    response = await client.post(
+        "/users/me/photo/confirm",
+        json={"upload_token": signed["upload_token"]},
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    user = response.json()
+    assert user["photo"] == user["photo_variants"]["original"]["jpeg"]
+
+    thumbnail = await client.get(user["photo_variants"]["thumbnail"]["webp"])
+    assert thumbnail.headers["content-type"] == "image/webp"
+
+    # only the variants are kept
+    staged = await client.get(signed["upload_url"].split("?")[0])
+    assert staged.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_token_is_bound_to_its_file_and_target(
+    client: AsyncClient,
+    default_user_headers: dict[str, str],
+    default_contract: Contract,
+) -> None:
+    response = await client.post(
+        "/users/me/photo/upload-url", headers=default_user_headers
+    )
+    signed = response.json()
+
+    other_path = signed["upload_url"].replace("/diretos/", "/diretos/outro")
+    response = await client.put(other_path, content=b"jpeg", headers=signed["headers"])
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = await client.put(
+        signed["upload_url"],
+        content=b"%PDF",
+        headers={"Content-Type": "application/pdf"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    assert await upload(client, signed, b"jpeg") == status.HTTP_200_OK
+    response = await client.post(
+        f"/contracts/{default_contract.id}/signed-pdf/confirm",
+        json={"upload_token": signed["upload_token"]},
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    # an upload token is not an access token
+    response = await client.get(
+        "/users/me", headers={"Authorization": f"Bearer {signed['upload_token']}"}
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_confirm_checks_the_stored_file(
+    client: AsyncClient,
+    default_user_headers: dict[str, str],
+    default_contract: Contract,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("STORAGE__MAX_UPLOAD_BYTES", "16")
+    get_settings.cache_clear()
+    response = await client.post(
+        f"/contracts/{default_contract.id}/signed-pdf/upload-url",
+        headers=default_user_headers,
+    )
+    signed = response.json()
+    confirm = {"upload_token": signed["upload_token"]}
+
+    response = await client.post(
+        f"/contracts/{default_contract.id}/signed-pdf/confirm",
+        json=confirm,
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    assert (
+        await upload(client, signed, SIGNED_PDF)
+        == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    )
+
+    # written around PUT /files, as a client could on a bucket
+    storage = await get_storage()
+    assert isinstance(storage, MemoryStorage)
+    file_path = storage.file_path_from_url(signed["upload_url"].split("?")[0])
+    assert file_path is not None
+    storage.files[file_path] = (b"<html>", "text/html", datetime.now(timezone.utc))
+
+    response = await client.post(
+        f"/contracts/{default_contract.id}/signed-pdf/confirm",
+        json=confirm,
+        headers=default_user_headers,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
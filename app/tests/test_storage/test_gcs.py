@@ -0,0 +1,133 @@
+import hashlib
+import threading
+import time
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException, status
+from google.api_core.exceptions import NotFound  # type: ignore
+from google.cloud import storage  # type: ignore
+
+from app.core.config import get_settings
+from app.storage import gcs
+from app.storage.gcs import get_gcs_storage
+
+
+class FakeBlob:
+    # set by tests to hold every upload until the others arrive, or to stall
+    barrier: threading.Barrier | None = None
+    delay = 0.0
+
+    def __init__(self, name: str, uploads: list[tuple[str, bytes, str]]):
+        self.name = name
+        self.uploads = uploads
+
+    def upload_from_file(self, file, content_type: str, timeout: float) -> None:
+        if FakeBlob.barrier is not None:
+            FakeBlob.barrier.wait()
+        time.sleep(FakeBlob.delay)
+        self.uploads.append((self.name, file.read(), content_type))
+
+    def patch(self, timeout: float) -> None:
+        if self.name not in [name for name, _, _ in self.uploads]:
+            raise NotFound(self.name)
+
+
+class FakeBucket:
+    def __init__(self, uploads: list[tuple[str, bytes, str]]):
+        self.uploads = uploads
+
+    def blob(self, name: str, chunk_size: int | None = None) -> FakeBlob:
+        return FakeBlob(name, self.uploads)
+
+
+class FakeClient:
+    created = 0
+
+    def __init__(self) -> None:
+        FakeClient.created += 1
+        self.uploads: list[tuple[str, bytes, str]] = []
+
+    def bucket(self, name: str) -> FakeBucket:
+        return FakeBucket(self.uploads)
+
+    def get_bucket(self, name: str) -> FakeBucket:
+        raise AssertionError("get_bucket makes a metadata request per upload")
+
+
+@pytest.fixture(autouse=True)
+def fixture_fake_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    FakeClient.created = 0
+    FakeBlob.barrier = None
+    FakeBlob.delay = 0.0
+    monkeypatch.setattr(
+        storage.Client, "from_service_account_info", lambda info: FakeClient()
+    )
+    monkeypatch.setattr(gcs, "_storage", None)
+    monkeypatch.setattr(gcs, "_storage_key", None)
+
+
+def test_storage_is_shared_until_credentials_change() -> None:
+    first = get_gcs_storage({"client_email": "a@e-aluguel"})
+
+    assert get_gcs_storage({"client_email": "a@e-aluguel"}) is first
+    assert FakeClient.created == 1
+
+    assert get_gcs_storage({"client_email": "b@e-aluguel"}) is not first
+    assert FakeClient.created == 2
+
+
+@pytest.mark.asyncio
+async def test_uploads_are_content_addressed() -> None:
+    storage_service = get_gcs_storage({"client_email": "a@e-aluguel"})
+
+    first = await storage_service.upload_content(BytesIO(b"one"), "image")
+    second = await storage_service.upload_content(BytesIO(b"two"), "pdf")
+    again = await storage_service.upload_content(BytesIO(b"one"), "image")
+
+    assert first == again
+    assert first == (
+        "https://storage.googleapis.com/e-aluguel/aluguelapp/"
+        + hashlib.sha256(b"one").hexdigest()
+        + ".jpg"
+    )
+    assert "/aluguelapp/contratos/" in second
+    assert second.endswith(".pdf")
+    uploads = storage_service.storage_client.uploads
+    assert [(data, content_type) for _, data, content_type in uploads] == [
+        (b"one", "image/jpeg"),
+        (b"two", "application/pdf"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_upload_many_runs_uploads_in_parallel() -> None:
+    storage_service = get_gcs_storage({"client_email": "a@e-aluguel"})
+    # sequential uploads would never get past the barrier
+    FakeBlob.barrier = threading.Barrier(3, timeout=5)
+
+    urls = await storage_service.upload_many(
+        [
+            (BytesIO(b"one"), "image"),
+            (BytesIO(b"two"), "image"),
+            (BytesIO(b"three"), "pdf"),
+        ]
+    )
+
+    assert len(set(urls)) == 3
+    assert "/aluguelapp/contratos/" in urls[2]
+    uploads = storage_service.storage_client.uploads
+    assert sorted(data for _, data, _ in uploads) == [b"one", b"three", b"two"]
+
+
+@pytest.mark.asyncio
+async def test_upload_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("STORAGE__UPLOAD_TIMEOUT_SECS", "0.05")
+    get_settings.cache_clear()
+    storage_service = get_gcs_storage({"client_email": "a@e-aluguel"})
+    FakeBlob.delay = 0.5
+
+    with pytest.raises(HTTPException) as exc_info:
+        await storage_service.upload_content(BytesIO(b"one"), "image")
+
+    assert exc_info.value.status_code == status.HTTP_504_GATEWAY_TIMEOUT
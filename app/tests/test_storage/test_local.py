@@ -0,0 +1,93 @@
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from app.core.config import get_settings
+from app.storage.backend import get_storage
+from app.storage.local import LocalStorage, SendfileResponse
+
+
+@pytest.fixture(name="local_storage")
+def fixture_local_storage(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setenv("STORAGE__BACKEND", "local")
+    monkeypatch.setenv("STORAGE__LOCAL_DIRECTORY", str(tmp_path))
+    get_settings.cache_clear()
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_local_upload_is_served_back(
+    client: AsyncClient, local_storage: Path
+) -> None:
+    storage = await get_storage()
+    assert isinstance(storage, LocalStorage)
+
+    url = await storage.upload_content(BytesIO(b"%PDF-1.7 signed"), "pdf")
+
+    assert url.startswith("/files/aluguelapp/contratos/")
+    assert url.endswith(".pdf")
+    assert list(local_storage.rglob("*.tmp")) == []
+
+    response = await client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content == b"%PDF-1.7 signed"
+
+
+@pytest.mark.asyncio
+async def test_local_storage_stays_inside_its_directory(
+    client: AsyncClient, local_storage: Path
+) -> None:
+    (local_storage.parent / "secret.txt").write_text("secret")
+
+    response = await client.get("/files/..%2Fsecret.txt")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await client.get("/files/aluguelapp/missing.jpg")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_sendfile_response_hands_the_file_to_the_server(tmp_path: Path) -> None:
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"jpeg")
+    messages: list[dict] = []
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.zerocopysend":
+            message = {**message, "file": message["file"].read()}
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "extensions": {"http.response.zerocopysend": {}},
+    }
+    await SendfileResponse(path)(scope, None, send)  # type: ignore[arg-type]
+
+    assert [message["type"] for message in messages] == [
+        "http.response.start",
+        "http.response.zerocopysend",
+    ]
+    assert messages[1]["file"] == b"jpeg"
+
+
+@pytest.mark.asyncio
+async def test_local_storage_can_leave_the_body_to_nginx(
+    client: AsyncClient, local_storage: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("STORAGE__ACCEL_REDIRECT_PREFIX", "/internal-files")
+    get_settings.cache_clear()
+    storage = await get_storage()
+    url = await storage.upload_content(BytesIO(b"jpeg"), "image")
+
+    response = await client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["x-accel-redirect"] == url.replace(
+        "/files", "/internal-files", 1
+    )
+    assert response.content == b""
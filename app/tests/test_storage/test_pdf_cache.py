@@ -0,0 +1,49 @@
+import os
+import time
+from pathlib import Path
+
+from app.storage.pdf_cache import PDFCache, etag_for, etag_matches, make_cache_key
+
+
+def test_cache_key_changes_with_inputs() -> None:
+    key = make_cache_key("1", ("Contract", 1))
+    assert key == make_cache_key("1", ("Contract", 1))
+    assert key != make_cache_key("2", ("Contract", 1))
+
+
+def test_cache_returns_stored_content(tmp_path: Path) -> None:
+    cache = PDFCache(tmp_path, max_size_bytes=1024)
+    assert cache.get("missing") is None
+
+    cache.put("key", b"%PDF-1.7 content")
+    assert cache.get("key") == b"%PDF-1.7 content"
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = PDFCache(tmp_path, max_size_bytes=250)
+    cache.put("first", b"a" * 100)
+    cache.put("second", b"b" * 100)
+    past = time.time() - 60
+    os.utime(tmp_path / "second.pdf", (past, past))
+    os.utime(tmp_path / "first.pdf", (past + 1, past + 1))
+
+    cache.put("third", b"c" * 100)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == b"a" * 100
+    assert cache.get("third") == b"c" * 100
+
+
+def test_cache_skips_entries_larger_than_limit(tmp_path: Path) -> None:
+    cache = PDFCache(tmp_path, max_size_bytes=10)
+    cache.put("big", b"x" * 11)
+    assert cache.get("big") is None
+
+
+def test_etag_matches() -> None:
+    etag = etag_for("abc")
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"abc", "def"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"def"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import database_session
+from app.helpers.get_service_account import CONFIG_CHANGED_CHANNEL, ServiceAccountCache
+from app.models.models import Props
+
+
+@pytest_asyncio.fixture(name="service_account")
+async def fixture_service_account(session: AsyncSession) -> Props:
+    props = Props(column={"client_email": "a@e-aluguel"})
+    session.add(props)
+    await session.flush()
+    return props
+
+
+async def change_service_account(session: AsyncSession, props: Props) -> None:
+    await session.execute(
+        update(Props)
+        .where(Props.id == props.id)
+        .values(column={"client_email": "b@e-aluguel"})
+    )
+    await session.flush()
+
+
+@pytest.mark.asyncio
+async def test_cache_reuses_loaded_value(
+    session: AsyncSession, service_account: Props
+) -> None:
+    cache = ServiceAccountCache(ttl_secs=60)
+    assert await cache.get() == {"client_email": "a@e-aluguel"}
+
+    await change_service_account(session, service_account)
+
+    assert await cache.get() == {"client_email": "a@e-aluguel"}
+
+
+@pytest.mark.asyncio
+async def test_cache_reloads_after_ttl(
+    session: AsyncSession, service_account: Props
+) -> None:
+    cache = ServiceAccountCache(ttl_secs=0)
+    await cache.get()
+
+    await change_service_account(session, service_account)
+
+    assert await cache.get() == {"client_email": "b@e-aluguel"}
+
+
+@pytest.mark.asyncio
+async def test_cache_reloads_after_invalidate(
+    session: AsyncSession, service_account: Props
+) -> None:
+    cache = ServiceAccountCache(ttl_secs=60)
+    await cache.get()
+
+    await change_service_account(session, service_account)
+    cache.invalidate()
+
+    assert await cache.get() == {"client_email": "b@e-aluguel"}
+
+
+@pytest.mark.asyncio
+async def test_cache_raises_without_service_account(session: AsyncSession) -> None:
+    cache = ServiceAccountCache(ttl_secs=60)
+
+    with pytest.raises(Exception, match="No service account key found"):
+        await cache.get()
+
+
+@pytest.mark.asyncio
+async def test_notify_invalidates_cache(
+    session: AsyncSession, service_account: Props
+) -> None:
+    cache = ServiceAccountCache(ttl_secs=60)
+    await cache.get()
+    await cache.listen()
+
+    try:
+        await change_service_account(session, service_account)
+        # NOTIFY is only delivered on commit, the test session never commits
+        async with database_session._ASYNC_ENGINE.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(
+                text("SELECT pg_notify(:channel, '')"),
+                {"channel": CONFIG_CHANGED_CHANNEL},
+            )
+
+        for _ in range(40):
+            if await cache.get() == {"client_email": "b@e-aluguel"}:
+                break
+            await asyncio.sleep(0.05)
+
+        assert await cache.get() == {"client_email": "b@e-aluguel"}
+    finally:
+        await cache.close()
@@ -0,0 +1,84 @@
+"""Bytes on the wire with and without ``CompressionMiddleware``.
+
+Sends list payloads of a few sizes through the middleware around a bare
+ASGI app, once per encoding, and reports the body size and the time spent
+compressing. Run from the project root with
+``python -m benchmarks.bench_compression``.
+"""
+import asyncio
+import time
+from uuid import uuid4
+
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core.compression import CompressionMiddleware
+from app.schemas.responses import ORJSONResponse
+from benchmarks.bench_json_response import _contract, _installment, _tenant
+
+ROUNDS = 10
+
+
+async def _send_through(body: bytes, encoding: str) -> tuple[int, float]:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    size = 0
+
+    async def send(message: Message) -> None:
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message["body"])
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", encoding.encode())]}
+    middleware = CompressionMiddleware(app)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        size = 0
+        await middleware(scope, None, send)  # type: ignore[arg-type]
+    return size, (time.perf_counter() - start) / ROUNDS * 1000
+
+
+async def _main() -> None:
+    user_id = str(uuid4())
+    payloads = {
+        "1 tenant": [_tenant(0)],
+        "12 installments": [_installment(i) for i in range(12)],
+        "50 contracts": [_contract(i, user_id) for i in range(50)],
+        "1000 contracts": [_contract(i, user_id) for i in range(1000)],
+        "5000 installments": [_installment(i) for i in range(5000)],
+        "2000 tenants": [_tenant(i) for i in range(2000)],
+    }
+
+    print(f"mean of {ROUNDS} rounds")
+    total = {"identity": 0, "gzip": 0, "br": 0}
+    for name, payload in payloads.items():
+        body = bytes(ORJSONResponse(payload).body)
+        line = f"{name:<18}"
+        for encoding in total:
+            size, ms = await _send_through(body, encoding)
+            total[encoding] += size
+            line += f"  {encoding:<8} {size / 1024:8.1f} KB {ms:6.2f} ms"
+        print(line)
+
+    print(
+        f"{'total':<18}"
+        + "".join(
+            f"  {encoding:<8} {size / 1024:8.1f} KB "
+            f"({100 - size * 100 / total['identity']:4.1f}% saved)"
+            for encoding, size in total.items()
+        )
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
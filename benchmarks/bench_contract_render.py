@@ -0,0 +1,86 @@
+"""Contract PDF render time: per-request stylesheet parsing vs the precompiled path.
+
+Run from the project root with ``python -m benchmarks.bench_contract_render``.
+"""
+import time
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from weasyprint import HTML  # type: ignore
+
+from app.rendering.engine import (
+    CONTRACT_STYLESHEET,
+    TEMPLATES_DIR,
+    render_contract_html,
+)
+from app.rendering.renderer import render_html_to_pdf
+
+ROUNDS = 20
+
+
+def _address() -> dict:
+    return dict(
+        rua="Rua das Flores",
+        bairro="Centro",
+        numero=100,
+        cep="72000-000",
+        cidade="Brasília",
+        estado="DF",
+    )
+
+
+def _context() -> dict:
+    person = dict(estado_civil="solteiro", profissao="Engenheiro", **_address())
+    return dict(
+        contract=SimpleNamespace(
+            data_inicio=date(2024, 1, 1),
+            data_fim=date(2025, 1, 1),
+            dia_vencimento=10,
+            valor_base=Decimal("1500.00"),
+            valor_caucao=Decimal("3000.00"),
+            taxa_reajuste="IGPM",
+        ),
+        template=SimpleNamespace(
+            tipo_contrato="residencial",
+            garagem=True,
+            sublocacao=False,
+            animais=True,
+            garantia="fiador",
+        ),
+        owner=SimpleNamespace(nome="Maria Souza", cpf="12345678901", **person),
+        tenant=SimpleNamespace(nome="João Silva", cpf="10987654321", **person),
+        guarantor=SimpleNamespace(nome="Ana Lima", cpf="11122233344", **person),
+        property=SimpleNamespace(**_address()),
+        inspection=None,
+    )
+
+
+def _timed(label: str, fn) -> None:
+    fn()  # warm-up, excluded from the measurement
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    print(f"{label:<45} {elapsed * 1000:8.2f} ms")
+
+
+def main() -> None:
+    context = _context()
+    css = (TEMPLATES_DIR / CONTRACT_STYLESHEET).read_text()
+    html = render_contract_html(**context)
+    inline_html = html.replace("</head>", f"<style>{css}</style></head>")
+
+    _timed("html: jinja template", lambda: render_contract_html(**context))
+    _timed(
+        "pdf: inline css, new font config per call",
+        lambda: HTML(string=inline_html).write_pdf(),
+    )
+    _timed(
+        "pdf: cached CSS + shared FontConfiguration",
+        lambda: render_html_to_pdf(html, CONTRACT_STYLESHEET),
+    )
+
+
+if __name__ == "__main__":
+    main()
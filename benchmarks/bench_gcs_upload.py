@@ -0,0 +1,214 @@
+"""Per-upload latency: a new storage client per upload vs the shared one,
+then a batch of uploads awaited one by one vs ``upload_many``, with the
+worst event loop stall seen while they run, and finally re-uploading a file
+that is already stored.
+
+Uploads go to a local fake of the GCS JSON API and OAuth token endpoints
+(via STORAGE_EMULATOR_HOST and the service account's token_uri), with an
+optional artificial round-trip latency. Run from the project root with
+``python -m benchmarks.bench_gcs_upload [--latency-ms 20]``.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import threading
+import time
+from urllib.parse import unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import rsa  # type: ignore
+
+from app.storage.gcs import get_gcs_storage
+
+ROUNDS = 30
+BATCH = 8
+PAYLOAD_SIZE = 64 * 1024
+_payloads = itertools.count()
+
+
+def _payload() -> bytes:
+    # a new content every time, uploads of the same content are deduplicated
+    return str(next(_payloads)).encode().ljust(PAYLOAD_SIZE, b"x")
+
+
+class FakeGCSHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    requests = 0
+    bytes_received = 0
+    objects: set[str] = set()
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length", 0))
+        FakeGCSHandler.bytes_received += length
+        return self.rfile.read(length)
+
+    def _reply(
+        self, body: dict, location: str | None = None, status: int = 200
+    ) -> None:
+        FakeGCSHandler.requests += 1
+        time.sleep(self.latency)
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        if location is not None:
+            self.send_header("Location", location)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:
+        self._reply({"name": "e-aluguel"})
+
+    def do_POST(self) -> None:
+        body = self._read_body()
+        if self.path.startswith("/token"):
+            self._reply({"access_token": "token", "expires_in": 3600})
+        else:
+            # start of a resumable upload with the object metadata, the data
+            # follows in a PUT
+            FakeGCSHandler.objects.add(json.loads(body)["name"])
+            self._reply({}, location=f"http://{self.headers['Host']}/upload/session")
+
+    def do_PUT(self) -> None:
+        self._read_body()
+        self._reply({"name": "object", "bucket": "e-aluguel"})
+
+    def do_PATCH(self) -> None:
+        # metadata update, how an upload checks the object is already stored
+        self._read_body()
+        name = unquote(self.path.split("/o/", 1)[1].split("?", 1)[0])
+        if name in FakeGCSHandler.objects:
+            self._reply({"name": name, "bucket": "e-aluguel"})
+        else:
+            self._reply({"error": {"code": 404}}, status=404)
+
+
+def _service_account(base_url: str) -> dict:
+    _, private_key = rsa.newkeys(2048)
+    return {
+        "type": "service_account",
+        "project_id": "e-aluguel",
+        "private_key_id": "1",
+        "private_key": private_key.save_pkcs1().decode(),
+        "client_email": "bench@e-aluguel.iam.gserviceaccount.com",
+        "client_id": "1",
+        "token_uri": f"{base_url}/token",
+    }
+
+
+def _client_per_upload(service_account: dict) -> None:
+    # what every upload did before: new client, token, bucket metadata GET
+    from google.cloud import storage  # type: ignore
+
+    client = storage.Client.from_service_account_info(service_account)
+    bucket = client.get_bucket("e-aluguel")
+    bucket.blob("aluguelapp/bench").upload_from_file(
+        BytesIO(_payload()), content_type="image/jpeg"
+    )
+
+
+async def _shared_client(service_account: dict) -> None:
+    await get_gcs_storage(service_account).upload_content(BytesIO(_payload()), "image")
+
+
+DUPLICATE = _payload()
+
+
+async def _duplicate(service_account: dict) -> None:
+    await get_gcs_storage(service_account).upload_content(BytesIO(DUPLICATE), "image")
+
+
+async def _timed(label: str, upload, service_account: dict) -> None:
+    await upload(service_account)  # warm-up, excluded from the measurement
+    FakeGCSHandler.requests = 0
+    FakeGCSHandler.bytes_received = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await upload(service_account)
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    print(
+        f"{label:<22} {elapsed * 1000:8.2f} ms/upload "
+        f"{FakeGCSHandler.requests / ROUNDS:5.1f} requests/upload "
+        f"{FakeGCSHandler.bytes_received / ROUNDS / 1024:6.1f} KB sent/upload"
+    )
+
+
+async def _max_loop_stall(done: asyncio.Event) -> float:
+    worst = 0.0
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        worst = max(worst, time.perf_counter() - start - 0.001)
+    return worst
+
+
+async def _timed_batch(label: str, upload_batch, service_account: dict) -> None:
+    done = asyncio.Event()
+    stall = asyncio.create_task(_max_loop_stall(done))
+    await asyncio.sleep(0)  # let the probe start its first tick
+    start = time.perf_counter()
+    await upload_batch(get_gcs_storage(service_account))
+    elapsed = time.perf_counter() - start
+    done.set()
+    print(
+        f"{label:<22} {elapsed * 1000:8.2f} ms/{BATCH} uploads "
+        f"{await stall * 1000:6.2f} ms worst loop stall"
+    )
+
+
+async def _one_by_one(storage) -> None:
+    for _ in range(BATCH):
+        await storage.upload_content(BytesIO(_payload()), "image")
+
+
+async def _upload_many(storage) -> None:
+    await storage.upload_many([(BytesIO(_payload()), "image") for _ in range(BATCH)])
+
+
+def _blocking(storage) -> None:
+    # the old synchronous call, straight on the event loop
+    for _ in range(BATCH):
+        storage._upload(BytesIO(_payload()), "image")
+
+
+async def _blocking_batch(storage) -> None:
+    _blocking(storage)
+
+
+async def _run(service_account: dict) -> None:
+    async def client_per_upload(service_account: dict) -> None:
+        _client_per_upload(service_account)
+
+    await _timed("client per upload", client_per_upload, service_account)
+    await _timed("shared client", _shared_client, service_account)
+    await _timed_batch("blocking, sequential", _blocking_batch, service_account)
+    await _timed_batch("async, one by one", _one_by_one, service_account)
+    await _timed_batch("async, upload_many", _upload_many, service_account)
+    await _timed("same file again", _duplicate, service_account)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency-ms", type=float, default=0)
+    args = parser.parse_args()
+    FakeGCSHandler.latency = args.latency_ms / 1000
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGCSHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    os.environ["STORAGE_EMULATOR_HOST"] = base_url
+    service_account = _service_account(base_url)
+
+    print(f"simulated round trip: {args.latency_ms:.0f} ms")
+    asyncio.run(_run(service_account))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
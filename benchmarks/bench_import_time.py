@@ -0,0 +1,73 @@
+"""Cold-start import time of ``app.main`` measured with ``python -X importtime``.
+
+Exits non-zero when the median exceeds the budget or when one of the
+rendering/storage libraries that must stay lazy is imported at startup, so
+it can run as a CI check. Run from the project root with
+``python -m benchmarks.bench_import_time [--budget-ms 3000] [--runs 5]``.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+# only imported on first use, see the accessors in app/rendering and app/storage
+DEFERRED_MODULES = (
+    "weasyprint",
+    "reportlab.platypus",
+    "reportlab.lib.styles",
+    "num2words",
+    "google.cloud.storage",
+    "matplotlib",
+    "pandas",
+    "numpy",
+    "PIL.Image",
+)
+TOP_MODULES = 15
+
+
+def _import_times() -> dict[str, int]:
+    """Cumulative import time in microseconds of every module ``app.main`` loads."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=3000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [_import_times() for _ in range(args.runs)]
+    totals = [times["app.main"] / 1000 for times in runs]
+    median = statistics.median(totals)
+
+    last = runs[-1]
+    print(f"slowest of {len(last)} modules (cumulative):")
+    for name, micros in sorted(last.items(), key=lambda item: -item[1])[:TOP_MODULES]:
+        print(f"  {micros / 1000:8.1f} ms  {name}")
+    print(f"app.main median over {args.runs} runs: {median:.0f} ms")
+
+    failed = False
+    leaked = [name for name in DEFERRED_MODULES if name in last]
+    if leaked:
+        print(f"FAIL: imported at startup: {', '.join(leaked)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
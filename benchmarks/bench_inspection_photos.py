@@ -0,0 +1,87 @@
+"""Inspection PDF size and render time: full-resolution photos vs downscaled.
+
+Run from the project root with ``python -m benchmarks.bench_inspection_photos``.
+"""
+import asyncio
+import time
+from datetime import date
+from io import BytesIO
+from types import SimpleNamespace
+
+from fastapi import UploadFile
+from PIL import Image
+
+from app.rendering.inspection import (
+    ALTURA_FOTO,
+    LARGURA_FOTO,
+    create_inspection_pdf,
+)
+from app.rendering.photos import prepare_photos
+from app.schemas.requests import InspectionCreateRequest
+
+PHOTOS = 12
+CAMERA_SIZE = (4032, 3024)
+
+
+def _camera_photo() -> bytes:
+    # noise compresses about as badly as a real photo does
+    image = Image.effect_noise(CAMERA_SIZE, 64).convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def _person() -> SimpleNamespace:
+    return SimpleNamespace(
+        nome="Maria Souza",
+        cpf="12345678901",
+        email="maria@example.com",
+        estado_civil="solteira",
+        profissao="Engenheira",
+        rua="Rua das Flores",
+        numero=100,
+        bairro="Centro",
+        cep="72000-000",
+        cidade="Brasília",
+        estado="DF",
+    )
+
+
+def _build(photos: list[bytes]) -> tuple[float, int]:
+    start = time.perf_counter()
+    pdf = create_inspection_pdf(
+        InspectionCreateRequest(data_vistoria=date(2024, 1, 1)),
+        _person(),  # type: ignore
+        _person(),  # type: ignore
+        _person(),  # type: ignore
+        photos,
+    )
+    return time.perf_counter() - start, len(pdf)
+
+
+async def _prepare(raw: list[bytes]) -> tuple[float, list[bytes]]:
+    uploads = [UploadFile(file=BytesIO(photo)) for photo in raw]
+    start = time.perf_counter()
+    prepared = await prepare_photos(uploads, LARGURA_FOTO, ALTURA_FOTO)
+    return time.perf_counter() - start, prepared
+
+
+def main() -> None:
+    # distinct photos: ReportLab embeds identical image data only once
+    raw = [_camera_photo() for _ in range(PHOTOS)]
+
+    raw_time, raw_size = _build(raw)
+    prepare_time, prepared = asyncio.run(_prepare(raw))
+    prepared_time, prepared_size = _build(prepared)
+
+    print(f"{PHOTOS} photos of {CAMERA_SIZE[0]}x{CAMERA_SIZE[1]}")
+    print(f"{'full resolution':<30} {raw_time * 1000:8.0f} ms {raw_size / 1e6:8.2f} MB")
+    print(
+        f"{'downscaled (prepare + build)':<30} "
+        f"{(prepare_time + prepared_time) * 1000:8.0f} ms "
+        f"{prepared_size / 1e6:8.2f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
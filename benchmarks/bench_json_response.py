@@ -0,0 +1,126 @@
+"""Response encoding time and size: stdlib ``JSONResponse`` vs ``ORJSONResponse``.
+
+Each payload is encoded twice over: as routes with a ``response_model``
+hand it to the response class, already JSON-ready, and as raw content with
+dates, Decimals and UUIDs, which the stdlib path first runs through
+``jsonable_encoder``. Run from the project root with
+``python -m benchmarks.bench_json_response``.
+"""
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.schemas.responses import ORJSONResponse
+
+ROUNDS = 20
+
+
+def _tenant(i: int) -> dict[str, Any]:
+    return {
+        "id": i,
+        "cpf": f"{i:011d}",
+        "contact": "61999999999",
+        "email": f"inquilino{i}@example.com",
+        "name": f"Inquilino {i} da Conceição",
+        "profession": "Professor",
+        "marital_status": "Solteiro",
+        "birth_date": date(1990, 1, 1) + timedelta(days=i),
+        "emergency_contact": "61988888888",
+        "income": Decimal("3500.00"),
+        "residents": 3,
+        "street": "Rua das Flores",
+        "neighborhood": "Centro",
+        "number": 100,
+        "zip_code": "72000-000",
+        "city": "Brasília",
+        "state": "DF",
+    }
+
+
+def _contract(i: int, user_id: str) -> dict[str, Any]:
+    return {
+        "id": i,
+        "deposit_value": Decimal("2000.00"),
+        "start_date": date(2024, 1, 1),
+        "end_date": date(2025, 1, 1),
+        "base_value": Decimal("1000.00"),
+        "due_date": 10,
+        "reajustment_rate": "IGPM",
+        "signed_pdf": None,
+        "house_id": i,
+        "template_id": 1,
+        "tenant_id": i,
+        "user_id": user_id,
+        "house": {
+            "id": i,
+            "property_id": i // 10,
+            "photo": None,
+            "photo_variants": None,
+            "nickname": f"Casa {i}",
+            "room_count": 4,
+            "bathrooms": 2,
+            "furnished": True,
+            "status": "alugada",
+        },
+        "tenant": _tenant(i),
+    }
+
+
+def _installment(i: int) -> dict[str, Any]:
+    return {
+        "id": i,
+        "installment_value": Decimal("1000.00"),
+        "fg_paid": i % 3 == 0,
+        "payment_type": "None",
+        "due_date": date(2024, 1, 10) + timedelta(days=30 * i),
+        "payment_date": None,
+        "contract_id": 1,
+    }
+
+
+def _timed(encode: Callable[[], bytes]) -> tuple[float, int]:
+    size = len(encode())
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        encode()
+    return (time.perf_counter() - start) / ROUNDS * 1000, size
+
+
+def main() -> None:
+    user_id = str(uuid4())
+    payloads = {
+        "1000 contracts": [_contract(i, user_id) for i in range(1000)],
+        "5000 installments": [_installment(i) for i in range(5000)],
+        "2000 tenants": [_tenant(i) for i in range(2000)],
+    }
+
+    print(f"mean of {ROUNDS} rounds")
+    for name, raw in payloads.items():
+        ready = jsonable_encoder(raw)
+        cases = {
+            "JSON-ready": (
+                lambda: bytes(JSONResponse(ready).body),
+                lambda: bytes(ORJSONResponse(ready).body),
+            ),
+            "raw": (
+                lambda: bytes(JSONResponse(jsonable_encoder(raw)).body),
+                lambda: bytes(ORJSONResponse(raw).body),
+            ),
+        }
+        for kind, (with_json, with_orjson) in cases.items():
+            stdlib_ms, stdlib_size = _timed(with_json)
+            orjson_ms, orjson_size = _timed(with_orjson)
+            print(
+                f"{name:<18} {kind:<10} json {stdlib_ms:7.2f} ms "
+                f"{stdlib_size / 1024:7.1f} KB   orjson {orjson_ms:7.2f} ms "
+                f"{orjson_size / 1024:7.1f} KB   {stdlib_ms / orjson_ms:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
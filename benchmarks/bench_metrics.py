@@ -0,0 +1,63 @@
+"""Per-request cost of ``MetricsMiddleware``.
+
+Sends requests through a bare ASGI app with and without the middleware and
+reports the mean time per request, plus the time to render ``/metrics``
+once every route has been seen. Run from the project root with
+``python -m benchmarks.bench_metrics``.
+"""
+import asyncio
+import time
+
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core import metrics
+from app.core.metrics import MetricsMiddleware, render_metrics
+
+REQUESTS = 50_000
+ROUTES = 60
+
+
+class _Route:
+    def __init__(self, path: str):
+        self.path = path
+
+
+async def _app(scope: Scope, receive: Receive, send: Send) -> None:
+    scope["route"] = scope["_route"]
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}" * 100})
+
+
+async def _send(message: Message) -> None:
+    pass
+
+
+async def _run(app) -> float:  # type: ignore[no-untyped-def]
+    routes = [_Route(f"/route/{i}/{{item_id}}") for i in range(ROUTES)]
+    scope = {"type": "http", "method": "GET", "_route": routes[0]}
+    start = time.perf_counter()
+    for i in range(REQUESTS):
+        scope["_route"] = routes[i % ROUTES]
+        await app(scope, None, _send)
+        # one statement per request, as the SQLAlchemy hooks would count it
+        metrics._after_cursor_execute(None, None, "", None, None, False)
+    return (time.perf_counter() - start) / REQUESTS * 1_000_000
+
+
+async def _main() -> None:
+    bare = await _run(_app)
+    measured = await _run(MetricsMiddleware(_app))
+    print(f"{REQUESTS} requests over {ROUTES} routes")
+    print(f"bare app          {bare:6.2f} us/request")
+    print(f"with metrics      {measured:6.2f} us/request (+{measured - bare:.2f} us)")
+
+    start = time.perf_counter()
+    text = render_metrics()
+    print(
+        f"render /metrics   {(time.perf_counter() - start) * 1000:6.2f} ms, "
+        f"{len(text) / 1024:.0f} KB"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,62 @@
+"""Bytes a client downloads per photo, and the upload-time cost of variants.
+
+Uploads a camera-sized photo to the in-memory storage backend, once as the
+raw file and once through ``upload_photo``. Run from the project root with
+``python -m benchmarks.bench_photo_variants``.
+"""
+import asyncio
+import os
+import time
+from io import BytesIO
+
+from fastapi import UploadFile
+from PIL import Image
+
+os.environ.setdefault("STORAGE__BACKEND", "memory")
+
+from app.storage.backend import get_storage  # noqa: E402
+from app.storage.memory import MemoryStorage  # noqa: E402
+
+CAMERA_SIZE = (4032, 3024)
+ROUNDS = 5
+
+
+def _camera_photo() -> bytes:
+    # a smooth gradient under light noise, closer to a real photo than pure noise
+    gradient = Image.linear_gradient("L").resize(CAMERA_SIZE).convert("RGB")
+    noise = Image.effect_noise(CAMERA_SIZE, 12).convert("RGB")
+    image = Image.blend(gradient, noise, 0.25)
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+async def _main() -> None:
+    photo = _camera_photo()
+    storage = await get_storage()
+    assert isinstance(storage, MemoryStorage)
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await storage.upload_file(UploadFile(file=BytesIO(photo)), "image")
+    raw_ms = (time.perf_counter() - start) / ROUNDS * 1000
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        urls = await storage.upload_photo(UploadFile(file=BytesIO(photo)))
+    variants_ms = (time.perf_counter() - start) / ROUNDS * 1000
+
+    print(f"camera photo {CAMERA_SIZE[0]}x{CAMERA_SIZE[1]}: {len(photo) / 1024:8.1f} KB")
+    print(f"upload raw file      {raw_ms:8.1f} ms")
+    print(f"upload with variants {variants_ms:8.1f} ms")
+    prefix = len(storage.public_url)
+    for name, formats in urls.items():
+        sizes = "  ".join(
+            f"{format} {len(storage.files[url[prefix:]][0]) / 1024:8.1f} KB"
+            for format, url in formats.items()
+        )
+        print(f"  {name:<10} {sizes}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
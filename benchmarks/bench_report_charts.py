@@ -0,0 +1,111 @@
+"""Report chart cost: the former Matplotlib PNG charts vs the built-in SVG charts.
+
+Each variant runs in a fresh interpreter so import time and peak RSS are
+measured from a cold start. Run from the project root with
+``python -m benchmarks.bench_report_charts``.
+"""
+import json
+import resource
+import subprocess
+import sys
+import time
+
+ROUNDS = 50
+LABELS = ("manutenção", "reparo", "imposto")
+VALUES = (1200.0, 850.5, 430.0)
+STATUSES = ("alugada", "disponivel", "reforma")
+COUNTS = (7, 2, 1)
+MONTHS = tuple(range(1, 13))
+INCOMES = tuple(3000.0 + 100 * month for month in MONTHS)
+EXPENSES = tuple(400.0 + 35 * month for month in MONTHS)
+
+
+def _matplotlib() -> tuple[float, object]:
+    start = time.perf_counter()
+    from base64 import b64encode
+    from io import BytesIO
+
+    from matplotlib.figure import Figure
+
+    import_time = time.perf_counter() - start
+
+    def to_data_uri(figure: Figure) -> str:
+        buffer = BytesIO()
+        figure.savefig(buffer, format="png")
+        return "data:image/png;base64," + b64encode(buffer.getvalue()).decode()
+
+    def render() -> list[str]:
+        pie = Figure(figsize=(10, 6))
+        pie.subplots().pie(VALUES, labels=LABELS, autopct="%1.1f%%")
+        bars = Figure(figsize=(7, 2.5))
+        bars.subplots().bar(STATUSES, COUNTS, color=["green", "red", "orange"])
+        grouped = Figure(figsize=(10, 6))
+        ax = grouped.subplots()
+        ax.bar([m - 0.175 for m in MONTHS], INCOMES, 0.35, label="Receita")
+        ax.bar([m + 0.175 for m in MONTHS], EXPENSES, 0.35, label="Despesa")
+        ax.legend()
+        return [to_data_uri(figure) for figure in (pie, bars, grouped)]
+
+    return import_time, render
+
+
+def _svg() -> tuple[float, object]:
+    start = time.perf_counter()
+    from app.rendering import charts
+
+    import_time = time.perf_counter() - start
+
+    def render() -> list[str]:
+        # call the undecorated functions so the cache does not hide the cost
+        return [
+            charts.expenses_by_type_chart.__wrapped__(LABELS, VALUES),
+            charts.occupancy_chart.__wrapped__(STATUSES, COUNTS),
+            charts.income_expense_chart.__wrapped__(MONTHS, INCOMES, EXPENSES),
+        ]
+
+    return import_time, render
+
+
+def _run_variant(name: str) -> None:
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    import_time, render = {"matplotlib": _matplotlib, "svg": _svg}[name]()
+    output = render()  # type: ignore
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        render()  # type: ignore
+    render_time = (time.perf_counter() - start) / ROUNDS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        json.dumps(
+            {
+                "import_ms": import_time * 1000,
+                "render_ms": render_time * 1000,
+                "rss_mb": (peak_rss - baseline_rss) / 1024,
+                "output_kb": sum(len(chart) for chart in output) / 1024,
+            }
+        )
+    )
+
+
+def main() -> None:
+    print(f"{'':<12} {'import':>10} {'3 charts':>10} {'+RSS':>9} {'output':>9}")
+    for name in ("matplotlib", "svg"):
+        result = json.loads(
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_report_charts", name],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        print(
+            f"{name:<12} {result['import_ms']:>8.0f}ms {result['render_ms']:>8.2f}ms "
+            f"{result['rss_mb']:>7.1f}MB {result['output_kb']:>7.1f}KB"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        _run_variant(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,194 @@
+"""List response time: field-by-field mapping plus FastAPI's second validation
+vs a single validation pass through the precompiled list adapters.
+
+The old path maps each row by hand into a response model, as the mappers
+did before, and then goes through ``fastapi.routing.serialize_response`` and
+``JSONResponse`` the way a route returning a list of models does. The new
+path is ``map_list_to_response``. Run from the project root with
+``python -m benchmarks.bench_response_mapping``.
+"""
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import TypeAdapter
+
+from app.models.models import Houses, PaymentInstallment, Tenant
+from app.schemas.map_responses import (
+    HOUSE_LIST,
+    PAYMENT_INSTALLMENT_LIST,
+    TENANT_LIST,
+    map_list_to_response,
+)
+from app.schemas.responses import (
+    HouseResponse,
+    PaymentInstallmentResponse,
+    TenantResponse,
+)
+
+ROWS = 10_000
+ROUNDS = 5
+
+
+def _houses() -> list[Houses]:
+    return [
+        Houses(
+            id=i,
+            propriedade_id=i // 10,
+            foto=None,
+            foto_variantes=None,
+            apelido=f"Casa {i}",
+            qtd_comodos=4,
+            banheiros=2,
+            mobiliada=i % 2 == 0,
+            status="alugada",
+        )
+        for i in range(ROWS)
+    ]
+
+
+def _tenants() -> list[Tenant]:
+    return [
+        Tenant(
+            id=i,
+            cpf=f"{i:011d}",
+            contato="61999999999",
+            email=f"inquilino{i}@example.com",
+            nome=f"Inquilino {i}",
+            profissao="Professor",
+            estado_civil="Solteiro",
+            data_nascimento=date(1990, 1, 1),
+            contato_emergencia="61988888888",
+            renda=Decimal("3500.00"),
+            num_residentes=3,
+            rua="Rua das Flores",
+            bairro="Centro",
+            numero=100,
+            cep="72000-000",
+            cidade="Brasília",
+            estado="DF",
+        )
+        for i in range(ROWS)
+    ]
+
+
+def _installments() -> list[PaymentInstallment]:
+    return [
+        PaymentInstallment(
+            id=i,
+            valor_parcela=Decimal("1000.00"),
+            fg_pago=i % 3 == 0,
+            tipo_pagamento="dinheiro" if i % 3 == 0 else None,
+            data_vencimento=date(2024, 1, 10) + timedelta(days=30 * (i % 12)),
+            data_pagamento=None,
+            contrato_id=i // 12,
+        )
+        for i in range(ROWS)
+    ]
+
+
+def _old_house(house: Houses) -> HouseResponse:
+    return HouseResponse(
+        id=house.id,
+        property_id=house.propriedade_id,
+        photo=house.foto,
+        photo_variants=None,
+        nickname=house.apelido,
+        room_count=house.qtd_comodos,
+        bathrooms=house.banheiros,
+        furnished=house.mobiliada,
+        status=str(house.status),
+    )
+
+
+def _old_tenant(tenant: Tenant) -> TenantResponse:
+    return TenantResponse(
+        id=tenant.id,
+        cpf=tenant.cpf,
+        contact=tenant.contato,
+        email=tenant.email,
+        name=tenant.nome,
+        profession=tenant.profissao,
+        marital_status=tenant.estado_civil,
+        birth_date=tenant.data_nascimento,
+        emergency_contact=tenant.contato_emergencia,
+        income=tenant.renda,
+        residents=tenant.num_residentes,
+        street=tenant.rua,
+        neighborhood=tenant.bairro,
+        number=tenant.numero,
+        zip_code=tenant.cep,
+        city=tenant.cidade,
+        state=tenant.estado,
+    )
+
+
+def _old_installment(parcela: PaymentInstallment) -> PaymentInstallmentResponse:
+    return PaymentInstallmentResponse(
+        id=parcela.id,
+        installment_value=parcela.valor_parcela,
+        fg_paid=parcela.fg_pago,
+        payment_type=str(parcela.tipo_pagamento),
+        due_date=parcela.data_vencimento,
+        payment_date=parcela.data_pagamento,
+        contract_id=parcela.contrato_id,
+    )
+
+
+async def _old_path(
+    response_model: Any, mapper: Callable[[Any], Any], rows: list
+) -> bytes:
+    field = create_response_field(name="response", type_=response_model)
+    content = await serialize_response(
+        field=field, response_content=[mapper(row) for row in rows]
+    )
+    return JSONResponse(content).body
+
+
+def _timed(run: Callable[[], bytes]) -> tuple[float, bytes]:
+    body = run()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        run()
+    return (time.perf_counter() - start) / ROUNDS * 1000, body
+
+
+def main() -> None:
+    cases: list[tuple[str, Any, Callable[[Any], Any], TypeAdapter, list]] = [
+        ("houses", list[HouseResponse], _old_house, HOUSE_LIST, _houses()),
+        ("tenants", list[TenantResponse], _old_tenant, TENANT_LIST, _tenants()),
+        (
+            "installments",
+            list[PaymentInstallmentResponse],
+            _old_installment,
+            PAYMENT_INSTALLMENT_LIST,
+            _installments(),
+        ),
+    ]
+
+    loop = asyncio.new_event_loop()
+    print(f"{ROWS} rows, mean of {ROUNDS} rounds")
+    for name, response_model, mapper, adapter, rows in cases:
+        old_ms, old_body = _timed(
+            lambda: loop.run_until_complete(_old_path(response_model, mapper, rows))
+        )
+        new_ms, new_body = _timed(
+            lambda: bytes(map_list_to_response(adapter, rows).body)
+        )
+        same = json.loads(old_body) == json.loads(new_body)
+        print(
+            f"{name:<13} mapper + revalidation {old_ms:7.1f} ms   "
+            f"single pass {new_ms:7.1f} ms   {old_ms / new_ms:4.1f}x   "
+            f"same JSON: {same}"
+        )
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()